@@ -19,6 +19,7 @@ from src.modules.content_area import ContentArea
 from src.modules.hover_behavior import HoverableButton, HoverBehavior
 from src.modules.configuration import Configuration
 from src.data_manager import DataManager, set_data_manager, get_data_manager
+from src.modules.chart_renderer import shutdown_render_pool
 
 from ctypes import windll, Structure, c_int, byref
 
@@ -44,8 +45,8 @@ def initialize_app(base_dir, is_prod):
     data_manager = DataManager(base_dir, is_prod)
     set_data_manager(data_manager)
     
-    # Load profiles or create default if none exist
-    profiles = data_manager.get_profiles()
+    # List profiles from the manifest or create default if none exist
+    profiles = data_manager.list_profiles()
     
     config = get_data_manager().config
     
@@ -54,18 +55,14 @@ def initialize_app(base_dir, is_prod):
         data_manager.load_profile(default_file)
     else:
         default_profile_id = config.get_default_profile()
-        profile_to_load = None
-        
-        for profile in profiles:
-            if profile.id == default_profile_id:
-                profile_to_load = profile
-                break
+        profile_to_load = data_manager.manifest.get(default_profile_id)
         
         if not profile_to_load:
             profile_to_load = profiles[0]
             config.set_default_profile(profile_to_load.id)
 
-        data_manager.load_profile(os.path.join(data_manager.data_dir, f"{profile_to_load.id}.dat"))
+        # Only the active profile is deserialized
+        data_manager.load_profile(data_manager.get_profile_path(profile_to_load.id))
         
     # Pass the data manager to the app
     app = BudgetTrackerApp(is_prod=is_prod)
@@ -80,7 +77,6 @@ class BudgetTrackerApp(App):
     """
     def __init__(self, is_prod=False, **kwargs):
         super().__init__(**kwargs)
-        self.content_area = ContentArea()
         self.is_prod = is_prod
         self.background_toggle = False
         self.window_state = {
@@ -175,6 +171,7 @@ class BudgetTrackerApp(App):
 
         # Switch screens only if the target screen is different
         if sm.current != screen_name:
+            sm.load_screen(screen_name)  # Screens are built on first navigation
             sm.current = screen_name
 
 
@@ -212,8 +209,14 @@ class BudgetTrackerApp(App):
 
     def close_window(self):
         """Close the application window."""
+        get_data_manager().flush()
         self.stop()
 
+    def on_stop(self):
+        """Make sure profile data is fully written before exiting."""
+        shutdown_render_pool()
+        get_data_manager().close()
+
     @staticmethod
     def enable_shadow(hwnd):
         """Enable a shadow effect for the window."""
@@ -2,8 +2,36 @@ from collections import namedtuple
 
 default_income = 5000
 
+# Profile storage format: "pickle" rewrites the whole file, "journal" appends changes,
+# "columnar" keeps budget rows in typed NumPy columns, "sqlite" uses an embedded database
+default_storage_mode = "journal"
+
+# Dashboard chart renderer: "matplotlib" rasterizes figures through Agg, "kivy" draws them
+# natively with canvas instructions and never imports matplotlib
+chart_backend = "matplotlib"
+
+# Worker threads that rasterize matplotlib charts off the UI thread
+chart_render_workers = 2
+
+# Memory budget for rendered chart textures kept for reuse across widgets, resizes and screens
+chart_texture_cache_bytes = 64 * 1024 * 1024
+
+# Seconds a chart's size must stay unchanged before it is rendered at the new size
+chart_resize_settle = 0.15
+
+# Text measurements (and ellipsized strings) kept for label sizing and truncation
+text_metrics_cache_size = 4096
+
+# Seconds of quiet after an edit before the profile is written to disk
+default_save_debounce = 0.5
+
+# Version of the profile dictionary layout written by `Profile.to_dict`
+profile_schema_version = 1
+
 Expense = namedtuple("Expense", ["name", "weight"])
 Category = namedtuple("Category", ["name", "color", "expenses", "weight"])
+Transaction = namedtuple("Transaction", ["date", "amount", "expense", "category"])
+ExpenseTemplate = namedtuple("ExpenseTemplate", ["name", "weight", "condition"])
 
 default_categories = [
     Category(
@@ -164,3 +192,41 @@ default_categories = [
         weight=0.05,  # 5-10%
     ),
 ]
+
+# Expenses generated for a new budget, as shares of their category's allocation.
+# `condition` limits an expense to home owners ("home_owner"), renters ("renter"),
+# vehicle owners ("vehicle_owner") or everyone else ("no_vehicle"); None applies to all.
+default_expense_templates = {
+    "Housing & Utilities": [
+        ExpenseTemplate("Mortgage", 0.5, "home_owner"),
+        ExpenseTemplate("Property Taxes", 0.2, "home_owner"),
+        ExpenseTemplate("Homeowners Insurance", 0.1, "home_owner"),
+        ExpenseTemplate("Home Maintenance & Repairs", 0.2, "home_owner"),
+        ExpenseTemplate("Rent", 0.7, "renter"),
+        ExpenseTemplate("Renter’s Insurance", 0.1, "renter"),
+        # Everyone Pays Utilities
+        ExpenseTemplate("Electricity", 0.05, None),
+        ExpenseTemplate("Internet", 0.05, None),
+        ExpenseTemplate("Cell Phone", 0.05, None),
+    ],
+    "Transportation": [
+        ExpenseTemplate("Car Payment", 0.5, "vehicle_owner"),
+        ExpenseTemplate("Car Insurance", 0.2, "vehicle_owner"),
+        ExpenseTemplate("Gas", 0.3, "vehicle_owner"),
+        ExpenseTemplate("Public Transportation", 0.8, "no_vehicle"),
+        ExpenseTemplate("Ride-Sharing", 0.2, "no_vehicle"),
+    ],
+    "Debt & Financial Obligations": [
+        ExpenseTemplate("Student Loan Payments", 1.0, None),
+    ],
+    "Savings & Investments": [
+        ExpenseTemplate("Emergency Fund", 0.5, None),
+        ExpenseTemplate("Retirement Contributions", 0.5, None),
+    ],
+    "Shopping & Miscellaneous": [
+        ExpenseTemplate("Clothing", 0.4, None),
+        ExpenseTemplate("Shoes", 0.2, None),
+        ExpenseTemplate("Beauty & Cosmetics", 0.2, None),
+        ExpenseTemplate("Tech & Gadgets", 0.2, None),
+    ],
+}
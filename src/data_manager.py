@@ -1,12 +1,23 @@
 import os
-import pickle
 import logging
 import random
+import threading
+from kivy.clock import Clock
 from kivy.event import EventDispatcher
 from kivy.properties import ObjectProperty
 from src.modules.profile import Profile
 from src.modules.budget import Budget
 from src.modules.configuration import Configuration
+from src.modules.profile_store import PickleProfileStore, JournaledProfileStore
+from src.modules.columnar_budget import ColumnarProfileStore
+from src.modules.profile_manifest import ProfileManifest, ProfileEntry
+from src.modules.write_behind_saver import WriteBehindSaver
+from src.modules.sqlite_store import SQLiteProfileStore
+from src.modules.statement_importer import StatementImporter
+from src.modules.profile_changes import (
+    ProfileRenamed, IncomeChanged, ExpenseCostChanged, ExpenseRenamed, CategoryRenamed
+)
+from src.constants import default_storage_mode, default_save_debounce, profile_schema_version
 
 data_manager_instance = None
 
@@ -21,32 +32,64 @@ def get_data_manager():
 
 class DataManager(EventDispatcher):
     _instance = None
-    __events__ = ["on_profile_update"]
+    # `on_profile_update` follows every profile change; the typed events before it carry what changed
+    __events__ = [
+        "on_profile_update", "on_profile_saved", "on_profile_save_failed", "on_ledger_update",
+        "on_profile_renamed", "on_income_changed", "on_expense_cost_changed",
+        "on_expense_renamed", "on_category_renamed",
+    ]
     
     budget_data = ObjectProperty()
+
+    # Available on-disk formats for profile data
+    storage_backends = {
+        "pickle": PickleProfileStore,
+        "journal": JournaledProfileStore,
+        "columnar": ColumnarProfileStore,
+        "sqlite": SQLiteProfileStore,
+    }
     
-    def __new__(cls, base_dir, is_prod):
+    def __new__(cls, base_dir, is_prod, storage_mode=default_storage_mode, save_debounce=default_save_debounce):
         """Ensure only one instance of DataManager exists."""
         if cls._instance is None:
             cls._instance = super(DataManager, cls).__new__(cls)
-            cls._instance.__init__(base_dir, is_prod)
+            cls._instance.__init__(base_dir, is_prod, storage_mode, save_debounce)
         return cls._instance
 
-    def __init__(self, base_dir, is_prod):
+    def __init__(self, base_dir, is_prod, storage_mode=default_storage_mode, save_debounce=default_save_debounce):
+        if getattr(self, "_initialized", False):  # Already set up by `__new__`
+            return
+        self._initialized = True
+
         self.category_colors = {}
         self.base_dir = base_dir
         self.data_dir = os.path.join(base_dir, "data")
         os.makedirs(self.data_dir, exist_ok=True)
         self.file_path = None
         
+        if storage_mode not in self.storage_backends:
+            raise ValueError(f"Unknown storage mode: {storage_mode}")
+        self.storage_mode = storage_mode
+        self.store = self.storage_backends[storage_mode].open(self.data_dir)
+        self.store_lock = threading.RLock()  # The store and manifest are used by the saver's worker and the main thread
+        self.saver = WriteBehindSaver(
+            self.save_data,
+            on_saved=lambda file_path: self.dispatch("on_profile_saved", file_path),
+            on_failed=lambda file_path, error: self.dispatch("on_profile_save_failed", file_path, error),
+            debounce=save_debounce
+        )
+
         self.config = Configuration(self.data_dir)
+        self.manifest = ProfileManifest(self.data_dir)
+        self.manifest.sync(self.get_profile_ids(), self.read_profile_entry, self.get_profile_path)
         self.active_profile = None
+        self.ledger = None
         
 
     def create_new_profile(self, profile_name=None, income=0.0):
         """Create a new profile with a default budget."""
         profile = Profile(name=profile_name or "Default Profile", income=income)
-        file_path = os.path.join(self.data_dir, f"{profile.id}.dat")
+        file_path = self.get_profile_path(profile.id)
         self.save_data(file_path, profile.to_dict())
         
         if self.config.get_default_profile() is None:
@@ -57,9 +100,13 @@ class DataManager(EventDispatcher):
 
     def save_data(self, file_path, data):
         try:
-            with open(file_path, "wb") as file:
-                pickle.dump(data, file)
-                logging.info(f"Data saved to {file_path}")
+            with self.store_lock:
+                self.store.save(file_path, data)
+                self.manifest.update(
+                    data["profile_id"], data["profile_name"], file_path,
+                    data.get("schema_version", profile_schema_version)
+                )
+            logging.info(f"Data saved to {file_path}")
         except Exception as e:
             logging.error(f"Failed to save data to {file_path}: {e}")
             raise
@@ -67,11 +114,11 @@ class DataManager(EventDispatcher):
     def load_data(self, file_path):
         """Load profile data from file and return a `Profile` instance."""
         try:
-            with open(file_path, "rb") as file:
-                profile_data = pickle.load(file)
-                profile = Profile.from_dict(profile_data)
-                logging.info(f"Data loaded from {file_path}")
-                return profile
+            with self.store_lock:
+                profile_data = self.store.load(file_path)
+            profile = Profile.from_dict(profile_data)
+            logging.info(f"Data loaded from {file_path}")
+            return profile
         except Exception as e:
             logging.error(f"Failed to load data from {file_path}: {e}")
             raise
@@ -80,30 +127,74 @@ class DataManager(EventDispatcher):
         """
         Load the profile from a file and set it as active.
         """
+        self.saver.flush()  # Don't read a file that still has a write queued
         self.active_profile = self.load_data(file_path)
+        with self.store_lock:
+            self.ledger = self.store.open_ledger(self.active_profile.id, self.get_ledger_path(self.active_profile.id))
 
         if self.config.get_default_profile() is None:
             self.config.set_default_profile(self.active_profile.id)
 
     def get_profiles(self):
         """
-        Return a list of available profiles in the data directory.
+        Return a list of available profiles in the data directory, fully loaded.
+        Prefer `list_profiles` when only IDs and names are needed.
         """
         profiles = []
-        for file in os.listdir(self.data_dir):
-            file_path = os.path.join(self.data_dir, file)
-
-            if file == Configuration.CONFIG_FILE or not file.endswith(".dat"):
-                continue
-
+        for profile_id in self.get_profile_ids():
             try:
-                profile = self.load_data(file_path)
+                profile = self.load_data(self.get_profile_path(profile_id))
                 profiles.append(profile)
             except Exception:
-                logging.warning(f"Skipping corrupted or invalid file: {file}")
+                logging.warning(f"Skipping corrupted or invalid file: {profile_id}.dat")
 
         return profiles
 
+    def list_profiles(self):
+        """
+        Return a `ProfileEntry` for every available profile, read from the manifest.
+        """
+        with self.store_lock:
+            return self.manifest.list_entries()
+
+    def get_profile_ids(self):
+        """Return the IDs of the profile files in the data directory without reading them."""
+        reserved_files = (Configuration.CONFIG_FILE, ProfileManifest.MANIFEST_FILE)
+        with self.store_lock:
+            return self.store.list_profile_ids(self.data_dir, reserved_files)
+
+    def get_profile_path(self, profile_id):
+        """Return the data file path for a profile ID."""
+        return os.path.join(self.data_dir, f"{profile_id}.dat")
+
+    def get_ledger_path(self, profile_id):
+        """Return the transaction ledger path for a profile ID."""
+        return os.path.join(self.data_dir, f"{profile_id}.ledger")
+
+    def read_profile_entry(self, profile_id):
+        """Read a profile file once to build its manifest entry."""
+        file_path = self.get_profile_path(profile_id)
+        try:
+            with self.store_lock:
+                profile_data = self.store.load(file_path)
+        except Exception:
+            logging.warning(f"Skipping corrupted or invalid file: {profile_id}.dat")
+            return None
+
+        try:
+            stat = os.stat(file_path)
+            mtime, size = stat.st_mtime, stat.st_size
+        except OSError:  # Stored outside the data directory (e.g. in the SQLite database)
+            mtime, size = None, None
+
+        return ProfileEntry(
+            profile_id,
+            profile_data.get("profile_name", "Default Profile"),
+            mtime,
+            size,
+            profile_data.get("schema_version", 1),  # Files written before versioning
+        )
+
     def set_active_profile(self, file_path):
         """
         Set the active profile by loading the corresponding .dat file.
@@ -117,15 +208,132 @@ class DataManager(EventDispatcher):
             raise ValueError("No active profile set.")
         return self.active_profile
     
-    def update_profile(self):
-        """Save the entire active profile to its data file."""
+    def get_ledger(self):
+        """Return the transaction `Ledger` of the active profile."""
+        if self.ledger is None:
+            logging.error("No active profile set.")
+            raise ValueError("No active profile set.")
+        return self.ledger
+
+    def add_transactions(self, transactions):
+        """Append transactions to the active profile's ledger and notify listeners."""
+        self.get_ledger().add_transactions(transactions)
+        self.dispatch("on_ledger_update")
+
+    def import_statement(self, file_path, on_progress=None, on_complete=None, expenses_negative=None):
+        """
+        Import a bank or credit card CSV into the active ledger on a background thread.
+        `on_progress(rows, fraction)` and `on_complete(rows, error)` are called on the main thread.
+        `expenses_negative` says whether spending is negative in the file; `None` detects it.
+        """
+        importer = StatementImporter(
+            self.get_ledger(), self.get_active_profile().get_budget().categories, expenses_negative=expenses_negative
+        )
+
+        def report_progress(rows, fraction):
+            if on_progress:
+                Clock.schedule_once(lambda dt: on_progress(rows, fraction))
+
+        def finish(rows, error):
+            self.dispatch("on_ledger_update")
+            if on_complete:
+                on_complete(rows, error)
+
+        def run_import():
+            rows, error = 0, None
+            try:
+                rows = importer.import_file(file_path, on_progress=report_progress)
+            except Exception as e:
+                logging.error(f"Failed to import statement {file_path}: {e}")
+                error = e
+            Clock.schedule_once(lambda dt: finish(rows, error))
+
+        threading.Thread(target=run_import, daemon=True).start()
+
+    def update_profile(self, event=None, change=None):
+        """
+        Queue a save of the active profile; bursts of edits are written once, off the main thread.
+        The typed `event` is dispatched with its `change` payload before `on_profile_update`.
+        """
         if not self.active_profile:
             raise ValueError("No active profile loaded.")
 
-        file_path = os.path.join(self.data_dir, f"{self.active_profile.id}.dat")
-        self.save_data(file_path, self.active_profile.to_dict())  # ✅ Save full profile
+        file_path = self.get_profile_path(self.active_profile.id)
+        self.saver.schedule(file_path, self.active_profile.to_dict)
 
+        if event:
+            self.dispatch(event, change)
         self.dispatch("on_profile_update")
-        logging.info(f"Profile '{self.active_profile.name}' updated and saved.")
+        logging.info(f"Profile '{self.active_profile.name}' updated, save queued.")
+
+    def set_profile_name(self, name):
+        profile = self.get_active_profile()
+        change = ProfileRenamed(profile.name, name)
+        profile.name = name
+        self.update_profile("on_profile_renamed", change)
+
+    def set_income(self, income):
+        profile = self.get_active_profile()
+        change = IncomeChanged(profile.income, income)
+        profile.income = income
+        self.update_profile("on_income_changed", change)
+
+    def set_expense_cost(self, row, cost):
+        """Change the cost of a budget row."""
+        budget = self.get_active_profile().get_budget()
+        change = ExpenseCostChanged(row, float(budget.costs[row]), cost, budget.get_row_category(row))
+        budget.set_cost(row, cost)
+        self.update_profile("on_expense_cost_changed", change)
+
+    def set_expense_name(self, row, name):
+        """Rename a budget row, which may move it to another category."""
+        budget = self.get_active_profile().get_budget()
+        old_name, old_category = budget.names[row], budget.get_row_category(row)
+        budget.set_name(row, name)
+        change = ExpenseRenamed(row, old_name, name, float(budget.costs[row]), old_category, budget.get_row_category(row))
+        self.update_profile("on_expense_renamed", change)
+
+    def rename_category(self, old_name, new_name):
+        """Rename a category; returns `False` (changing nothing) if the name is taken by another category."""
+        budget = self.get_active_profile().get_budget()
+        if budget.get_category(old_name) is None or old_name == new_name:
+            return False
+        if budget.get_category(new_name) is not None:
+            logging.warning(f"Not renaming category '{old_name}': '{new_name}' already exists")
+            return False
+        budget.rename_category(old_name, new_name)
+        self.update_profile("on_category_renamed", CategoryRenamed(old_name, new_name))
+        return True
+
+    def flush(self):
+        """Write any queued profile saves now and wait for them to finish."""
+        self.saver.flush()
+
+    def close(self):
+        """Flush queued saves and release the storage backend, folding any pending journal records into snapshots."""
+        try:
+            self.saver.close()
+            with self.store_lock:
+                self.store.close()
+                if self.manifest.is_dirty:
+                    self.manifest.save()
+        except Exception as e:
+            logging.error(f"Failed to close profile storage: {e}")
+
+    def on_profile_update(self, *args): pass
+
+    def on_profile_saved(self, *args): pass
+
+    def on_profile_save_failed(self, file_path, error): pass
+
+    def on_ledger_update(self, *args): pass
+
+    def on_profile_renamed(self, change): pass
+
+    def on_income_changed(self, change): pass
+
+    def on_expense_cost_changed(self, change): pass
+
+    def on_expense_renamed(self, change): pass
 
-    def on_profile_update(self, *args): pass
\ No newline at end of file
+    def on_category_renamed(self, change): pass
\ No newline at end of file
@@ -1,15 +1,16 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from kivy.garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
 from datetime import datetime
-from matplotlib.patches import Rectangle
+from src.modules.chart_canvas import BlitChartCanvas, skip_while_rendering
+from src.modules.chart_hit_test import BarHitTest
+from src.modules.chart_layout import get_display_months, get_spending_ticks
+from src.modules.texture_cache import get_data_digest
 
-class BarGraph(FigureCanvasKivyAgg):
+class BarGraph(BlitChartCanvas):
 
     def __init__(self, fig, ax, spending_data, **kwargs):
         """
         Initialize the bar graph.
-        :param spending_data: List of monthly spending data (12 values, one for each month).
+        :param spending_data: List of monthly spending data for the last 12 months, ending with the current month.
         """
         self.spending_data = spending_data
         self.current_year = datetime.now().year
@@ -17,28 +18,38 @@ class BarGraph(FigureCanvasKivyAgg):
         self.fig.canvas.mpl_connect("motion_notify_event", self.motion_notify_event)
         self.ax = ax
         self.hover_text = None
+        self.hovered_bar = None
+        self.bars = None
+        self.hit_test = None  # Rebuilt after every draw, when the bars or the size may have changed
         super().__init__(self.fig, **kwargs)
 
         self.create_bar_graph()
+        self.draw_idle()
+
+    def update_data(self, spending_data):
+        """Queue new spending for the render worker, which applies it with `apply_data` and redraws the graph."""
+        self.update_figure(lambda: self.apply_data(spending_data))
+
+    def apply_data(self, spending_data):
+        """Apply new spending to the existing bars, rebuilding the graph only if the number of bars changes."""
+        self.spending_data = spending_data
+        display_spending = self.spending_data[-6:]
+        self.clear_hover(redraw=False)
+        if self.bars is None or len(self.bars) != len(display_spending):
+            self.create_bar_graph()
+            return
+
+        for bar, value in zip(self.bars, display_spending):
+            bar.set_height(value)
+        self.set_y_axis(max(self.spending_data))
 
     def create_bar_graph(self):
         """Render the bar graph."""
-        # Get the current month (or use the test month for simulation)
-        current_month = datetime.now().month
-        months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-
         # Determine the months to display (last 5 months + current month)
-        if current_month < 6:  # Handle wrapping into the previous year
-            previous_year_months = months[-(6 - current_month):]  # Get months from last year
-            display_months = previous_year_months + months[:current_month]  # Combine last year and current year months
-        else:
-            display_months = months[current_month - 6:current_month]  # Get last 6 months
+        display_months = get_display_months(6)
 
         # Slice the spending data to match the displayed months
-        # Simulate data for the previous year (use the same spending data for simplicity)
-        extended_spending_data = self.spending_data[-6:] + self.spending_data  # Add last 6 months of previous year
-        display_spending = extended_spending_data[-6:]
+        display_spending = self.spending_data[-6:]
 
         # Bar positions
         x_positions = np.arange(len(display_months))
@@ -51,7 +62,7 @@ class BarGraph(FigureCanvasKivyAgg):
         self.ax.clear()
 
         # Create bars
-        self.ax.bar(
+        self.bars = self.ax.bar(
             x_positions, display_spending, color="#21B6A8", edgecolor="none"
         )
 
@@ -60,18 +71,7 @@ class BarGraph(FigureCanvasKivyAgg):
         self.ax.set_xticklabels(display_months, fontsize=10, color="#FFFFFF")
         self.ax.tick_params(axis="x", length=0)
 
-        step_candidates = [50, 100, 250, 500, 1000, 10000]  # Predefined step sizes
-        step_size = next(s for s in step_candidates if max_spending / 6 <= s)  # Choose the smallest valid step
-        y_limit = step_size * (max_spending // step_size + 1)  # Round up to the next step size multiple
-
-        # Generate Y-axis ticks and labels
-        y_ticks = np.arange(0, y_limit + step_size, step_size)  # Generate ticks
-        y_labels = [f"${int(value)}" for value in y_ticks]
-        y_labels[0] = ""  # Make the first label invisible
-        y_labels[-1] = ""  # Make the last label invisible
-        self.ax.set_yticks(y_ticks)  # Set only the ticks from the second value onward
-        self.ax.set_yticklabels(y_labels, fontsize=8, color="#FFFFFF", va="center", x=0.02)
-        
+        self.set_y_axis(max_spending)
 
         # Customize the axes
         self.ax.spines["top"].set_visible(False)  # Remove top border
@@ -90,54 +90,86 @@ class BarGraph(FigureCanvasKivyAgg):
             weight="bold"
         )
 
-        # Set Y-axis limit
-        self.ax.set_ylim(0, y_limit)
-
         # Draw X-axis line
         self.ax.axhline(y=0, color="#FFFFFF", linewidth=1)
 
         # Finalize the figure
         self.fig.tight_layout()
         self.fig.subplots_adjust(left=0.1, right=0.9, top=0.9, bottom=0.1)
-        self.draw_idle()
 
-    def motion_notify_event(self, x, y, *args, **kwargs):
-        # Convert Kivy's (x, y) into Matplotlib's axes coordinates
-        x_data, y_data = self.ax.transData.inverted().transform((x, y))
+    def set_y_axis(self, max_spending):
+        """Scale the Y axis to the largest month and label it in round dollar steps."""
+        # Generate Y-axis ticks and labels
+        y_ticks, y_limit = get_spending_ticks(max_spending)
+        y_labels = [f"${int(value)}" for value in y_ticks]
+        y_labels[0] = ""  # Make the first label invisible
+        y_labels[-1] = ""  # Make the last label invisible
+        self.ax.set_yticks(y_ticks)  # Set only the ticks from the second value onward
+        self.ax.set_yticklabels(y_labels, fontsize=8, color="#FFFFFF", va="center", x=0.02)
 
+        # Set Y-axis limit
+        self.ax.set_ylim(0, y_limit)
+
+    def get_cache_key(self):
+        spending = [float(value) for value in self.spending_data]
+        return ("bar", get_data_digest(spending, get_display_months(6), self.current_year))
+
+    def on_rasterized(self):
+        self.build_hit_test()
+
+    def build_hit_test(self):
+        """Transform every bar's corners to display pixels in one call and index them by x."""
+        if not self.bars:
+            self.hit_test = None
+            return
+        corners = np.array([
+            (bar.get_x(), bar.get_y(), bar.get_x() + bar.get_width(), bar.get_y() + bar.get_height())
+            for bar in self.bars
+        ])
+        display = self.ax.transData.transform(corners.reshape(-1, 2)).reshape(-1, 4)
+        self.hit_test = BarHitTest(display.tolist())
+
+    @skip_while_rendering
+    def motion_notify_event(self, x, y, *args, **kwargs):
         # Check if the cursor is over a bar
-        for bar in self.ax.patches:  # Each bar is a Rectangle patch
-            if isinstance(bar, Rectangle):
-                bar_bbox = bar.get_bbox()
-                bar_display_bbox = self.ax.transData.transform_bbox(bar_bbox)
-                if bar_display_bbox.contains(x,y):
-                    # Get the bar's value
-                    value = bar.get_height()
-                    # Get the bar's center for positioning the text
-                    bar_center = bar.get_x() + bar.get_width() / 2
-
-                    # Clear previous hover text
-                    if self.hover_text:
-                        self.hover_text.remove()
-
-                    # Add hover text
-                    self.hover_text = self.ax.text(
-                        bar_center, value + 15,  # Slightly above the bar
-                        f"${value:.2f}",
-                        ha="center",
-                        va="bottom",
-                        fontsize=10,
-                        color="#FFFFFF",
-                        fontweight="bold"
-                    )
-                    self.draw_idle()
-                    return
+        index = self.hit_test.find(x, y) if self.hit_test else None
+        if index is not None:
+            bar = self.bars[index]
+            if bar is self.hovered_bar:
+                return  # Label already shown
+
+            # Get the bar's value
+            value = bar.get_height()
+            # Get the bar's center for positioning the text
+            bar_center = bar.get_x() + bar.get_width() / 2
+
+            # Clear previous hover text
+            self.clear_hover(redraw=False)
+
+            # Add hover text
+            self.hovered_bar = bar
+            self.hover_text = self.ax.text(
+                bar_center, value + 15,  # Slightly above the bar
+                f"${value:.2f}",
+                ha="center",
+                va="bottom",
+                fontsize=10,
+                color="#FFFFFF",
+                fontweight="bold"
+            )
+            self.set_animated_artists([self.hover_text])
+            return
 
         # If not hovering over any bar, clear the hover text
+        self.clear_hover()
+
+    def clear_hover(self, redraw=True):
+        """Remove the hover text; `redraw=False` leaves the screen to the next draw."""
+        self.hovered_bar = None
         if self.hover_text:
             self.hover_text.remove()
             self.hover_text = None
-            self.draw_idle()
+        self.set_animated_artists([], blit=redraw)
 
     def resize_event(self, *args, **kwargs):
         pass  
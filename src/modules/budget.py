@@ -1,96 +1,162 @@
 import pandas as pd
+import numpy as np
 import os
 import numbers
 import logging
+import bisect
 from src.constants import default_categories
+from src.modules.budget_allocation import allocate_budgets, get_percentages
+from src.modules.columnar_budget import get_category_ids, get_category_totals, get_expense_category_lookup
 
 class Budget:
     """Encapsulates budget data and operations."""
-    def __init__(self, income, is_home_owner=False, is_vehicle_owner=True, categories=None, names=None, costs=None, custom_weights=None):
+    def __init__(self, income, is_home_owner=False, is_vehicle_owner=True, categories=None, names=None, costs=None, custom_weights=None, category_ids=None):
         self.income = income
         self.is_home_owner = is_home_owner
         self.is_vehicle_owner = is_vehicle_owner
-        self.categories = categories or default_categories
+        self.categories = list(categories or default_categories)  # Copied so edits never touch the defaults
         self.names = names if names else []
-        self.costs = costs if costs else []
+        # `costs` may be a list or a NumPy array loaded from a columnar profile
+        self.costs = costs if costs is not None and len(costs) else []
+        self.category_ids = category_ids
         
         self.budget_weights = custom_weights or {cat.name: cat.weight for cat in self.categories}
         
         if not self.names:
             self.assemble_budget()
+        else:
+            self.recalculate_totals()
 
     def assemble_budget(self):
         """Dynamically allocate budget based on income and category weights."""
-        total_income = self.income
-        allocated_budget = {cat.name: round(total_income * cat.weight, 2) for cat in self.categories}
-
-        logging.debug(f"Allocated budget per category: {allocated_budget}")
-
-        self.names, self.costs = [], []
-
-        for category in self.categories:
-            allocated_amount = allocated_budget[category.name]
-            selected_expenses = []
-
-            if category.name == "Housing & Utilities":
-                if self.is_home_owner:
-                    selected_expenses.append(("Mortgage", 0.5))
-                    selected_expenses.append(("Property Taxes", 0.2))
-                    selected_expenses.append(("Homeowners Insurance", 0.1))
-                    selected_expenses.append(("Home Maintenance & Repairs", 0.2))
-                else:
-                    selected_expenses.append(("Rent", 0.7))
-                    selected_expenses.append(("Renter’s Insurance", 0.1))
-
-                # Everyone Pays Utilities
-                selected_expenses.append(("Electricity", 0.05))
-                selected_expenses.append(("Internet", 0.05))
-                selected_expenses.append(("Cell Phone", 0.05))
-
-            elif category.name == "Transportation":
-                if self.is_vehicle_owner:
-                    selected_expenses.append(("Car Payment", 0.5))
-                    selected_expenses.append(("Car Insurance", 0.2))
-                    selected_expenses.append(("Gas", 0.3))
-                else:
-                    selected_expenses.append(("Public Transportation", 0.8))
-                    selected_expenses.append(("Ride-Sharing", 0.2))
-
-            elif category.name == "Debt & Financial Obligations":
-                selected_expenses.append(("Student Loan Payments", 1.0))
-
-            elif category.name == "Savings & Investments":
-                selected_expenses.append(("Emergency Fund", 0.5))
-                selected_expenses.append(("Retirement Contributions", 0.5))
-
-            elif category.name == "Shopping & Miscellaneous":
-                selected_expenses.append(("Clothing", 0.4))
-                selected_expenses.append(("Shoes", 0.2))
-                selected_expenses.append(("Beauty & Cosmetics", 0.2))
-                selected_expenses.append(("Tech & Gadgets", 0.2))
-
-            for expense_name, weight in selected_expenses:
-                self.names.append(expense_name)
-                self.costs.append(round(allocated_amount * weight, 2))
-
+        names, allocations = allocate_budgets(
+            self.income, self.categories, self.is_home_owner, self.is_vehicle_owner,
+            budget_weights=self.budget_weights,
+        )
+
+        logging.debug(f"Allocated {len(names)} expenses from an income of {self.income}")
+
+        self.names = names
+        self.costs = allocations[0].tolist()
+        self.category_ids = None  # Rows changed, let the indexes rebuild them
+
+        self.recalculate_totals()
+
+    def recalculate_totals(self):
+        """Rebuild the lookup indexes, the per-category totals and the grand total from every row."""
+        self.build_indexes()
+
+        costs = np.asarray(self.costs, dtype=float)
+        self.category_totals = get_category_totals(costs, self.category_ids, len(self.categories)).tolist()
+        self.total = float(costs.sum())
+
+    def build_indexes(self):
+        """Build the hash indexes used to look up rows and categories by name."""
+        self.expense_category_ids = get_expense_category_lookup(self.categories)  # expense name -> category id
+        self.category_lookup = {category.name: index for index, category in enumerate(self.categories)}
+
+        if self.category_ids is None or len(self.category_ids) != len(self.names):
+            self.category_ids = get_category_ids(self.names, self.categories)
+
+        self.name_index = {}  # expense name -> row
+        self.category_rows = [[] for _ in self.categories]  # category id -> rows, in row order
+        for row, (name, category_id) in enumerate(zip(self.names, self.category_ids)):
+            self.name_index.setdefault(name, row)
+            if category_id >= 0:
+                self.category_rows[category_id].append(row)
+
+    def get_row(self, expense_name):
+        """Return the row of an expense, or `None` if the budget doesn't have it."""
+        return self.name_index.get(expense_name)
+
+    def get_category(self, category_name):
+        """Return the `Category` record with the given name, or `None`."""
+        category_id = self.category_lookup.get(category_name)
+        return self.categories[category_id] if category_id is not None else None
+
+    def get_category_rows(self, category_name):
+        """Return the rows that belong to a category, in row order."""
+        category_id = self.category_lookup.get(category_name)
+        return list(self.category_rows[category_id]) if category_id is not None else []
+
+    def get_row_category(self, row_index):
+        """Return the name of the category a row belongs to, or `None` if it is uncategorized."""
+        category_id = self.category_ids[row_index]
+        return self.categories[category_id].name if category_id >= 0 else None
+
+    def set_cost(self, row_index, cost):
+        """Change the cost of a row, adjusting the totals by the difference."""
+        difference = cost - self.costs[row_index]
+        self.costs[row_index] = cost
+        self.total += difference
+
+        category_id = self.category_ids[row_index]
+        if category_id >= 0:
+            self.category_totals[category_id] += difference
+
+    def set_name(self, row_index, name):
+        """Rename a row, moving it (and its cost) to the category that lists the new name."""
+        cost = self.costs[row_index]
+        old_name = self.names[row_index]
+
+        previous_category_id = self.category_ids[row_index]
+        if previous_category_id >= 0:
+            self.category_totals[previous_category_id] -= cost
+            self.category_rows[previous_category_id].remove(row_index)
+
+        self.names[row_index] = name
+        if self.name_index.get(old_name) == row_index:
+            del self.name_index[old_name]
+            if old_name in self.names:  # Another row shares the old name
+                self.name_index[old_name] = self.names.index(old_name)
+        if self.name_index.get(name, row_index) >= row_index:
+            self.name_index[name] = row_index
+
+        category_id = self.expense_category_ids.get(name, -1)
+        self.category_ids[row_index] = category_id
+        if category_id >= 0:
+            self.category_totals[category_id] += cost
+            bisect.insort(self.category_rows[category_id], row_index)
+
+    def rename_category(self, old_name, new_name):
+        """Rename a category, carrying its weight over to the new name. Names must stay unique."""
+        if new_name != old_name and new_name in self.category_lookup:
+            raise ValueError(f"Category '{new_name}' already exists")
+        category_id = self.category_lookup.pop(old_name, None)
+        if category_id is None:
+            return
+
+        self.categories[category_id] = self.categories[category_id]._replace(name=new_name)
+        self.category_lookup[new_name] = category_id
+        if old_name in self.budget_weights:
+            self.budget_weights[new_name] = self.budget_weights.pop(old_name)
+
+    def get_category_totals(self):
+        """Return `{category: total}` for the categories that have rows, in category order."""
+        return {
+            category.name: total
+            for category, total, rows in zip(self.categories, self.category_totals, self.category_rows) if rows
+        }
 
     def get_total(self):
-        """Calculate total budget."""
-        return sum(self.costs)
+        """Return the total budget, kept up to date as costs change."""
+        return round(self.total, 2)
 
     def get_category_percentages(self):
         """Calculate category percentage breakdown."""
-        total = self.get_total()
-        return [(cost / total) * 100 if total > 0 else 0 for cost in self.costs]
+        return get_percentages(self.costs)
 
     def to_dict(self):
-        """Convert budget data to a dictionary for storage."""
+        """
+        Convert budget data to a dictionary for storage.
+        Containers are copied, so the snapshot can be written off the main thread while the budget is edited.
+        """
         return {
             "income": self.income,
-            "categories": self.categories,
-            "names": self.names,
-            "costs": self.costs,
-            "budget_weights": self.budget_weights
+            "categories": list(self.categories),
+            "names": list(self.names),
+            "costs": self.costs.tolist() if isinstance(self.costs, np.ndarray) else list(self.costs),
+            "budget_weights": dict(self.budget_weights)
         }
 
     @staticmethod
@@ -101,5 +167,6 @@ class Budget:
             categories=data.get("categories", []),
             names=data.get("names", []),
             costs=data.get("costs", []),
-            custom_weights=data.get("budget_weights", [])
+            custom_weights=data.get("budget_weights", []),
+            category_ids=data.get("category_ids")
         )
\ No newline at end of file
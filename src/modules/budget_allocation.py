@@ -0,0 +1,75 @@
+import numpy as np
+from src.constants import default_expense_templates
+
+def round_cents(values):
+    """
+    Round an array to cents like Python's `round(value, 2)`, which rounds the exact binary value.
+    `np.round` rounds `value * 100` instead, so a product that lands on a half cent can go the other way.
+    """
+    values = np.asarray(values, dtype=float)
+    scaled = values * 100
+
+    # The exact error of the multiply (Dekker's product) tells which side of a half cent the value was on
+    split = values * 134217729.0
+    high = split - (split - values)
+    error = (high * 100 - scaled) + (values - high) * 100
+
+    cents = np.rint(scaled)  # Exact ties round half to even, like round()
+    tie = scaled - np.floor(scaled) == 0.5
+    cents = np.where(tie & (error > 0), np.ceil(scaled), cents)
+    cents = np.where(tie & (error < 0), np.floor(scaled), cents)
+    return cents / 100
+
+
+def get_expense_rows(categories, is_home_owner=False, is_vehicle_owner=True, templates=default_expense_templates):
+    """
+    Flatten the expense templates into budget rows.
+    Returns the expense names, the category index of each row and each row's share of its category.
+    """
+    applies = {
+        None: True,
+        "home_owner": is_home_owner,
+        "renter": not is_home_owner,
+        "vehicle_owner": is_vehicle_owner,
+        "no_vehicle": not is_vehicle_owner,
+    }
+
+    names, category_indexes, weights = [], [], []
+    for category_index, category in enumerate(categories):
+        for template in templates.get(category.name, []):
+            if applies[template.condition]:
+                names.append(template.name)
+                category_indexes.append(category_index)
+                weights.append(template.weight)
+
+    return names, np.array(category_indexes, dtype=np.intp), np.array(weights, dtype=float)
+
+
+def allocate_budgets(incomes, categories, is_home_owner=False, is_vehicle_owner=True, templates=default_expense_templates, budget_weights=None):
+    """
+    Allocate every expense row for a batch of incomes at once.
+    `budget_weights` maps category names to custom weights; categories without one use their default weight.
+    It may also be a `(len(incomes), len(categories))` array, one row of category weights per income.
+    Returns the expense names and a `(len(incomes), len(names))` table of costs, one row per income.
+    """
+    names, category_indexes, weights = get_expense_rows(categories, is_home_owner, is_vehicle_owner, templates)
+    incomes = np.atleast_1d(np.asarray(incomes, dtype=float))
+    if budget_weights is None or isinstance(budget_weights, dict):
+        budget_weights = budget_weights or {}
+        category_weights = np.array([budget_weights.get(category.name, category.weight) for category in categories], dtype=float)
+    else:
+        category_weights = np.asarray(budget_weights, dtype=float)
+
+    # Round per category first, then per expense, like a budget built by hand
+    category_allocations = round_cents(incomes[:, np.newaxis] * category_weights)
+    return names, round_cents(category_allocations[:, category_indexes] * weights)
+
+
+def get_percentages(costs):
+    """
+    Express costs as percentages of their total.
+    A 2-D table is normalized row by row; rows that total zero stay zero.
+    """
+    costs = np.asarray(costs, dtype=float)
+    totals = costs.sum(axis=-1, keepdims=True)
+    return np.divide(costs * 100, totals, out=np.zeros_like(costs), where=totals > 0)
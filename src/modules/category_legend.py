@@ -4,6 +4,7 @@ from kivy.app import App
 from concurrent.futures import ThreadPoolExecutor
 from src.modules.category import Category 
 from src.data_manager import get_data_manager
+from src.modules.deferred_updates import defer_while_hidden
 
 class CategoryLegend(GridLayout):
     def __init__(self, **kwargs):
@@ -13,8 +14,9 @@ class CategoryLegend(GridLayout):
         self.executor = ThreadPoolExecutor(max_workers=1)  # Limit to 1 worker
         self.size_hint_y = None  # Allow height adjustment
         self._update_scheduled = False  # Prevent duplicate updates
+        self.category_widgets = {}  # Category name -> its legend entry
         self.bind(minimum_height=self.schedule_height_update)  # Throttle height updates
-        get_data_manager().bind(on_profile_update=self.schedule_update)
+        get_data_manager().bind(on_category_renamed=self.on_category_renamed)
         Clock.schedule_once(lambda dt: self.schedule_update())
 
     def schedule_height_update(self, *args):
@@ -30,49 +32,73 @@ class CategoryLegend(GridLayout):
         if self.height != new_height:  # Prevent redundant updates
             self.height = new_height
 
+    def on_category_renamed(self, instance, change):
+        """Rename one entry in place."""
+        if self.get_root_window() is None or change.old not in self.category_widgets:
+            self.schedule_update()  # Reconciled in full once shown
+            return
+        category_widget = self.category_widgets.pop(change.old)
+        category_widget.name = change.new
+        self.category_widgets[change.new] = category_widget
+
+    @defer_while_hidden
     def schedule_update(self, *args):
         """Schedules background computation for updating categories."""
         self.executor.submit(self.compute_category_layout)
 
     def compute_category_layout(self):
-        """Runs category layout calculations off the main thread and schedules UI updates."""
+        """Runs category color lookups off the main thread and schedules UI updates."""
         budget = self.active_profile.get_budget()
-        categories = budget.categories
-
-        category_width = 150  # Approximate width of each category widget
-        num_categories = len(categories)
-        
-        if num_categories == 0:
-            Clock.schedule_once(lambda dt: self.update_ui([], 1))
-            return
-
-        total_spacing = self.spacing[0] * (num_categories - 1)
-        available_width = self.width - self.padding[0] - self.padding[1] - total_spacing
-
-        cols = max(1, int((available_width + self.spacing[0]) // (category_width + self.spacing[0])) - 1)
 
         category_data = []
-        for category in categories:
+        for category in budget.categories:
             color = self.active_profile.get_category_color(category.name)
             if not isinstance(color, str):
                 color = "#FFFFFF"
             rgba_color = self.app.hex_to_rgba(color)
             category_data.append((category.name, rgba_color))
 
-        Clock.schedule_once(lambda dt: self.update_ui(category_data, cols))
+        Clock.schedule_once(lambda dt: self.update_ui(category_data))
+
+    def update_ui(self, category_data):
+        """Reconcile the legend with `category_data` by name, on the main thread."""
+        names = [name for name, _ in category_data]
 
-    def update_ui(self, category_data, cols):
-        """Updates UI elements on the main thread."""
-        self.clear_widgets()
-        self.cols = cols
+        for name in set(self.category_widgets) - set(names):
+            self.remove_widget(self.category_widgets.pop(name))
 
         for name, rgba_color in category_data:
-            category_widget = Category(name=name)
-            category_widget.ids.color.color = rgba_color
-            self.add_widget(category_widget)
+            category_widget = self.category_widgets.get(name)
+            if category_widget is None:
+                category_widget = Category(name=name)
+                self.category_widgets[name] = category_widget
+                self.add_widget(category_widget)
+            if list(category_widget.ids.color.color) != list(rgba_color):
+                category_widget.ids.color.color = rgba_color
 
+        # Children are stored last-first; only reorder (without rebuilding) if the category order changed
+        if [widget.name for widget in reversed(self.children)] != names:
+            for name in names:
+                self.remove_widget(self.category_widgets[name])
+                self.add_widget(self.category_widgets[name])
+
+        self.update_cols()
         Clock.schedule_once(lambda dt: self.schedule_height_update())
 
+    def update_cols(self, *args):
+        """Fit as many columns of categories as the width allows."""
+        category_width = 150  # Approximate width of each category widget
+        num_categories = len(self.category_widgets)
+
+        if num_categories == 0:
+            self.cols = 1
+            return
+
+        total_spacing = self.spacing[0] * (num_categories - 1)
+        available_width = self.width - self.padding[0] - self.padding[1] - total_spacing
+
+        self.cols = max(1, int((available_width + self.spacing[0]) // (category_width + self.spacing[0])) - 1)
+
     def on_size(self, *args):
         """Recalculate columns when resized."""
-        self.schedule_update()
\ No newline at end of file
+        self.update_cols()
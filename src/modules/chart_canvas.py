@@ -0,0 +1,258 @@
+import functools
+import logging
+import threading
+from kivy.clock import Clock
+from kivy.garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.texture import Texture
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
+from src.modules.chart_renderer import get_render_pool
+from src.modules.texture_cache import CachedChart, get_texture_cache
+from src.constants import chart_resize_settle
+
+import numpy as np
+
+def skip_while_rendering(method):
+    """Run a main-thread figure handler only if no render worker holds the figure; otherwise drop the call."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.figure_lock.acquire(blocking=False):
+            return None  # The figure is being rasterized, the next event will retry
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.figure_lock.release()
+    return wrapper
+
+
+class BlitChartCanvas(FigureCanvasKivyAgg):
+    """
+    Agg canvas that rasterizes its figure on the shared render pool and keeps a copy of the
+    result without its animated (hover) artists.
+
+    Figure changes are queued with `update_figure` and applied on a render worker under
+    `figure_lock`, so the UI thread only uploads the finished RGBA buffer into the texture.
+    Hover changes are drawn over the cached background with `set_animated_artists`, and only
+    the pixels they touch are uploaded, so the figure is not re-rendered on every mouse move.
+
+    Subclasses that implement `get_cache_key` share renders through the texture cache: a chart
+    already rendered at the same data and size is shown without drawing it again.
+    """
+
+    def __init__(self, fig, **kwargs):
+        self.background = None
+        self.animated_artists = []
+        self.drawn_extents = []  # Where the animated artists were last drawn, in display pixels
+        self.figure_lock = threading.RLock()  # Held while the figure is changed or rasterized
+        self.queue_lock = threading.Lock()
+        self.pending_changes = []
+        self.render_queued = False  # A render task is submitted but hasn't picked up the changes yet
+        self.render_generation = 0  # Bumped by every queued change; renders of older generations are dropped
+        self.skip_cache = False  # Set when a cached render was evicted before it could be shown
+        self.shared_buffer = None  # Pixels of the shown texture while it is shared through the cache
+        self.resize_trigger = Clock.create_trigger(self.apply_size, chart_resize_settle)
+        self.background_rect = None
+        super().__init__(fig, **kwargs)
+        self.bind(pos=self.update_rect_pos)
+
+    def draw(self):
+        """Rasterize the figure on a render worker; the texture is updated when the buffer is ready."""
+        if self.resize_trigger.is_triggered:
+            return  # The render at the settled size will include this
+        self.update_figure()
+
+    def _on_size_changed(self, *args):
+        """Wait for the size to settle (e.g. a window drag to end), then render once at the final size."""
+        self.resize_trigger.cancel()
+        self.resize_trigger()
+
+    def apply_size(self, *args):
+        width, height = self.size
+        dpi = self.figure.dpi
+        self.update_figure(lambda: self.figure.set_size_inches(width / dpi, height / dpi))
+
+    def update_figure(self, change=None):
+        """Queue `change` (a callable that edits the figure) and a render; both run on a render worker, in order."""
+        with self.queue_lock:
+            if change:
+                self.pending_changes.append(change)
+            self.render_generation += 1
+            if self.render_queued:
+                return  # The queued render will pick this change up too
+            self.render_queued = True
+        get_render_pool().submit(self.rasterize)
+
+    def rasterize(self):
+        """Render worker: apply the queued changes, draw the figure and hand the RGBA buffer to the main thread."""
+        try:
+            with self.figure_lock:
+                with self.queue_lock:
+                    changes, self.pending_changes = self.pending_changes, []
+                    self.render_queued = False
+                    use_cache, self.skip_cache = not self.skip_cache, False
+                    generation = self.render_generation
+                for change in changes:
+                    change()
+                if self.is_superseded(generation):
+                    return  # Newer changes are queued, their render replaces this one
+
+                _, _, width, height = self.figure.bbox.bounds
+                cache_key = self.get_cache_key()
+                if cache_key is not None:
+                    cache_key += (int(width), int(height), self.figure.dpi)
+                    if use_cache and cache_key in get_texture_cache():
+                        for ax in self.figure.axes:
+                            ax.apply_aspect()  # Lay the axes out for this size as a draw would
+                        self.on_rasterized()
+                        Clock.schedule_once(lambda dt: self.show_cached(cache_key, generation))
+                        return
+
+                FigureCanvasAgg.draw(self)
+                buffer = bytes(self.get_renderer().buffer_rgba())
+                background = self.copy_from_bbox(self.figure.bbox)
+                self.on_rasterized()
+        except Exception as e:
+            logging.error(f"Failed to render chart: {e}")
+            raise
+
+        Clock.schedule_once(
+            lambda dt: self.show_buffer(buffer, int(width), int(height), background, cache_key, generation)
+        )
+
+    def is_superseded(self, generation):
+        """Whether changes were queued after the render of `generation` picked up its changes."""
+        with self.queue_lock:
+            return generation != self.render_generation
+
+    def get_cache_key(self):
+        """Return `(chart type, data digest)` for what the figure currently shows, or `None` to never cache it."""
+        return None
+
+    def on_rasterized(self):
+        """Called on the render worker, with the figure locked, after each full draw or cache hit."""
+        pass
+
+    def show_buffer(self, buffer, width, height, background, cache_key=None, generation=None):
+        """Main thread: upload a rendered buffer into a new texture, cache it and show it."""
+        if generation is not None and self.is_superseded(generation):
+            return  # A newer render is on its way
+        texture = Texture.create(size=(width, height))
+        texture.flip_vertical()
+        texture.blit_buffer(buffer, colorfmt="rgba", bufferfmt="ubyte")
+
+        chart = CachedChart(texture, background, buffer)
+        if cache_key is not None:
+            # Texture, background and buffer each hold a full RGBA copy
+            get_texture_cache().put(cache_key, chart, len(buffer) * 3)
+        self.show_chart(chart)
+
+    def show_cached(self, cache_key, generation=None):
+        """Main thread: show a render from the texture cache, or render again if it was evicted meanwhile."""
+        if generation is not None and self.is_superseded(generation):
+            return  # A newer render is on its way
+        chart = get_texture_cache().get(cache_key)
+        if chart is None:
+            self.skip_cache = True
+            self.update_figure()
+            return
+        self.show_chart(chart)
+
+    def show_chart(self, chart):
+        """Point the widget at a rendered texture; it is copied before the first hover blit changes it."""
+        width, height = chart.texture.size
+        if self.img_rect is None or tuple(self.img_rect.size) != (width, height):
+            self.canvas.clear()
+            with self.canvas:
+                Color(*self.figure.get_facecolor())
+                self.background_rect = Rectangle(pos=self.pos, size=(width, height))
+                Color(1.0, 1.0, 1.0, 1.0)
+                self.img_rect = Rectangle(texture=chart.texture, pos=self.pos, size=(width, height))
+        else:
+            self.img_rect.texture = chart.texture
+            self.update_rect_pos()
+        self.img_texture = chart.texture
+        self.shared_buffer = chart.buffer
+        self.canvas.ask_update()
+
+        self.background = chart.background
+        self.drawn_extents = []
+        if self.animated_artists and self.figure_lock.acquire(blocking=False):
+            try:
+                self.blit_artists()  # Put the hover state back over the new background
+            finally:
+                self.figure_lock.release()
+
+    def update_rect_pos(self, *args):
+        """Keep the chart under the widget when it moves without being resized."""
+        if self.img_rect is None:
+            return
+        self.img_rect.pos = self.pos
+        if self.background_rect is not None:
+            self.background_rect.pos = self.pos
+
+    def make_texture_private(self):
+        """Give this widget its own copy of a shared texture so blits don't leak into the cache."""
+        if self.shared_buffer is None:
+            return
+        texture = Texture.create(size=self.img_texture.size)
+        texture.flip_vertical()
+        texture.blit_buffer(self.shared_buffer, colorfmt="rgba", bufferfmt="ubyte")
+        self.img_rect.texture = texture
+        self.img_texture = texture
+        self.shared_buffer = None
+
+    def set_animated_artists(self, artists, blit=True):
+        """Replace the artists drawn over the background; with `blit=False` the next draw shows them."""
+        if not artists and not self.animated_artists and not self.drawn_extents:
+            return  # Nothing shown and nothing to show
+
+        for artist in artists:
+            artist.set_animated(True)  # Full draws skip them, so they never end up in the background
+        self.animated_artists = list(artists)
+        if blit:
+            self.blit_artists()
+
+    def blit_artists(self):
+        """Restore the background, draw the animated artists and upload the pixels that changed."""
+        if self.background is None or not self.is_texture_current():
+            self.draw_idle()  # Nothing cached for this size yet, the next draw applies the artists
+            return
+
+        renderer = self.get_renderer()
+        self.restore_region(self.background)
+
+        extents = []
+        for artist in self.animated_artists:
+            self.figure.draw_artist(artist)
+            extents.append(artist.get_window_extent(renderer))
+
+        dirty = self.drawn_extents + extents
+        self.drawn_extents = extents
+        if dirty:
+            self.upload_region(Bbox.union(dirty))
+
+    def upload_region(self, bbox):
+        """Copy the part of the Agg buffer under `bbox` (display pixels) into the texture."""
+        width, height = self.img_texture.size
+        x0, y0 = max(int(np.floor(bbox.x0)) - 1, 0), max(int(np.floor(bbox.y0)) - 1, 0)
+        x1, y1 = min(int(np.ceil(bbox.x1)) + 1, width), min(int(np.ceil(bbox.y1)) + 1, height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        self.make_texture_private()
+
+        # The buffer's first row is the top of the figure, and the texture is flipped to match it
+        buffer = np.asarray(self.get_renderer().buffer_rgba())
+        region = np.ascontiguousarray(buffer[height - y1:height - y0, x0:x1])
+        self.img_texture.blit_buffer(
+            region.tobytes(), pos=(x0, height - y1), size=(x1 - x0, y1 - y0), colorfmt="rgba", bufferfmt="ubyte"
+        )
+        self.canvas.ask_update()
+
+    def is_texture_current(self):
+        """Whether the texture (and background) were rendered at the figure's current size."""
+        if self.img_texture is None:
+            return False
+        _, _, width, height = self.figure.bbox.bounds
+        return tuple(self.img_texture.size) == (int(width), int(height))
@@ -0,0 +1,55 @@
+import bisect
+import math
+
+class PieHitTest:
+    """
+    Wedge lookup for a pie chart in display pixels.
+    Built once per draw from the wedge angles, then each hover is an `atan2` and a bisect.
+    """
+
+    def __init__(self, center, radius, angles):
+        """`angles` are the contiguous `(theta1, theta2)` of each wedge in degrees, counterclockwise."""
+        self.center_x, self.center_y = center
+        self.radius = radius
+        self.start_angle = angles[0][0] if angles else 0
+        # Where each wedge ends, measured from the first wedge's start, ascending
+        self.boundaries = [theta2 - self.start_angle for _, theta2 in angles]
+
+    def find(self, x, y, enlarged=None, scale=1.1):
+        """Return the index of the wedge under `(x, y)`, or `None`; wedge `enlarged` reaches `scale` times further."""
+        dx, dy = x - self.center_x, y - self.center_y
+        distance = math.hypot(dx, dy)
+        if distance > self.radius * scale:
+            return None
+
+        angle = (math.degrees(math.atan2(dy, dx)) - self.start_angle) % 360
+        index = bisect.bisect_right(self.boundaries, angle)
+        if index >= len(self.boundaries):
+            return None
+
+        limit = self.radius * scale if index == enlarged else self.radius
+        return index if distance <= limit else None
+
+
+class BarHitTest:
+    """
+    Bar lookup for a bar graph in display pixels.
+    Bars are stored as x-intervals sorted by their left edge, so a hover is one bisect.
+    """
+
+    def __init__(self, extents):
+        """`extents` are the `(x0, y0, x1, y1)` of each bar in display pixels."""
+        self.bars = sorted(
+            (min(x0, x1), max(x0, x1), min(y0, y1), max(y0, y1), index)
+            for index, (x0, y0, x1, y1) in enumerate(extents)
+        )
+        self.lefts = [bar[0] for bar in self.bars]
+
+    def find(self, x, y):
+        """Return the index of the bar under `(x, y)`, or `None`."""
+        position = bisect.bisect_right(self.lefts, x) - 1
+        if position < 0:
+            return None
+
+        left, right, bottom, top, index = self.bars[position]
+        return index if x <= right and bottom <= y <= top else None
@@ -0,0 +1,44 @@
+import calendar
+from datetime import datetime
+
+START_ANGLE = 90  # Pies and dials start at 12 o'clock
+SPENDING_STEPS = [50, 100, 250, 500, 1000, 10000]  # Predefined Y-axis step sizes
+
+def get_wedge_angles(values, start_angle=START_ANGLE):
+    """Return the `(theta1, theta2)` of each wedge, in degrees, the way `ax.pie` lays them out."""
+    total = sum(values) or 1
+    angles = []
+    theta1 = start_angle
+    for value in values:
+        theta2 = theta1 + 360 * value / total
+        angles.append((theta1, theta2))
+        theta1 = theta2
+    return angles
+
+
+def get_display_months(count=6, month=None):
+    """Return the abbreviated names of the `count` months ending with `month` (default: this month)."""
+    month = month or datetime.now().month
+    return [calendar.month_abbr[(month - offset - 1) % 12 + 1] for offset in reversed(range(count))]
+
+
+def get_spending_ticks(max_spending):
+    """Return the Y-axis ticks and limit for a spending graph, in round dollar steps."""
+    step_size = next((s for s in SPENDING_STEPS if max_spending / 6 <= s), SPENDING_STEPS[-1])  # Smallest valid step
+    y_limit = step_size * (max_spending // step_size + 1)  # Round up to the next step size multiple
+    ticks = [step_size * index for index in range(int(y_limit // step_size) + 1)]
+    return ticks, y_limit
+
+
+def get_day_suffix(day):
+    """Return the suffix for the day (e.g., 'st', 'nd', 'rd', 'th')."""
+    if 11 <= day <= 13:
+        return "th"
+    elif day % 10 == 1:
+        return "st"
+    elif day % 10 == 2:
+        return "nd"
+    elif day % 10 == 3:
+        return "rd"
+    else:
+        return "th"
@@ -0,0 +1,23 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.constants import chart_render_workers
+
+_render_pool = None
+_render_pool_lock = threading.Lock()
+
+def get_render_pool():
+    """Return the worker pool shared by every chart to rasterize figures off the UI thread."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is None:
+            _render_pool = ThreadPoolExecutor(max_workers=chart_render_workers, thread_name_prefix="chart-render")
+        return _render_pool
+
+
+def shutdown_render_pool():
+    """Stop the render workers, dropping renders that haven't started."""
+    global _render_pool
+    with _render_pool_lock:
+        if _render_pool is not None:
+            _render_pool.shutdown(wait=False, cancel_futures=True)
+            _render_pool = None
@@ -0,0 +1,129 @@
+import os
+import pickle
+import struct
+import logging
+import numpy as np
+from src.constants import default_categories
+from src.modules.profile_store import PickleProfileStore
+
+MAGIC = b"BTCOLS01"
+HEADER_SIZE = struct.Struct("<Q")
+ALIGNMENT = 8  # Every column starts on an 8-byte boundary so it can be mapped directly
+
+# Column name -> dtype, in the order they are laid out in the file
+COLUMNS = {
+    "costs": np.dtype("<f8"),
+    "category_ids": np.dtype("<i4"),
+    "expense_ids": np.dtype("<i4"),
+}
+
+class ColumnarProfileStore(PickleProfileStore):
+    """
+    Stores a profile as a small pickled header followed by typed NumPy columns.
+
+    The header holds the scalar profile fields, the deduplicated expense name string table and the
+    category catalog (omitted when it is the default one). Budget rows live in three
+    columns: `costs`, `category_ids` (index into the catalog, -1 when uncategorized) and
+    `expense_ids` (index into the string table). Files written by the other stores are
+    still readable, so switching to this store migrates profiles on their next save.
+    """
+
+    def __init__(self, use_mmap=os.name != "nt"):
+        # Windows refuses to replace a file that is still mapped, so read columns into memory there
+        self.use_mmap = use_mmap
+
+    def save(self, file_path, data):
+        """Write the profile with its budget rows split into columns."""
+        budget = dict(data.get("budget", {}))
+        categories = budget.pop("categories", None) or default_categories
+        names = list(budget.pop("names", []))
+        costs = np.asarray(budget.pop("costs", []), dtype=COLUMNS["costs"])
+
+        # Each distinct name is stored once; rows refer to it by index
+        string_ids = {}
+        expense_ids = [string_ids.setdefault(name, len(string_ids)) for name in names]
+
+        columns = {
+            "costs": costs,
+            "category_ids": get_category_ids(names, categories).astype(COLUMNS["category_ids"]),
+            "expense_ids": np.asarray(expense_ids, dtype=COLUMNS["expense_ids"]),
+        }
+
+        header = {key: value for key, value in data.items() if key != "budget"}
+        header["budget"] = budget
+        header["categories"] = None if categories == default_categories else categories
+        header["names"] = list(string_ids)
+        header["rows"] = len(names)
+
+        header_bytes = pickle.dumps(header)
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(MAGIC)
+            file.write(HEADER_SIZE.pack(len(header_bytes)))
+            file.write(header_bytes)
+            for name in COLUMNS:
+                file.write(b"\0" * (-file.tell() % ALIGNMENT))
+                file.write(columns[name].tobytes())
+        os.replace(temp_path, file_path)
+
+    def load(self, file_path):
+        """Read a profile, mapping its budget columns straight from the file."""
+        with open(file_path, "rb") as file:
+            if file.read(len(MAGIC)) != MAGIC:
+                logging.info(f"{file_path} is not columnar yet, reading it as a pickle snapshot")
+                return self.read_snapshot(file_path)
+            (header_length,) = HEADER_SIZE.unpack(file.read(HEADER_SIZE.size))
+            header = pickle.loads(file.read(header_length))
+            offset = file.tell()
+
+        rows = header.pop("rows")
+        columns = {}
+        for name, dtype in COLUMNS.items():
+            offset += -offset % ALIGNMENT
+            columns[name] = self._read_column(file_path, dtype, offset, rows)
+            offset += dtype.itemsize * rows
+
+        string_table = np.array(header.pop("names"), dtype=object)
+        categories = header.pop("categories") or default_categories
+
+        data = header
+        data["budget"] = dict(
+            header.get("budget", {}),
+            categories=categories,
+            # Strings can't be mapped from the file, so names are resolved with one vectorized take
+            names=string_table[columns["expense_ids"]].tolist() if rows else [],
+            costs=columns["costs"],
+            category_ids=columns["category_ids"],
+        )
+        return data
+
+    def _read_column(self, file_path, dtype, offset, rows):
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        if self.use_mmap:
+            # Copy-on-write: edits stay in memory until the next save
+            return np.memmap(file_path, dtype=dtype, mode="c", offset=offset, shape=(rows,))
+        with open(file_path, "rb") as file:
+            file.seek(offset)
+            return np.fromfile(file, dtype=dtype, count=rows)
+
+
+def get_expense_category_lookup(categories):
+    """Return `{expense name: index of the first category that lists it}`."""
+    category_lookup = {}
+    for category_id, category in enumerate(categories):
+        for expense in category.expenses:
+            category_lookup.setdefault(expense.name, category_id)
+    return category_lookup
+
+
+def get_category_ids(names, categories):
+    """Return, for each expense name, the index of the category that lists it (-1 if none)."""
+    category_lookup = get_expense_category_lookup(categories)
+    return np.fromiter((category_lookup.get(name, -1) for name in names), dtype=np.int32, count=len(names))
+
+
+def get_category_totals(costs, category_ids, category_count):
+    """Sum costs per category in one pass; uncategorized rows are skipped."""
+    categorized = category_ids >= 0
+    return np.bincount(category_ids[categorized], weights=costs[categorized], minlength=category_count)
@@ -4,6 +4,8 @@ from src.ui.views.dashboard_view import DashboardView
 from src.ui.views.transaction_view import TransactionView
 from src.ui.views.settings_view import SettingsView
 from src.ui.views.profile_view import ProfileView 
+from src.modules.hover_manager import get_hover_manager
+from src.modules.deferred_updates import flush_deferred_updates
 
 class DashboardScreen(Screen):
     pass
@@ -15,14 +17,32 @@ class SettingsScreen(Screen):
     pass
 
 class ContentArea(ScreenManager):
+    """
+    The app's main screens. Each screen is built the first time it is navigated to, and
+    updates to hidden screens are held until they are shown again.
+    """
+    screen_classes = {
+        "dashboard": DashboardScreen,
+        "transaction": TransactionScreen,
+        "settings": SettingsScreen,
+    }
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs) 
         self.transition = SlideTransition()
-        self.add_widget(DashboardScreen(name="dashboard"))
-        self.add_widget(TransactionScreen(name="transaction"))
-        self.add_widget(SettingsScreen(name="settings"))
+        self.transition.bind(on_complete=get_hover_manager().invalidate)  # The new screen's widgets are in place
+        self.load_screen("dashboard")
         self.current = "dashboard"
 
+    def load_screen(self, screen_name):
+        """Build the screen the first time it is needed."""
+        if not self.has_screen(screen_name):
+            self.add_widget(self.screen_classes[screen_name](name=screen_name))
+
+    def on_current(self, instance, value):
+        super().on_current(instance, value)
+        flush_deferred_updates()  # The new screen is attached, let it catch up
+
 class ProfileScreen(Screen):
     pass
 
@@ -30,5 +50,10 @@ class SettingsArea(ScreenManager):
     def __init__(self, **kwargs):
         super().__init__(**kwargs) 
         self.transition = FadeTransition()
+        self.transition.bind(on_complete=get_hover_manager().invalidate)
         self.add_widget(ProfileScreen(name="profile"))
-        self.current = "profile"
\ No newline at end of file
+        self.current = "profile"
+
+    def on_current(self, instance, value):
+        super().on_current(instance, value)
+        flush_deferred_updates()
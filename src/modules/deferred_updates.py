@@ -0,0 +1,29 @@
+import functools
+import weakref
+
+# widget -> {method name: (args, kwargs)} of updates held while the widget's screen is hidden
+_pending_updates = weakref.WeakKeyDictionary()
+
+def defer_while_hidden(method):
+    """
+    Run a widget's update handler only while the widget is on screen.
+    Calls made while its screen is hidden are collapsed into one, which `flush_deferred_updates`
+    runs once the screen is shown again.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.get_root_window() is None:
+            _pending_updates.setdefault(self, {})[method.__name__] = (args, kwargs)  # Only the latest call is kept
+            return None
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def flush_deferred_updates():
+    """Run the updates held for widgets that are on screen again."""
+    for widget in list(_pending_updates.keys()):
+        if widget.get_root_window() is None:
+            continue  # Still hidden
+        updates = _pending_updates.pop(widget)
+        for name, (args, kwargs) in updates.items():
+            getattr(widget, name)(*args, **kwargs)
@@ -1,8 +1,8 @@
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
-from kivy.uix.textinput import TextInput
 from kivy.properties import StringProperty, BooleanProperty, ObjectProperty, ListProperty, NumericProperty
-from kivy.clock import Clock
+from src.modules.inline_editor import get_inline_editor
+from src.modules.text_metrics import get_text_metrics
 import re
 
 class EditableLabel(BoxLayout):
@@ -18,13 +18,14 @@ class EditableLabel(BoxLayout):
     max_content = NumericProperty(None)
     max_length = NumericProperty(None)
     bold = BooleanProperty(False)
+    is_editing = BooleanProperty(False)  # The shared inline editor is open over this label
     
     def __init__(self, **kwargs):
         super().__init__(orientation="horizontal", **kwargs)
         self.register_event_type("on_commit")
+        self.register_event_type("on_text_exceed_limit")
         
         self.size_hint_y: None
-        self.text_input = None
         self.previous_text = self.text
         self.bind(on_touch_up=self.on_double_click)
         
@@ -43,47 +44,23 @@ class EditableLabel(BoxLayout):
         self.update_alignment()
         
     def on_commit(self, new_text): pass
+
+    def on_text_exceed_limit(self, text): pass
     
     def on_double_click(self, instance, touch):
         """Detect double-clicks on the entire BoxLayout."""
         if touch.is_double_tap and self.collide_point(*touch.pos):
-            if self.text_input:  # If already editing, commit instead of recreating
-                self.commit_text()
+            if self.is_editing:  # If already editing, commit instead of reopening
+                get_inline_editor().commit()
             else:
-                self.convert_to_text_input()
-    
-    
-    def convert_to_text_input(self):
-        """Replace the label with a TextInput in the same space."""
-        # Remove existing label
-        self.remove_widget(self.label)
-
-        cursor_color = self.cursor_color if self.cursor_color else self.text_color
-
-        # Create a TextInput with the same properties
-        self.text_input = TextInput(
-            text=self.text,
-            multiline=False,
-            size_hint=(1, 1),  # Matches BoxLayout constraints
-            foreground_color=self.text_color,
-            cursor_color=cursor_color,
-            background_color=self.background_color,
-        )
-
-        if self.max_length:
-            self.text_input.bind(text=self.validate_text_length)
-
-        self.text_input.bind(focus=self.on_unfocus)
-    
-        # Add the text input in place of the label
-        self.add_widget(self.text_input)
-        Clock.schedule_once(self.set_focus, 0.1)
+                self.start_editing()
 
-    def set_focus(self, dt):
-        """Ensure TextInput gets proper focus."""
-        self.text_input.focus = True
-        if self.auto_highlight:
-            self.text_input.select_all()
+    def start_editing(self):
+        """Open the shared inline editor over this label."""
+        get_inline_editor().edit(self)
+
+    def on_is_editing(self, instance, is_editing):
+        self.label.opacity = 0 if is_editing else 1  # The editor shows the text while it is open
 
     def validate_text_length(self, instance, value):
         """Prevent exceeding max_length and dispatch notification event."""
@@ -91,17 +68,10 @@ class EditableLabel(BoxLayout):
             instance.text = instance.text[:self.max_length]
             self.dispatch("on_text_exceed_limit", value)
 
-    def on_unfocus(self, instance, focus):
-        """Called when TextInput loses focus."""
-        if not focus and self.auto_commit:  # If focus is lost
-            self.commit_text()
-
-    def commit_text(self):
-        """Save text and switch back to label mode."""
-        if not self.text_input:  # Prevent crashes when spam clicking
-            return
-        
-        new_value = self.text_input.text.strip() if self.text_input.text else ""
+    def commit_text(self, text):
+        """Save the text entered in the inline editor."""
+        self.is_editing = False
+        new_value = text.strip() if text else ""
 
         if self.is_money_field():
             if not self.is_valid_money(new_value):
@@ -113,15 +83,6 @@ class EditableLabel(BoxLayout):
         if new_value and new_value != self.text:
             self.text = new_value
             self.dispatch("on_commit", new_value)  # Dispatch the event
-
-        # Remove TextInput and restore label
-        if self.text_input in self.children:
-            self.remove_widget(self.text_input)
-        self.text_input = None  # Reset the TextInput reference
-
-        # Create and add a new label
-        self.create_label()
-        self.add_widget(self.label)
         
     def is_money_field(self):
         return self.text_format == "money"
@@ -137,9 +98,11 @@ class EditableLabel(BoxLayout):
     def update_font_size(self, *args):
         """Ensure font size updates dynamically in committed label."""
         self.label.font_size = self.font_size
+        self.update_text()  # The text measures differently now
     
     def update_font_weight(self, *args):
         self.label.bold = self.bold
+        self.update_text()
     
     def format_text(self, text):
         """Format the text based on its content."""
@@ -163,25 +126,13 @@ class EditableLabel(BoxLayout):
         except ValueError:
             return self.previous_text  # Revert if invalid
 
-    def create_label(self):
-        """Create a new Label instance."""
-        self.label = Label(
-            text=self.truncate_text(self.text),
-            bold=self.bold,
-            halign=self.text_align,
-            size_hint=(1, 1),
-        )
-        self.label.bind(size=self.update_alignment)
-
     def truncate_text(self, text):
         """Truncate text with '...' if it's too long for the label's width."""
         if not self.label:
             return text
         
-        estimated_chars = int((self.label.width + 10) / 8) # Approximate 8px per character
         if self.max_content and self.width >= self.max_content:
-            if len(text) > estimated_chars:
-                return text[: estimated_chars - 3] + "..."
+            return get_text_metrics().truncate(text, self.width, self.label.font_name, self.font_size, self.bold)
         return text
 
     def update_label_size(self, *args):
@@ -194,9 +145,9 @@ class EditableLabel(BoxLayout):
             self.width = text_width
 
     def get_text_width(self):
-        """Estimate text width dynamically."""
-        estimated_width = (len(self.text) * 8)  # Approximate width in pixels
-        return min(estimated_width, self.max_content) if self.max_content else estimated_width
+        """Measure the text with the label's font (cached after the first measurement)."""
+        text_width = get_text_metrics().get_text_width(self.text, self.label.font_name, self.font_size, self.bold)
+        return min(text_width, self.max_content) if self.max_content else text_width
 
     def update_text(self, *args):
         """Update label text dynamically"""
@@ -5,6 +5,7 @@ from kivy.properties import ObjectProperty, BooleanProperty, ListProperty, Strin
 from kivy.uix.button import Button
 from kivy.graphics import Rectangle, Color
 from kivy.animation import Animation
+from src.modules.hover_manager import get_hover_manager
 
 class HoverBehavior(Widget):
     is_hovered = BooleanProperty(False)
@@ -16,22 +17,22 @@ class HoverBehavior(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        Window.bind(mouse_pos=self.on_mouse_move)
+        get_hover_manager().register(self)  # One shared mouse listener instead of a binding per widget
         self.app = App.get_running_app()
         self.background_normal = kwargs.get("background_normal", "")
         self.background_down = kwargs.get("background_down", "")
         self.background_color = kwargs.get("background_color", self.normal_color)
 
 
-    def on_mouse_move(self, window, pos):
-        """Detect when the mouse enters or leaves the widget."""
-        if self.collide_point(*pos):
-            if not self.is_hovered:
-                self.on_enter()
-        else:
-            if self.is_hovered:
-                self.on_leave()
+    def hover_enter(self):
+        """Called by the hover manager when the mouse enters the widget."""
+        if not self.is_hovered:
+            self.on_enter()
 
+    def hover_leave(self):
+        """Called by the hover manager when the mouse leaves the widget."""
+        if self.is_hovered:
+            self.on_leave()
 
     def on_enter(self, *args):
         self.is_hovered = True
@@ -71,7 +72,6 @@ class HoverableButton(Button, HoverBehavior):
         self.register_event_type("on_enter")
         self.register_event_type("on_leave")
         
-        Window.bind(mouse_pos=self.on_mouse_move)
         # Text alignment properties
         self.text_size = (self.width, None)  # Default text size
         self.halign = "center"  # Default to center alignment
@@ -83,14 +83,14 @@ class HoverableButton(Button, HoverBehavior):
             size=self._update_alignment,
             )
 
-    def on_mouse_move(self, window, pos):
-        """Detect when the mouse enters or leaves the button."""
-        if self.collide_point(*self.to_widget(*pos)):  # Convert screen pos to local pos
-            if not self.is_hovered:
-                self.dispatch("on_enter")
-        else:
-            if self.is_hovered:
-                self.dispatch("on_leave")
+    def hover_enter(self):
+        """Dispatch `on_enter` so kv handlers run too."""
+        if not self.is_hovered:
+            self.dispatch("on_enter")
+
+    def hover_leave(self):
+        if self.is_hovered:
+            self.dispatch("on_leave")
 
     def _update_alignment(self, *args):
         """Update text alignment dynamically based on `align_text_left`."""
@@ -0,0 +1,156 @@
+import weakref
+
+class HoverManager:
+    """
+    The app's single `Window.mouse_pos` listener, dispatching hover enter/leave to registered widgets.
+
+    Visible widgets are indexed by their window-space bounds in a grid of `cell_size` pixel
+    cells, so a mouse move only checks the widgets in the cell under the cursor plus the ones
+    it is leaving. A widget's cells are updated when its position, size or parent changes, and
+    the whole grid is rebuilt on `invalidate` (window resizes and screen changes). Ancestors can
+    move a widget on screen without changing its `pos` (scrolling, relative layouts), so their
+    `pos` and scroll offsets mark the grid stale; it is rebuilt on the next mouse move.
+
+    Registered widgets implement `hover_enter()` and `hover_leave()`, and optionally
+    `hover_move(pos)` to follow the cursor while it is over them. They are held weakly.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.widgets = weakref.WeakKeyDictionary()  # widget -> cells it is indexed in
+        self.cells = {}  # (column, row) -> WeakSet of widgets
+        self.hovered = weakref.WeakSet()
+        self.dirty = weakref.WeakSet()
+        self.watched_ancestors = weakref.WeakSet()
+        self.rebuild_needed = False
+        self.update_trigger = None  # Set by `attach`
+
+    def attach(self):
+        """Follow the window's mouse, bringing the grid up to date once per frame."""
+        # Imported here so the index can be used without a window
+        from kivy.clock import Clock
+        from kivy.core.window import Window
+
+        self.update_trigger = Clock.create_trigger(self.update_index)
+        Window.bind(mouse_pos=self.on_mouse_pos, size=self.invalidate)
+
+    def schedule_update(self):
+        if self.update_trigger is not None:
+            self.update_trigger()
+
+    def register(self, widget):
+        """Start tracking `widget`; it is indexed once it has been laid out."""
+        self.widgets[widget] = ()
+        widget.bind(pos=self.mark_dirty, size=self.mark_dirty, parent=self.mark_dirty)
+        self.mark_dirty(widget)
+
+    def unregister(self, widget):
+        widget.unbind(pos=self.mark_dirty, size=self.mark_dirty, parent=self.mark_dirty)
+        self.remove_from_cells(widget, self.widgets.pop(widget, ()))
+        if widget in self.hovered:
+            self.hovered.discard(widget)
+            widget.hover_leave()
+
+    def mark_dirty(self, widget, *args):
+        self.dirty.add(widget)
+        self.schedule_update()
+
+    def invalidate(self, *args):
+        """Re-index every widget, e.g. after a screen change moved whole subtrees in or out of view."""
+        self.rebuild_needed = True
+        self.schedule_update()
+
+    def mark_moved(self, *args):
+        """An ancestor scrolled or moved; re-index lazily, scrolling doesn't rebuild the grid every frame."""
+        self.rebuild_needed = True
+
+    def update_index(self, *args):
+        """Apply pending layout changes to the grid."""
+        if self.rebuild_needed:
+            self.rebuild_needed = False
+            self.cells = {}
+            widgets = list(self.widgets.keys())
+        else:
+            widgets = list(self.dirty)
+        self.dirty.clear()
+
+        for widget in widgets:
+            if widget not in self.widgets:
+                continue  # Unregistered since it was marked
+            self.remove_from_cells(widget, self.widgets[widget])
+            cells = self.get_widget_cells(widget)
+            if cells:
+                self.watch_ancestors(widget)
+            for cell in cells:
+                self.cells.setdefault(cell, weakref.WeakSet()).add(widget)
+            self.widgets[widget] = cells
+
+        # Widgets that left the screen while hovered get their leave
+        for widget in list(self.hovered):
+            if not self.widgets.get(widget):
+                self.hovered.discard(widget)
+                widget.hover_leave()
+
+    def remove_from_cells(self, widget, cells):
+        for cell in cells:
+            members = self.cells.get(cell)
+            if members is not None:
+                members.discard(widget)
+                if not members:
+                    del self.cells[cell]
+
+    def watch_ancestors(self, widget):
+        """Mark the grid stale when an ancestor of `widget` moves or scrolls."""
+        window = widget.get_root_window()
+        ancestor = widget.parent
+        while ancestor is not None and ancestor is not window:
+            if ancestor not in self.watched_ancestors:
+                self.watched_ancestors.add(ancestor)
+                ancestor.bind(pos=self.mark_moved)
+                if hasattr(ancestor, "scroll_y"):
+                    ancestor.bind(scroll_x=self.mark_moved, scroll_y=self.mark_moved)
+            ancestor = ancestor.parent
+
+    def get_widget_cells(self, widget):
+        """Return the grid cells covered by a visible widget (none if it isn't on screen)."""
+        if widget.get_root_window() is None or widget.width <= 0 or widget.height <= 0:
+            return ()
+        x0, y0 = widget.to_window(widget.x, widget.y)
+        x1, y1 = widget.to_window(widget.right, widget.top)
+        columns = range(int(min(x0, x1) // self.cell_size), int(max(x0, x1) // self.cell_size) + 1)
+        rows = range(int(min(y0, y1) // self.cell_size), int(max(y0, y1) // self.cell_size) + 1)
+        return tuple((column, row) for column in columns for row in rows)
+
+    def on_mouse_pos(self, window, pos):
+        if self.dirty or self.rebuild_needed:
+            if self.update_trigger is not None:
+                self.update_trigger.cancel()
+            self.update_index()
+
+        cell = (int(pos[0] // self.cell_size), int(pos[1] // self.cell_size))
+        under = {widget for widget in self.cells.get(cell, ()) if is_under(widget, pos)}
+
+        for widget in [widget for widget in self.hovered if widget not in under]:
+            self.hovered.discard(widget)
+            widget.hover_leave()
+        for widget in under:
+            if widget not in self.hovered:
+                self.hovered.add(widget)
+                widget.hover_enter()
+            if hasattr(widget, "hover_move"):
+                widget.hover_move(pos)
+
+
+def is_under(widget, pos):
+    return widget.get_root_window() is not None and widget.collide_point(*widget.to_widget(*pos))
+
+
+_hover_manager = None
+
+def get_hover_manager():
+    """Return the app-wide hover manager, creating it on first use."""
+    global _hover_manager
+    if _hover_manager is None:
+        _hover_manager = HoverManager()
+        _hover_manager.attach()
+    return _hover_manager
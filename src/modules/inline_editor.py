@@ -0,0 +1,75 @@
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.textinput import TextInput
+
+class InlineEditor(TextInput):
+    """
+    The app's one text editor for `EditableLabel` cells. It is laid over the cell being edited
+    and hands the entered text back to the cell on commit, so cells never build editors of their own.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(multiline=False, size_hint=(None, None), **kwargs)
+        self.cell = None
+        self.bind(focus=self.on_focus_changed, text=self.on_text_changed)
+
+    def edit(self, cell):
+        """Open the editor over `cell`, committing any edit still open elsewhere."""
+        self.commit()
+        self.cell = cell
+        cell.is_editing = True
+
+        self.text = cell.text
+        self.foreground_color = cell.text_color
+        self.cursor_color = cell.cursor_color if cell.cursor_color else cell.text_color
+        self.background_color = cell.background_color
+
+        cell.bind(pos=self.follow_cell, size=self.follow_cell)
+        self.follow_cell()
+        if self.parent is None:
+            Window.add_widget(self)
+        Clock.schedule_once(self.set_focus, 0.1)
+
+    def follow_cell(self, *args):
+        """Cover the cell, in window coordinates."""
+        self.pos = self.cell.to_window(*self.cell.pos)
+        self.size = self.cell.size
+
+    def set_focus(self, dt):
+        """Ensure the editor gets proper focus."""
+        if self.cell is None:
+            return  # Committed before the focus was applied
+        self.focus = True
+        if self.cell.auto_highlight:
+            self.select_all()
+
+    def on_text_changed(self, instance, value):
+        if self.cell is not None and self.cell.max_length:
+            self.cell.validate_text_length(self, value)
+
+    def on_focus_changed(self, instance, focus):
+        """Called when the editor loses focus."""
+        if not focus and self.cell is not None and self.cell.auto_commit:
+            self.commit()
+
+    def commit(self, *args):
+        """Close the editor and give its text to the cell being edited."""
+        cell, self.cell = self.cell, None
+        if cell is None:
+            return
+
+        cell.unbind(pos=self.follow_cell, size=self.follow_cell)
+        if self.parent is not None:
+            self.parent.remove_widget(self)
+        self.focus = False
+        cell.commit_text(self.text)
+
+
+_inline_editor = None
+
+def get_inline_editor():
+    """Return the shared inline editor, creating it on first use."""
+    global _inline_editor
+    if _inline_editor is None:
+        _inline_editor = InlineEditor()
+    return _inline_editor
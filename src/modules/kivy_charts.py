@@ -0,0 +1,348 @@
+import calendar
+import math
+from datetime import datetime
+from kivy.graphics import Color, Ellipse, Line, Mesh, Rectangle
+from kivy.uix.label import Label
+from kivy.uix.widget import Widget
+from kivy.utils import get_color_from_hex
+from src.modules.chart_hit_test import BarHitTest, PieHitTest
+from src.modules.hover_manager import get_hover_manager
+from src.modules.chart_layout import START_ANGLE, get_day_suffix, get_display_months, get_spending_ticks, get_wedge_angles
+
+BAR_COLOR = "#21B6A8"
+WHITE = (1, 1, 1, 1)
+
+def to_kivy_angle(theta):
+    """Convert a matplotlib angle (counterclockwise from 3 o'clock) to Kivy's (clockwise from 12 o'clock)."""
+    return 90 - theta
+
+
+def create_label(parent, font_size, color=WHITE, bold=False):
+    """Add a label that sizes itself to its text."""
+    label = Label(font_size=font_size, color=color, bold=bold, size_hint=(None, None))
+    label.bind(texture_size=label.setter("size"))
+    parent.add_widget(label)
+    return label
+
+
+def get_arc_vertices(center, inner_radius, outer_radius, start_angle, end_angle, segments=64):
+    """Return Mesh vertices for a `triangle_strip` ring segment between two Kivy angles."""
+    center_x, center_y = center
+    steps = max(int(segments * abs(end_angle - start_angle) / 360), 1)
+    vertices = []
+    for step in range(steps + 1):
+        angle = math.radians(start_angle + (end_angle - start_angle) * step / steps)
+        dx, dy = math.sin(angle), math.cos(angle)
+        vertices += [center_x + dx * outer_radius, center_y + dy * outer_radius, 0, 0]
+        vertices += [center_x + dx * inner_radius, center_y + dy * inner_radius, 0, 0]
+    return vertices
+
+
+class KivyChart(Widget):
+    """
+    Base for dashboard charts drawn directly with Kivy canvas instructions.
+
+    The charts expose the same data API as the matplotlib widgets but never rasterize on the CPU:
+    resizing moves vertices and hovering resizes a single instruction. Subclasses build
+    `hit_test` in `update_layout` and react to the cursor in `set_hovered`.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.hit_test = None
+        self.hovered_index = None
+        self.bind(pos=self.update_layout, size=self.update_layout)
+        get_hover_manager().register(self)
+
+    def hover_enter(self):
+        pass
+
+    def hover_leave(self):
+        if self.hovered_index is not None:
+            self.set_hovered(None)
+
+    def hover_move(self, pos):
+        if self.hit_test is None:
+            return  # Nothing drawn yet
+        index = self.find(*self.to_widget(*pos))
+        if index != self.hovered_index:
+            self.set_hovered(index)
+
+    def find(self, x, y):
+        return self.hit_test.find(x, y)
+
+    def update_layout(self, *args):
+        pass
+
+    def set_hovered(self, index):
+        self.hovered_index = index
+
+
+class KivyPieChart(KivyChart):
+    """Native counterpart of `PieChart`: one `Ellipse` slice per category, enlarged on hover."""
+
+    def __init__(self, title="", **kwargs):
+        self.wedges = []  # (Color, Ellipse) per category
+        self.angles = []
+        self.percentages = []
+        super().__init__(**kwargs)
+        self.title_label = create_label(self, font_size=16, bold=True)
+        self.title_label.text = title
+        self.hover_label = create_label(self, font_size=13, color=(0, 0, 0, 1))
+
+    def update_data(self, values, percentages, colors, labels=None):
+        """Recolor and re-angle the existing slices; slices are only created or removed when the count changes."""
+        self.angles = get_wedge_angles(values)
+        self.percentages = list(percentages)
+        self.hovered_index = None
+        self.hover_label.text = ""
+
+        # Slices go in `canvas.before` so the labels stay on top
+        while len(self.wedges) > len(values):
+            for instruction in self.wedges.pop():
+                self.canvas.before.remove(instruction)
+        while len(self.wedges) < len(values):
+            with self.canvas.before:
+                self.wedges.append((Color(), Ellipse()))
+
+        for (color, _), hex_color in zip(self.wedges, colors):
+            color.rgba = get_color_from_hex(hex_color)
+        self.update_layout()
+
+    def get_geometry(self):
+        """Return the pie's center and radius, framed like the matplotlib figure (a title takes the top 20%)."""
+        plot_height = self.height * 0.8 if self.title_label.text else self.height
+        radius = min(self.width, plot_height) / 2 / 1.25
+        return (self.center_x, self.y + plot_height / 2), radius
+
+    def update_layout(self, *args):
+        center, radius = self.get_geometry()
+        for index in range(len(self.wedges)):
+            self.place_wedge(index, center, radius)
+
+        self.title_label.center_x = self.center_x
+        self.title_label.y = self.y + self.height * 0.8 + 10
+        self.hit_test = PieHitTest(center, radius, self.angles)
+        self.place_hover_label(center, radius)
+
+    def place_wedge(self, index, center, radius):
+        if index == self.hovered_index:
+            radius *= 1.1
+        theta1, theta2 = self.angles[index]
+        ellipse = self.wedges[index][1]
+        ellipse.pos = (center[0] - radius, center[1] - radius)
+        ellipse.size = (radius * 2, radius * 2)
+        ellipse.angle_start = to_kivy_angle(theta2)
+        ellipse.angle_end = to_kivy_angle(theta1)
+
+    def place_hover_label(self, center, radius):
+        if self.hovered_index is None:
+            return
+        theta1, theta2 = self.angles[self.hovered_index]
+        theta_mid = math.radians((theta1 + theta2) / 2)
+        self.hover_label.center = (
+            center[0] + radius * 1.1 * 0.6 * math.cos(theta_mid),
+            center[1] + radius * 1.1 * 0.6 * math.sin(theta_mid),
+        )
+
+    def find(self, x, y):
+        return self.hit_test.find(x, y, self.hovered_index)
+
+    def set_hovered(self, index):
+        """Shrink the previous slice back and enlarge the new one; only their vertices change."""
+        center, radius = self.get_geometry()
+        previous, self.hovered_index = self.hovered_index, index
+        if previous is not None:
+            self.place_wedge(previous, center, radius)
+        if index is None:
+            self.hover_label.text = ""
+            return
+
+        self.place_wedge(index, center, radius)
+        self.hover_label.text = f"{self.percentages[index]:.1f}%"
+        self.place_hover_label(center, radius)
+
+
+class KivyBarGraph(KivyChart):
+    """Native counterpart of `BarGraph`: the last six months of spending as `Rectangle` bars."""
+
+    def __init__(self, spending_data, **kwargs):
+        self.spending_data = spending_data
+        self.bars = []
+        self.y_labels = []
+        self.y_ticks, self.y_limit = [], 1
+        super().__init__(**kwargs)
+
+        self.title_label = create_label(self, font_size=18, bold=True)
+        self.title_label.text = f"{datetime.now().year} Monthly Spending"
+        self.month_labels = []
+        self.hover_label = create_label(self, font_size=13, bold=True)
+        with self.canvas.before:
+            Color(*get_color_from_hex(BAR_COLOR))
+            self.bars = [Rectangle() for _ in range(6)]
+            Color(*WHITE)
+            self.axis_line = Line(width=1)
+
+        self.update_data(spending_data)
+
+    def update_data(self, spending_data):
+        """Apply new spending to the existing bars and rescale the Y axis."""
+        self.spending_data = spending_data
+        self.hovered_index = None
+        self.hover_label.text = ""
+
+        for index, month in enumerate(get_display_months(len(self.bars))):
+            if index == len(self.month_labels):
+                self.month_labels.append(create_label(self, font_size=13))
+            self.month_labels[index].text = month
+
+        self.y_ticks, self.y_limit = get_spending_ticks(max(self.spending_data, default=0))
+        while len(self.y_labels) < len(self.y_ticks):
+            self.y_labels.append(create_label(self, font_size=11))
+        for index, label in enumerate(self.y_labels):
+            # The first and last ticks stay unlabeled
+            label.text = f"${int(self.y_ticks[index])}" if 0 < index < len(self.y_ticks) - 1 else ""
+        self.update_layout()
+
+    def get_plot_area(self):
+        """Return `(left, bottom, width, height)` of the plot, inset like the matplotlib figure."""
+        return self.x + self.width * 0.1, self.y + self.height * 0.1, self.width * 0.8, self.height * 0.8
+
+    def to_plot(self, slot, value):
+        """Convert a bar slot and a dollar value to widget coordinates."""
+        left, bottom, width, height = self.get_plot_area()
+        slot_width = width / len(self.bars)
+        return left + slot_width * (slot + 0.5), bottom + height * value / self.y_limit
+
+    def update_layout(self, *args):
+        if not self.bars:
+            return
+        left, bottom, width, height = self.get_plot_area()
+        bar_width = width / len(self.bars) * 0.8
+
+        values = self.spending_data[-len(self.bars):]
+        extents = []
+        for slot, bar in enumerate(self.bars):
+            x, top = self.to_plot(slot, values[slot] if slot < len(values) else 0)
+            self.month_labels[slot].center_x = x
+            self.month_labels[slot].top = bottom - 4
+            if slot >= len(values):
+                bar.size = (0, 0)  # No data for this month, don't leave a default-sized box
+                continue
+            bar.pos = (x - bar_width / 2, bottom)
+            bar.size = (bar_width, top - bottom)
+            extents.append((x - bar_width / 2, bottom, x + bar_width / 2, top))
+        self.hit_test = BarHitTest(extents)
+
+        self.axis_line.points = [left, bottom, left + width, bottom]
+        for label, tick in zip(self.y_labels, self.y_ticks):
+            label.right = left - 4
+            label.center_y = bottom + height * tick / self.y_limit
+
+        self.title_label.center_x = self.center_x
+        self.title_label.top = self.top - 10
+        if self.hovered_index is not None:
+            self.place_hover_label(self.hovered_index)
+
+    def place_hover_label(self, index):
+        x, top = self.to_plot(index, self.spending_data[-len(self.bars):][index])
+        self.hover_label.center_x = x
+        self.hover_label.y = top + 4
+
+    def set_hovered(self, index):
+        self.hovered_index = index
+        if index is None:
+            self.hover_label.text = ""
+            return
+        self.hover_label.text = f"${self.spending_data[-len(self.bars):][index]:.2f}"
+        self.place_hover_label(index)
+
+
+class KivyRadialTracker(KivyChart):
+    """Native counterpart of `RadialPercentageTracker`: a day dial with a progress ring."""
+
+    def __init__(self, budget_percentage, **kwargs):
+        self.budget_percentage = budget_percentage
+        self.dial_key = None
+        self.day_labels = []  # (day, angle, number label, suffix label)
+        super().__init__(**kwargs)
+
+        with self.canvas.before:
+            Color(*WHITE)
+            self.ticks = Mesh(mode="lines")
+            Color(*get_color_from_hex(BAR_COLOR))
+            self.progress = Mesh(mode="triangle_strip")
+        self.percentage_label = create_label(self, font_size=20, bold=True)
+        self.caption_label = create_label(self, font_size=13)
+        self.caption_label.text = "Spent so far"
+
+        self.set_budget_percentage(budget_percentage)
+
+    def set_budget_percentage(self, budget_percentage):
+        """Show a new percentage; only the progress ring and center label change unless the day has."""
+        self.budget_percentage = budget_percentage
+        self.percentage_label.text = f"{budget_percentage}%"
+        self.update_dial()
+        self.update_progress()
+
+    def get_geometry(self):
+        """Return the dial's center and the pixels per unit of the matplotlib axes (-1.5 to 1.5)."""
+        plot_height = self.height * 0.95
+        scale = min(self.width, plot_height) / 3
+        return (self.center_x, self.y + plot_height / 2), scale
+
+    def update_dial(self):
+        """Rebuild the day labels when the date changes."""
+        now = datetime.now()
+        dial_key = (now.year, now.month, now.day)
+        if dial_key == self.dial_key:
+            return
+        self.dial_key = dial_key
+
+        total_days = calendar.monthrange(now.year, now.month)[1]
+        for _, _, number_label, suffix_label in self.day_labels:
+            self.remove_widget(number_label)
+            self.remove_widget(suffix_label)
+        self.day_labels = []
+        for day in sorted({total_days, now.day}, reverse=True):
+            number_label = create_label(self, font_size=14, bold=True)
+            number_label.text = str(day)
+            suffix_label = create_label(self, font_size=11)
+            suffix_label.text = get_day_suffix(day)
+            angle = START_ANGLE + (360 / total_days) * (total_days - day)
+            self.day_labels.append((day, angle, number_label, suffix_label))
+        self.update_layout()
+
+    def update_layout(self, *args):
+        if self.dial_key is None:
+            return
+        center, scale = self.get_geometry()
+        total_days = calendar.monthrange(self.dial_key[0], self.dial_key[1])[1]
+
+        vertices = []
+        for day_offset in range(total_days):
+            angle = math.radians(START_ANGLE + (360 / total_days) * day_offset)
+            for radius in (1.2, 1.1):  # Outer and inner end of the tick
+                x = center[0] + radius * scale * math.cos(angle)
+                y = center[1] + radius * scale * math.sin(angle)
+                vertices += [x, y, 0, 0]
+        self.ticks.vertices = vertices
+        self.ticks.indices = list(range(total_days * 2))
+
+        for _, angle, number_label, suffix_label in self.day_labels:
+            x = center[0] + 1.4 * scale * math.cos(math.radians(angle))
+            y = center[1] + 1.4 * scale * math.sin(math.radians(angle))
+            number_label.center = (x, y)
+            suffix_offset = 0.13 if 45 < angle <= 135 else 0.15
+            suffix_label.center = (x + suffix_offset * scale, y + 0.05 * scale)
+
+        self.percentage_label.center = (center[0], center[1] + 0.1 * scale)
+        self.caption_label.center = (center[0], center[1] - 0.15 * scale)
+        self.update_progress()
+
+    def update_progress(self):
+        center, scale = self.get_geometry()
+        sweep = 360 * max(min(self.budget_percentage, 100), 0) / 100  # Clockwise from 12 o'clock
+        vertices = get_arc_vertices(center, 0.75 * scale, scale, 0, sweep)
+        self.progress.vertices = vertices
+        self.progress.indices = list(range(len(vertices) // 4))
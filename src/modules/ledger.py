@@ -0,0 +1,177 @@
+import os
+import struct
+import logging
+import threading
+from collections import defaultdict
+from datetime import date, datetime
+from src.constants import Transaction
+
+STRING_RECORD = b"S"
+TRANSACTION_RECORD = b"T"
+STRING_LENGTH = struct.Struct("<H")
+TRANSACTION = struct.Struct("<iqii")  # date ordinal, amount in cents, expense id, category id
+
+class Ledger:
+    """
+    Append-only transaction store for a profile (`<id>.ledger`).
+
+    Transactions are packed into fixed-size binary records, with expense and category
+    names interned in a string table written inline the first time each name appears.
+    Only the monthly and per-category rollups are kept in memory, and they are updated
+    as transactions are appended, so chart reads never scan the transaction history.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.strings = []
+        self.string_ids = {}
+        self.monthly_totals = defaultdict(int)  # (year, month) -> cents
+        self.category_totals = defaultdict(lambda: defaultdict(int))  # (year, month) -> category -> cents
+        self.transaction_count = 0
+        self.valid_length = None  # Where the intact records end, when a torn record follows them
+        self.lock = threading.Lock()  # Imports append from a background thread
+        self.load()
+
+    def __len__(self):
+        return self.transaction_count
+
+    def load(self):
+        """Rebuild the string table and rollups from the ledger file."""
+        for transaction in self._read_transactions(intern=True):
+            self._add_to_rollups(transaction.date, to_cents(transaction.amount), transaction.category)
+        if self.valid_length is not None:
+            # Drop the torn record so later appends don't end up behind it, unreadable
+            with open(self.file_path, "r+b") as file:
+                file.truncate(self.valid_length)
+            self.valid_length = None
+        if self.transaction_count:
+            logging.info(f"Loaded {self.transaction_count} transaction(s) from {self.file_path}")
+
+    def add_transaction(self, transaction):
+        self.add_transactions([transaction])
+
+    def add_transactions(self, transactions):
+        """
+        Append a batch of `Transaction`s with a single write and update the rollups.
+        The whole batch is encoded before anything changes, so a bad row leaves both the file
+        and the in-memory state untouched, and the new strings and rollups are only applied
+        once the write succeeded.
+        """
+        with self.lock:
+            buffer = bytearray()
+            new_strings = {}  # Strings first seen in this batch -> their IDs once committed
+            rows = []
+            for transaction in transactions:
+                transaction_date = to_date(transaction.date)
+                cents = to_cents(transaction.amount)
+                expense_id = self._intern(transaction.expense, buffer, new_strings)
+                category_id = self._intern(transaction.category, buffer, new_strings)
+                buffer += TRANSACTION_RECORD
+                buffer += TRANSACTION.pack(transaction_date.toordinal(), cents, expense_id, category_id)
+                rows.append((transaction_date, cents, transaction.category))
+
+            if not buffer:
+                return
+
+            with open(self.file_path, "ab") as file:
+                end = file.tell()
+                try:
+                    file.write(buffer)
+                    file.flush()
+                except Exception:
+                    file.truncate(end)  # Don't leave a partial batch for later appends to follow
+                    raise
+
+            for value in new_strings:  # Inserted in ID order
+                self.string_ids[value] = len(self.strings)
+                self.strings.append(value)
+            for transaction_date, cents, category in rows:
+                self._add_to_rollups(transaction_date, cents, category)
+
+    def iter_transactions(self, start=date.min, end=date.max, category=None):
+        """Stream the transactions between `start` and `end` (inclusive) from disk, oldest first."""
+        start, end = to_date(start), to_date(end)
+        for transaction in self._read_transactions():
+            if start <= transaction.date <= end and (category is None or transaction.category == category):
+                yield transaction
+
+    def _read_transactions(self, intern=False):
+        """Stream every transaction from disk in the order it was appended."""
+        if not os.path.exists(self.file_path):
+            return
+
+        strings = self.strings if intern else []
+        with open(self.file_path, "rb") as file:
+            while True:
+                offset = file.tell()
+                record_type = file.read(1)
+                if not record_type:
+                    break
+                try:
+                    if record_type == STRING_RECORD:
+                        (length,) = STRING_LENGTH.unpack(file.read(STRING_LENGTH.size))
+                        value = file.read(length)
+                        if len(value) != length:
+                            raise struct.error("truncated string")
+                        value = value.decode("utf-8")
+                        if intern:
+                            self.string_ids[value] = len(strings)
+                        strings.append(value)
+                    elif record_type == TRANSACTION_RECORD:
+                        ordinal, cents, expense_id, category_id = TRANSACTION.unpack(file.read(TRANSACTION.size))
+                        yield Transaction(date.fromordinal(ordinal), cents / 100, strings[expense_id], strings[category_id])
+                    else:
+                        raise struct.error(f"unknown record type {record_type!r}")
+                except (struct.error, IndexError, UnicodeDecodeError):
+                    # A record cut short by a crash mid-write; everything before it is intact
+                    logging.warning(f"Ignoring truncated record at the end of {self.file_path}")
+                    if intern:
+                        self.valid_length = offset
+                    break
+
+    def get_monthly_totals(self, months=12, end=None):
+        """Return spending for the `months` months ending with `end` (default: this month), oldest first."""
+        end = to_date(end or date.today())
+        year, month = end.year, end.month
+        keys = []
+        for _ in range(months):
+            keys.append((year, month))
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        with self.lock:
+            return [self.monthly_totals.get(key, 0) / 100 for key in reversed(keys)]
+
+    def get_category_totals(self, year, month):
+        """Return `{category: amount}` spent in the given month."""
+        with self.lock:
+            totals = self.category_totals.get((year, month), {})
+            return {category: cents / 100 for category, cents in totals.items()}
+
+    def _intern(self, value, buffer, new_strings):
+        """Return the ID of `value`, encoding a string record into `buffer` the first time it appears."""
+        string_id = self.string_ids.get(value, new_strings.get(value))
+        if string_id is None:
+            encoded = value.encode("utf-8")
+            buffer += STRING_RECORD
+            buffer += STRING_LENGTH.pack(len(encoded))
+            buffer += encoded
+            string_id = new_strings[value] = len(self.strings) + len(new_strings)
+        return string_id
+
+    def _add_to_rollups(self, transaction_date, cents, category):
+        key = (transaction_date.year, transaction_date.month)
+        self.monthly_totals[key] += cents
+        self.category_totals[key][category] += cents
+        self.transaction_count += 1
+
+
+def to_date(value):
+    """Normalize a `date`, `datetime` or ISO string to a `date`."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+def to_cents(amount):
+    return int(round(float(amount) * 100))
@@ -1,32 +1,91 @@
-from kivy.garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
 from matplotlib.patches import Wedge
+from src.modules.chart_canvas import BlitChartCanvas, skip_while_rendering
+from src.modules.chart_hit_test import PieHitTest
+from src.modules.chart_layout import get_wedge_angles
+from src.modules.texture_cache import get_data_digest
 
 import numpy as np
 
-class PieChart(FigureCanvasKivyAgg):
+class PieChart(BlitChartCanvas):
+    """
+    Pie chart widget that owns its figure for its whole lifetime.
+    New data is applied to the existing wedges with `update_data` instead of building a new figure,
+    and the hover highlight is blitted over the rendered chart.
+    """
 
     def __init__(self, fig, **kwargs):
         super().__init__(fig, **kwargs)
         self.fig = fig
         self.ax = fig.gca()
+        self.wedges = []
+        self.data_digest = get_data_digest()
         self.hovered_section = None
+        self.highlight_wedge = None  # Enlarged copy of the hovered wedge, drawn over the chart
         self.hover_text = None
+        self.hit_test = None  # Rebuilt after every draw, when the wedges or the size may have changed
+
+        # Same framing as `ax.pie`, set once since the wedges are managed by hand
+        self.ax.set_aspect("equal")
+        self.ax.set(frame_on=False, xticks=[], yticks=[], xlim=(-1.25, 1.25), ylim=(-1.25, 1.25))
 
         # Connect hover event
         self.fig.canvas.mpl_connect("motion_notify_event", self.motion_notify_event)
 
+    def update_data(self, values, percentages, colors, labels=None):
+        """Queue new data for the render worker, which applies it with `apply_data` and redraws the chart."""
+        self.update_figure(lambda: self.apply_data(values, percentages, colors, labels))
+
+    def apply_data(self, values, percentages, colors, labels=None):
+        """Move, recolor and relabel the existing wedges; wedges are only created or removed when the count changes."""
+        self.clear_highlight(redraw=False)
+        labels = labels or [None] * len(values)
+        self.data_digest = get_data_digest([float(value) for value in values], list(colors))
+
+        # Drop wedges that no longer have a category
+        while len(self.wedges) > len(values):
+            self.wedges.pop().remove()
+
+        for index, (theta1, theta2) in enumerate(get_wedge_angles(values)):
+            if index < len(self.wedges):
+                wedge = self.wedges[index]
+                wedge.set_theta1(theta1)
+                wedge.set_theta2(theta2)
+            else:
+                wedge = Wedge((0, 0), 1.0, theta1, theta2, clip_on=False)
+                self.ax.add_patch(wedge)
+                self.wedges.append(wedge)
+
+            wedge.set_facecolor(colors[index])
+            wedge.set_label(labels[index] or "")
+            wedge.data_index = index
+            wedge.data_value = values[index]
+            wedge.data_percentage = percentages[index]
+
+    def get_cache_key(self):
+        # Labels and percentages only show on hover, so charts of the same values share a render
+        return ("pie", self.data_digest)
+
+    def on_rasterized(self):
+        self.build_hit_test()
+
+    def build_hit_test(self):
+        """Precompute the pie's center, radius and wedge boundaries in display pixels."""
+        (center_x, center_y), (edge_x, _) = self.ax.transData.transform([(0, 0), (1, 0)])
+        angles = [(wedge.theta1, wedge.theta2) for wedge in self.wedges]
+        self.hit_test = PieHitTest((center_x, center_y), edge_x - center_x, angles)
+
+    @skip_while_rendering
     def motion_notify_event(self, x, y, *args, **kwargs):
         """Handle mouse hover events."""
-        # Convert Kivy's (x, y) into Matplotlib's figure coordinates
-        data_coords = self.ax.transData.inverted().transform((x, y))
-        if not self.ax.contains_point((x, y)):  # Ensure the event is within the plot axes
+        if self.hit_test is None:
+            return  # Not drawn yet
+
+        enlarged = self.hovered_section.data_index if self.hovered_section else None
+        index = self.hit_test.find(x, y, enlarged)
+        if index is None:
             self.clear_highlight()
-            return
-        for wedge in self.ax.patches:
-            if is_point_in_wedge(data_coords, wedge):
-                self.highlight_section(wedge)
-                return
-        self.clear_highlight()
+        else:
+            self.highlight_section(self.wedges[index])
 
     def resize_event(self, *args, **kwargs):
         pass  
@@ -47,64 +106,40 @@ class PieChart(FigureCanvasKivyAgg):
             return  # Already highlighted
 
         # Clear previous highlight
-        self.clear_highlight()
+        self.clear_highlight(redraw=False)
 
-        # Enlarge the hovered wedge
-        if isinstance(wedge, Wedge):
-            wedge.set_radius(1.1)  # Adjust as needed
+        # Enlarge the hovered wedge by drawing a bigger copy over it
         self.hovered_section = wedge
+        self.highlight_wedge = Wedge(
+            wedge.center, wedge.r * 1.1, wedge.theta1, wedge.theta2,  # Adjust as needed
+            facecolor=wedge.get_facecolor(), edgecolor="none", clip_on=False
+        )
+        self.ax.add_patch(self.highlight_wedge)
 
         # Display the value inside the wedge
         percentage = wedge.data_percentage
         theta_mid = (wedge.theta1 + wedge.theta2) / 2  # Middle angle of the wedge
-        radius = wedge.r * 0.6  # Adjust the radius multiplier for better positioning
+        radius = self.highlight_wedge.r * 0.6  # Adjust the radius multiplier for better positioning
 
         # Convert polar to Cartesian coordinates
         x = radius * np.cos(np.radians(theta_mid))
         y = radius * np.sin(np.radians(theta_mid))
 
         # Add text at the calculated position
-        if self.hover_text:
-            self.hover_text.remove()
         self.hover_text = self.ax.text(
             x, y, f"{percentage:.1f}%", ha="center", va="center", fontsize=10, color="black"
         )
 
-        self.fig.canvas.draw_idle()
+        self.set_animated_artists([self.highlight_wedge, self.hover_text])
 
-    def clear_highlight(self):
-        """Reset the highlight and remove the hover text."""
-        if self.hovered_section:
-            self.hovered_section.set_radius(1.0)  # Reset radius
-            self.hovered_section = None
+    def clear_highlight(self, redraw=True):
+        """Remove the enlarged wedge and the hover text; `redraw=False` leaves the screen to the next draw."""
+        self.hovered_section = None
+        if self.highlight_wedge:
+            self.highlight_wedge.remove()
+            self.highlight_wedge = None
         if self.hover_text:
             self.hover_text.remove()
             self.hover_text = None
 
-        self.fig.canvas.draw_idle()
-
-def is_point_in_wedge(point, wedge):
-    """Manually check if a point is inside a wedge."""
-    # Unpack point and wedge properties
-    x, y = point
-    center_x, center_y = wedge.center
-    radius = wedge.r
-    theta1, theta2 = wedge.theta1, wedge.theta2
-
-    # Calculate distance from the center
-    distance = ((x - center_x)**2 + (y - center_y)**2)**0.5
-    if distance > radius:
-        return False
-
-    # Calculate angle in degrees
-    angle = np.degrees(np.arctan2(y - center_y, x - center_x)) % 360
-
-    # Normalize angles for comparison
-    theta1 = theta1 % 360
-    theta2 = theta2 % 360
-
-    # Handle wrap-around cases
-    if theta1 <= theta2:  # Normal case
-        return theta1 <= angle <= theta2
-    else:  # Wrapping case (e.g., 300° to 60°)
-        return angle >= theta1 or angle <= theta2
\ No newline at end of file
+        self.set_animated_artists([], blit=redraw)
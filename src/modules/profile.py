@@ -2,7 +2,7 @@
 import uuid
 import random
 from src.modules.budget import Budget
-from src.constants import default_income, default_categories
+from src.constants import default_income, default_categories, profile_schema_version
 
 class Profile:
     """Represents a user profile with a budget."""
@@ -15,14 +15,14 @@ class Profile:
 
     def get_category_color(self, category_name):
         """Retrieve the color associated with a category from the budget."""
-        for category in self.budget.categories:
-            if category.name == category_name:
-                color = category.color
-                if isinstance(color, str):  # Ensure it's a string
-                    return color
-                elif isinstance(color, float):  # Handle unexpected float values
-                    print(f"WARNING: Found float instead of hex color for {category_name}. Using fallback.")
-                    return random.choice([cat.color for cat in default_categories])
+        category = self.budget.get_category(category_name)
+        if category:
+            color = category.color
+            if isinstance(color, str):  # Ensure it's a string
+                return color
+            elif isinstance(color, float):  # Handle unexpected float values
+                print(f"WARNING: Found float instead of hex color for {category_name}. Using fallback.")
+                return random.choice([cat.color for cat in default_categories])
         
         fallback_color = random.choice([cat.color for cat in default_categories])
         return fallback_color
@@ -37,6 +37,7 @@ class Profile:
     def to_dict(self):
         """Convert profile data to a dictionary for storage."""
         return {
+            "schema_version": profile_schema_version,
             "profile_id": self.id,
             "profile_name": self.name,
             "income": self.income,
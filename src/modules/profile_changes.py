@@ -0,0 +1,12 @@
+from collections import namedtuple
+
+# Payloads of the typed change events `DataManager` dispatches before `on_profile_update`.
+# Each carries what a listener needs to apply the change without re-reading the profile.
+
+ProfileRenamed = namedtuple("ProfileRenamed", ["old", "new"])
+IncomeChanged = namedtuple("IncomeChanged", ["old", "new"])
+# `category` is the category the row's cost counts towards, or `None` if it is uncategorized
+ExpenseCostChanged = namedtuple("ExpenseCostChanged", ["row", "old", "new", "category"])
+# Renaming a row can move its `cost` from `old_category` to `new_category`
+ExpenseRenamed = namedtuple("ExpenseRenamed", ["row", "old", "new", "cost", "old_category", "new_category"])
+CategoryRenamed = namedtuple("CategoryRenamed", ["old", "new"])
@@ -0,0 +1,116 @@
+import os
+import pickle
+import logging
+from collections import namedtuple
+from src.constants import profile_schema_version
+
+ProfileEntry = namedtuple("ProfileEntry", ["id", "name", "mtime", "size", "schema_version"])
+
+def get_file_stats(file_path):
+    """Return `(mtime, size)` of a file, or `(None, None)` if it isn't on disk."""
+    try:
+        stat = os.stat(file_path)
+        return stat.st_mtime, stat.st_size
+    except OSError:
+        return None, None
+
+class ProfileManifest:
+    """Lightweight index of the profiles in the data directory, so listing them never unpickles a profile."""
+
+    MANIFEST_FILE = "manifest.dat"
+    MANIFEST_VERSION = 1
+
+    def __init__(self, data_dir):
+        self.manifest_path = os.path.join(data_dir, self.MANIFEST_FILE)
+        self.entries = {}
+        self.is_dirty = False
+        self.load()
+
+    def load(self):
+        """Load the manifest from disk. A missing or unreadable manifest is left empty to be rebuilt."""
+        if not os.path.exists(self.manifest_path):
+            return
+
+        try:
+            with open(self.manifest_path, "rb") as file:
+                manifest_data = pickle.load(file)
+        except Exception as e:
+            logging.warning(f"Failed to read profile manifest, it will be rebuilt: {e}")
+            return
+
+        if manifest_data.get("version") != self.MANIFEST_VERSION:
+            logging.info("Profile manifest is from a different version, it will be rebuilt.")
+            return
+
+        self.entries = {
+            entry["id"]: ProfileEntry(**entry) for entry in manifest_data.get("profiles", [])
+        }
+
+    def save(self):
+        """Write the manifest to disk."""
+        try:
+            temp_path = f"{self.manifest_path}.tmp"
+            with open(temp_path, "wb") as file:
+                pickle.dump({
+                    "version": self.MANIFEST_VERSION,
+                    "profiles": [entry._asdict() for entry in self.entries.values()]
+                }, file)
+            os.replace(temp_path, self.manifest_path)
+            self.is_dirty = False
+        except Exception as e:
+            logging.error(f"Failed to save profile manifest: {e}")
+            raise
+
+    def update(self, profile_id, name, file_path, schema_version=profile_schema_version):
+        """
+        Record the current state of a profile file.
+        The manifest is only rewritten when something listing-relevant changed; file
+        stats alone are kept in memory until the next `save`.
+        """
+        mtime, size = get_file_stats(file_path)
+
+        previous = self.entries.get(profile_id)
+        self.entries[profile_id] = ProfileEntry(profile_id, name, mtime, size, schema_version)
+
+        if previous is None or previous.name != name or previous.schema_version != schema_version:
+            self.save()
+        else:
+            self.is_dirty = True
+
+    def remove(self, profile_id):
+        if self.entries.pop(profile_id, None):
+            self.save()
+
+    def get(self, profile_id):
+        """Return the `ProfileEntry` for an ID, or `None` if it isn't listed."""
+        return self.entries.get(profile_id)
+
+    def list_entries(self):
+        """Return every listed profile."""
+        return list(self.entries.values())
+
+    def sync(self, profile_ids, load_entry, get_path):
+        """
+        Reconcile the manifest against the profile IDs found on disk.
+        Profiles missing from the manifest, or whose file at `get_path(profile_id)` changed size or
+        mtime since it was recorded, are passed to `load_entry`, which returns a `ProfileEntry`
+        (or `None` if the file can't be read).
+        """
+        changed = False
+
+        for profile_id in set(self.entries) - set(profile_ids):
+            del self.entries[profile_id]
+            changed = True
+
+        for profile_id in profile_ids:
+            previous = self.entries.get(profile_id)
+            if previous and get_file_stats(get_path(profile_id)) == (previous.mtime, previous.size):
+                continue
+            entry = load_entry(profile_id)
+            if entry:
+                self.entries[profile_id] = entry
+                changed = True
+
+        if changed:
+            logging.info(f"Profile manifest rebuilt with {len(self.entries)} profile(s)")
+            self.save()
@@ -0,0 +1,189 @@
+import os
+import copy
+import pickle
+import logging
+from src.modules.ledger import Ledger
+
+class PickleProfileStore:
+    """Stores each profile as a single pickled dictionary (`<id>.dat`)."""
+
+    @classmethod
+    def open(cls, data_dir):
+        """Create the store for a data directory."""
+        return cls()
+
+    def save(self, file_path, data):
+        """Rewrite the whole profile file."""
+        self.write_snapshot(file_path, data)
+
+    def load(self, file_path):
+        """Read the profile dictionary from its file."""
+        return self.read_snapshot(file_path)
+
+    def compact(self, file_path):
+        """Nothing to compact, every save is already a full snapshot."""
+        pass
+
+    def list_profile_ids(self, data_dir, reserved_files=()):
+        """Return the IDs of the profile files in the data directory without reading them."""
+        return [
+            os.path.splitext(file)[0] for file in os.listdir(data_dir)
+            if file.endswith(".dat") and file not in reserved_files
+        ]
+
+    def open_ledger(self, profile_id, ledger_path):
+        """Return the transaction ledger for a profile."""
+        return Ledger(ledger_path)
+
+    def close(self):
+        pass
+
+    @staticmethod
+    def write_snapshot(file_path, data):
+        """Write the full profile dictionary, replacing the file atomically."""
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump(data, file)
+        os.replace(temp_path, file_path)
+
+    @staticmethod
+    def read_snapshot(file_path):
+        with open(file_path, "rb") as file:
+            return pickle.load(file)
+
+
+class JournaledProfileStore(PickleProfileStore):
+    """
+    Stores a profile as a snapshot (`<id>.dat`) plus an append-only journal (`<id>.journal`).
+
+    Each save appends only the fields that changed since the last save. Loading replays the
+    journal on top of the snapshot, and the journal is folded back into the snapshot once it
+    grows past `compact_threshold` records or becomes larger than the snapshot itself.
+    """
+    JOURNAL_EXTENSION = ".journal"
+
+    def __init__(self, compact_threshold=256):
+        self.compact_threshold = compact_threshold
+        self._persisted = {}  # file_path -> profile dict as it exists on disk
+        self._journal_records = {}  # file_path -> number of records in the journal
+
+    def journal_path(self, file_path):
+        return os.path.splitext(file_path)[0] + self.JOURNAL_EXTENSION
+
+    def save(self, file_path, data):
+        """Append the changes since the last save, or write a snapshot for unknown files."""
+        persisted = self._persisted.get(file_path)
+        if persisted is None or not os.path.exists(file_path):
+            self._write_compacted(file_path, data)
+            return
+
+        changes = list(diff_records(persisted, data))
+        if not changes:
+            return
+
+        journal_path = self.journal_path(file_path)
+        with open(journal_path, "ab") as file:
+            file.write(pickle.dumps(changes))
+
+        for path, value in changes:
+            persisted = apply_record(persisted, path, copy.deepcopy(value))
+        self._persisted[file_path] = persisted
+        self._journal_records[file_path] = self._journal_records.get(file_path, 0) + 1
+
+        logging.debug(f"Journaled {len(changes)} change(s) to {journal_path}")
+
+        if self._needs_compaction(file_path):
+            self.compact(file_path)
+
+    def load(self, file_path):
+        """Load the snapshot and replay any journaled changes on top of it."""
+        data = self.read_snapshot(file_path)
+        records = 0
+
+        journal_path = self.journal_path(file_path)
+        if os.path.exists(journal_path):
+            with open(journal_path, "r+b") as file:
+                while True:
+                    offset = file.tell()
+                    try:
+                        changes = pickle.load(file)
+                    except EOFError:
+                        break
+                    except Exception:
+                        # A record cut short by a crash mid-write; everything before it is intact.
+                        # Drop it, or every later save would be appended behind it and never replayed.
+                        logging.warning(f"Dropping truncated record at the end of {journal_path}")
+                        file.truncate(offset)
+                        break
+                    for path, value in changes:
+                        data = apply_record(data, path, value)
+                    records += 1
+
+        self._persisted[file_path] = copy.deepcopy(data)
+        self._journal_records[file_path] = records
+
+        if records:
+            logging.debug(f"Replayed {records} journal record(s) for {file_path}")
+            if self._needs_compaction(file_path):
+                self.compact(file_path)
+
+        return data
+
+    def compact(self, file_path):
+        """Fold the journal into a fresh snapshot and remove it."""
+        if not self._journal_records.get(file_path):
+            return
+        self._write_compacted(file_path, self._persisted[file_path])
+        logging.info(f"Compacted journal for {file_path}")
+
+    def close(self):
+        """Compact every journal that still has pending records."""
+        for file_path in list(self._journal_records):
+            self.compact(file_path)
+
+    def _write_compacted(self, file_path, data):
+        self.write_snapshot(file_path, data)
+        journal_path = self.journal_path(file_path)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+        self._persisted[file_path] = copy.deepcopy(data)
+        self._journal_records[file_path] = 0
+
+    def _needs_compaction(self, file_path):
+        if self._journal_records.get(file_path, 0) >= self.compact_threshold:
+            return True
+        try:
+            return os.path.getsize(self.journal_path(file_path)) > os.path.getsize(file_path)
+        except OSError:
+            return False
+
+
+def diff_records(old, new, path=()):
+    """
+    Yield `(path, value)` for every value in `new` that differs from `old`.
+
+    Equal subtrees are skipped with one `==`, which runs in C, so only the containers that
+    actually changed are walked in Python. The comparison is still linear in the profile size,
+    but so is `Profile.to_dict`, which every save already calls to produce `new`.
+    """
+    if type(old) is type(new) and old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict) and old.keys() == new.keys():
+        for key in new:
+            yield from diff_records(old[key], new[key], path + (key,))
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (before, after) in enumerate(zip(old, new)):
+            yield from diff_records(before, after, path + (index,))
+    else:
+        yield path, new
+
+
+def apply_record(data, path, value):
+    """Set `value` at `path` inside `data` and return the (possibly replaced) root."""
+    if not path:
+        return value
+    target = data
+    for key in path[:-1]:
+        target = target[key]
+    target[path[-1]] = value
+    return data
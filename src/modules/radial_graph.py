@@ -1,24 +1,80 @@
-from matplotlib.patches import Wedge, Circle
-from kivy.garden.matplotlib.backend_kivyagg import FigureCanvasKivyAgg
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
+from matplotlib.patches import Wedge
+from matplotlib.collections import LineCollection
+from src.modules.chart_canvas import BlitChartCanvas
+from src.modules.chart_layout import START_ANGLE, get_day_suffix
+from src.modules.texture_cache import get_data_digest
+from datetime import datetime
 import numpy as np
 import calendar
-import time
 
+class RadialPercentageTracker(BlitChartCanvas):
+    """
+    Radial gauge of how much of the budget has been spent this month.
 
+    The day dial only changes once a day, so it is drawn into the cached background and
+    only the progress wedge and percentage label are blitted over it when the value changes.
+    Renders of the dial go through the texture cache keyed by `(day, width, height, dpi)`, so
+    returning to a size that was already shown today reuses its raster instead of drawing again.
+    """
 
-class RadialPercentageTracker(FigureCanvasKivyAgg):
     def __init__(self, fig, ax, budget_percentage, **kwargs):
         super().__init__(fig, **kwargs)
         self.ax = ax
         self.fig = fig
         self.budget_percentage = budget_percentage
+        self.dial_key = None  # (year, month, day) the dial was drawn for
+        self.progress_wedge = None
+        self.percentage_text = None
 
         self.create_radial_graph()
     
     def create_radial_graph(self):
         """Render the radial graph."""
+        self.update_dial()
+        self.update_progress()
+
+        self.fig.subplots_adjust(left=0, right=1, top=0.95, bottom=0)
+        # Redraw the figure
+        self.draw_idle()
+
+    def set_budget_percentage(self, budget_percentage):
+        """Show a new percentage, redrawing only the progress layer unless the day has changed."""
+        self.budget_percentage = budget_percentage
+        if self.dial_key == get_dial_key() and self.figure_lock.acquire(blocking=False):
+            try:
+                self.update_progress()
+                self.blit_artists()
+            finally:
+                self.figure_lock.release()
+            return
+
+        # New day, or a render is running: let the render worker apply it
+        self.update_figure(self.refresh)
+
+    def refresh(self):
+        """Bring the dial and progress layer up to date; runs on the render worker."""
+        self.update_dial()
+        self.update_progress()
+
+    def get_cache_key(self):
+        # The progress layer is blitted on top, so the render only depends on the day;
+        # `BlitChartCanvas` adds the size, giving one cached dial per (day, size)
+        return ("radial", get_data_digest(self.dial_key))
+
+    def update_progress(self):
+        """Point the progress wedge and the center label at the current percentage."""
+        # Calculate the end angle based on the percentage
+        end_angle = START_ANGLE + 360 * ((100 - self.budget_percentage) / 100)
+        self.progress_wedge.set_theta1(end_angle)  # Clockwise fill
+        self.percentage_text.set_text(f"{self.budget_percentage}%")
+
+    def update_dial(self):
+        """Draw the static dial for today if it isn't already; returns whether it was redrawn."""
+        dial_key = get_dial_key()
+        if dial_key == self.dial_key:
+            return False
+        self.dial_key = dial_key
+
         # Clear existing axis content
         self.ax.clear()
         self.ax.set_xlim(-1.5, 1.5)
@@ -26,89 +82,45 @@ class RadialPercentageTracker(FigureCanvasKivyAgg):
         self.ax.set_aspect('equal')
         self.ax.set_facecolor('none')
 
-
-        now = datetime.now()
-        current_day = 27
-        current_month = now.month
-        current_year = now.year
+        current_year, current_month, current_day = dial_key
         total_days = calendar.monthrange(current_year, current_month)[1]
 
-        # Calculate the end angle based on the percentage
-        start_angle = 90  # Start at 12 o'clock
-        end_angle = start_angle + 360 * ((100 - self.budget_percentage) / 100)
-
-        # Create the progress wedge (filled area)
-        progress_wedge = Wedge(
-            center=(0, 0),
-            r=1,
-            theta1=end_angle, 
-            theta2=start_angle,  # Clockwise fill
-            width=0.25, 
-            facecolor="#21B6A8",  # Green progress
-            edgecolor="none", 
-            antialiased=True
-        )
-        self.ax.add_patch(progress_wedge)
-
         # Add tick marks for each day of the month
         tick_outer_multiplier = 1.2  # Move ticks farther out from the wedge
-        tick_inner_multiplier = 1.15  # Set the inner tick point closer than the outer
         tick_length = 0.1  # Length of the tick marks
         tick_thickness = 1.2  # Thickness of the tick marks
         text_padding = 0.2
 
-        def get_day_suffix(day):
-            """Return the suffix for the day (e.g., 'st', 'nd', 'rd', 'th')."""
-            if 11 <= day <= 13:
-                return "th"
-            elif day % 10 == 1:
-                return "st"
-            elif day % 10 == 2:
-                return "nd"
-            elif day % 10 == 3:
-                return "rd"
-            else:
-                return "th"
-
-        for day_offset in range(total_days):
-            day = (total_days - day_offset)  # Start with the last day at the top
-            angle = start_angle + (360 / total_days) * day_offset  # Clockwise tick angle
-            x_outer = tick_outer_multiplier * np.cos(np.radians(angle))  # Outer tick mark position
-            y_outer = tick_outer_multiplier * np.sin(np.radians(angle))
-            x_inner = (tick_outer_multiplier - tick_length) * np.cos(np.radians(angle))  # Extend inner tick to make it longer
-            y_inner = (tick_outer_multiplier - tick_length) * np.sin(np.radians(angle))
-            self.ax.plot([x_outer, x_inner], [y_outer, y_inner], color="#FFFFFF", linewidth=tick_thickness)
-
-            # Add day numbers at every 5th tick for clarity
-            if day == total_days or day == current_day:
-                suffix = get_day_suffix(day)
-                day_label = f"{day}"
-                x_label = (tick_outer_multiplier + text_padding) * np.cos(np.radians(angle))  # Position the label slightly further out
-                y_label = (tick_outer_multiplier + text_padding) * np.sin(np.radians(angle))
-                self.ax.text(
-                    x_label, y_label, f"{day_label}",
-                    ha='center', va='center', fontsize=10, fontweight="semibold", color="#FFFFFF"
-                )
-
-                # Add suffix relative to the day label
-                if 45 < angle <= 135:  # Top side
-                    suffix_x = x_label + 0.13
-                    suffix_y = y_label + 0.05
-                else:  # Left side
-                    suffix_x = x_label + 0.15
-                    suffix_y = y_label + 0.05
-
-                self.ax.text(
-                    suffix_x, suffix_y, suffix,
-                    ha='center', va='center', fontsize=8, fontweight="light", color="#FFFFFF"
-                )
-
-
-        # Add percentage text in the center
-        self.ax.text(
-            0, 0.1, f"{self.budget_percentage}%", 
-            ha='center', va='center', fontsize=16, color="#FFFFFF", fontweight='bold'
+        # Clockwise tick angles, starting with the last day at the top
+        angles = np.radians(START_ANGLE + (360 / total_days) * np.arange(total_days))
+        directions = np.column_stack((np.cos(angles), np.sin(angles)))
+        ticks = np.stack(
+            (directions * tick_outer_multiplier, directions * (tick_outer_multiplier - tick_length)), axis=1
         )
+        self.ax.add_collection(LineCollection(ticks, colors="#FFFFFF", linewidths=tick_thickness))
+
+        # Label the last day and today
+        for day in sorted({total_days, current_day}, reverse=True):
+            angle = START_ANGLE + (360 / total_days) * (total_days - day)
+            x_label = (tick_outer_multiplier + text_padding) * np.cos(np.radians(angle))  # Position the label slightly further out
+            y_label = (tick_outer_multiplier + text_padding) * np.sin(np.radians(angle))
+            self.ax.text(
+                x_label, y_label, f"{day}",
+                ha='center', va='center', fontsize=10, fontweight="semibold", color="#FFFFFF"
+            )
+
+            # Add suffix relative to the day label
+            if 45 < angle <= 135:  # Top side
+                suffix_x = x_label + 0.13
+                suffix_y = y_label + 0.05
+            else:  # Left side
+                suffix_x = x_label + 0.15
+                suffix_y = y_label + 0.05
+
+            self.ax.text(
+                suffix_x, suffix_y, get_day_suffix(day),
+                ha='center', va='center', fontsize=8, fontweight="light", color="#FFFFFF"
+            )
 
         self.ax.text(
             0, -0.15, "Spent so far",  # Slightly below the center
@@ -121,11 +133,28 @@ class RadialPercentageTracker(FigureCanvasKivyAgg):
 
         # Hide axes
         self.ax.axis('off')
-        self.fig.subplots_adjust(left=0, right=1, top=0.95, bottom=0)
-        # Redraw the figure
-        self.draw_idle()
 
-    
+        # Dynamic layer, drawn over the cached dial
+        self.progress_wedge = Wedge(
+            center=(0, 0),
+            r=1,
+            theta1=START_ANGLE,
+            theta2=START_ANGLE,  # Clockwise fill
+            width=0.25, 
+            facecolor="#21B6A8",  # Green progress
+            edgecolor="none", 
+            antialiased=True
+        )
+        self.ax.add_patch(self.progress_wedge)
+
+        # Add percentage text in the center
+        self.percentage_text = self.ax.text(
+            0, 0.1, "", 
+            ha='center', va='center', fontsize=16, color="#FFFFFF", fontweight='bold'
+        )
+        self.set_animated_artists([self.progress_wedge, self.percentage_text], blit=False)
+        return True
+
     def motion_notify_event(self, x, y, *args, **kwargs):
         pass
     def resize_event(self, *args, **kwargs):
@@ -139,4 +168,10 @@ class RadialPercentageTracker(FigureCanvasKivyAgg):
     def key_release_event(self, *args, **kwargs):
         pass
     def scroll_event(self, *args, **kwargs):
-        pass
\ No newline at end of file
+        pass
+
+
+def get_dial_key():
+    """Return the `(year, month, day)` the dial is drawn for."""
+    now = datetime.now()
+    return now.year, now.month, now.day
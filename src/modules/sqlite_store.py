@@ -0,0 +1,225 @@
+import os
+import pickle
+import sqlite3
+import logging
+import threading
+import time
+from datetime import date
+from itertools import islice
+from src.constants import Transaction
+from src.modules.ledger import Ledger, to_date, to_cents
+from src.modules.profile_store import PickleProfileStore
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    data BLOB NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    profile_id TEXT NOT NULL,
+    date INTEGER NOT NULL,  -- YYYYMMDD, so `date / 100` is the month
+    amount INTEGER NOT NULL,  -- cents
+    expense TEXT NOT NULL,
+    category TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS imported_ledgers (
+    profile_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    imported REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transactions_profile_date ON transactions (profile_id, date);
+CREATE INDEX IF NOT EXISTS transactions_profile_category ON transactions (profile_id, category, date);
+"""
+
+# Statements are kept constant and parameterized so sqlite3's statement cache reuses them
+SAVE_PROFILE = "INSERT OR REPLACE INTO profiles (id, name, data, updated) VALUES (?, ?, ?, ?)"
+LOAD_PROFILE = "SELECT data FROM profiles WHERE id = ?"
+LIST_PROFILES = "SELECT id FROM profiles"
+INSERT_TRANSACTION = "INSERT INTO transactions (profile_id, date, amount, expense, category) VALUES (?, ?, ?, ?, ?)"
+MARK_LEDGER_IMPORTED = "INSERT INTO imported_ledgers (profile_id, path, imported) VALUES (?, ?, ?)"
+IS_LEDGER_IMPORTED = "SELECT 1 FROM imported_ledgers WHERE profile_id = ?"
+COUNT_TRANSACTIONS = "SELECT COUNT(*) FROM transactions WHERE profile_id = ?"
+MONTHLY_TOTALS = """
+    SELECT date / 100, SUM(amount) FROM transactions
+    WHERE profile_id = ? AND date BETWEEN ? AND ?
+    GROUP BY date / 100
+"""
+CATEGORY_TOTALS = """
+    SELECT category, SUM(amount) FROM transactions
+    WHERE profile_id = ? AND date BETWEEN ? AND ?
+    GROUP BY category
+"""
+TRANSACTIONS_IN_RANGE = """
+    SELECT date, amount, expense, category FROM transactions
+    WHERE profile_id = ? AND date BETWEEN ? AND ?
+    ORDER BY date, id
+"""
+CATEGORY_TRANSACTIONS_IN_RANGE = """
+    SELECT date, amount, expense, category FROM transactions
+    WHERE profile_id = ? AND category = ? AND date BETWEEN ? AND ?
+    ORDER BY date, id
+"""
+ITER_BATCH_SIZE = 500  # Rows fetched per lock acquisition while streaming transactions
+IMPORT_BATCH_SIZE = 1000  # Rows inserted per statement while importing a file ledger
+
+class SQLiteProfileStore(PickleProfileStore):
+    """
+    Stores profiles and their transactions in one embedded SQLite database (`budget_tracker.db`).
+
+    Profiles are addressed by the same `<id>.dat` paths as the file stores; only the ID
+    is used. Profiles that still exist as `.dat` files are read from disk and move into
+    the database on their next save.
+    """
+    DATABASE_FILE = "budget_tracker.db"
+
+    @classmethod
+    def open(cls, data_dir):
+        return cls(data_dir)
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+        self.lock = threading.Lock()  # Shared by the UI thread, the saver and imports
+        self.connection = sqlite3.connect(
+            os.path.join(data_dir, self.DATABASE_FILE), check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+
+    def save(self, file_path, data):
+        with self.lock, self.connection:
+            self.connection.execute(SAVE_PROFILE, (
+                get_profile_id(file_path),
+                data.get("profile_name", "Default Profile"),
+                pickle.dumps(data),
+                time.time(),
+            ))
+
+    def load(self, file_path):
+        with self.lock:
+            row = self.connection.execute(LOAD_PROFILE, (get_profile_id(file_path),)).fetchone()
+        if row:
+            return pickle.loads(row[0])
+        logging.info(f"Profile {file_path} is not in the database yet, reading it from disk")
+        return self.read_snapshot(file_path)
+
+    def list_profile_ids(self, data_dir, reserved_files=()):
+        with self.lock:
+            stored_ids = [row[0] for row in self.connection.execute(LIST_PROFILES)]
+        file_ids = super().list_profile_ids(data_dir, reserved_files)
+        return stored_ids + [profile_id for profile_id in file_ids if profile_id not in stored_ids]
+
+    def open_ledger(self, profile_id, ledger_path):
+        """Return the profile's ledger, importing its `.ledger` file the first time the database is used."""
+        ledger = SQLiteLedger(self, profile_id)
+        if ledger_path and os.path.exists(ledger_path):
+            self.import_ledger(ledger, ledger_path)
+        return ledger
+
+    def import_ledger(self, ledger, ledger_path):
+        """
+        Stream a file ledger's transactions into the database and set the file aside.
+        The import is recorded in the same database transaction as the rows, so a crash before
+        the file is renamed never imports it twice.
+        """
+        imported = 0
+        with self.lock, self.connection:
+            if self.connection.execute(IS_LEDGER_IMPORTED, (ledger.profile_id,)).fetchone() is None:
+                transactions = Ledger(ledger_path).iter_transactions()
+                while True:
+                    rows = [ledger.to_row(transaction) for transaction in islice(transactions, IMPORT_BATCH_SIZE)]
+                    if not rows:
+                        break
+                    self.connection.executemany(INSERT_TRANSACTION, rows)
+                    imported += len(rows)
+                self.connection.execute(MARK_LEDGER_IMPORTED, (ledger.profile_id, ledger_path, time.time()))
+
+        os.replace(ledger_path, f"{ledger_path}.imported")  # Kept as a backup
+        logging.info(f"Imported {imported} transaction(s) from {ledger_path}")
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+class SQLiteLedger:
+    """Transaction ledger backed by `SQLiteProfileStore`, with the same API as `Ledger`."""
+
+    def __init__(self, store, profile_id):
+        self.store = store
+        self.profile_id = profile_id
+
+    def __len__(self):
+        with self.store.lock:
+            return self.store.connection.execute(COUNT_TRANSACTIONS, (self.profile_id,)).fetchone()[0]
+
+    def add_transaction(self, transaction):
+        self.add_transactions([transaction])
+
+    def add_transactions(self, transactions):
+        """Insert a batch of `Transaction`s in one database transaction."""
+        rows = [self.to_row(transaction) for transaction in transactions]
+        with self.store.lock, self.store.connection:
+            self.store.connection.executemany(INSERT_TRANSACTION, rows)
+
+    def to_row(self, transaction):
+        """Encode a `Transaction` as `INSERT_TRANSACTION` parameters."""
+        return (self.profile_id, to_day(transaction.date), to_cents(transaction.amount), transaction.expense, transaction.category)
+
+    def iter_transactions(self, start=date.min, end=date.max, category=None):
+        """Stream the transactions between `start` and `end` (inclusive), oldest first."""
+        if category is None:
+            query, parameters = TRANSACTIONS_IN_RANGE, (self.profile_id, to_day(start), to_day(end))
+        else:
+            query, parameters = CATEGORY_TRANSACTIONS_IN_RANGE, (self.profile_id, category, to_day(start), to_day(end))
+        with self.store.lock:
+            cursor = self.store.connection.execute(query, parameters)
+        while True:
+            with self.store.lock:
+                rows = cursor.fetchmany(ITER_BATCH_SIZE)
+            if not rows:
+                break
+            for day, cents, expense, category in rows:
+                yield Transaction(from_day(day), cents / 100, expense, category)
+
+    def get_monthly_totals(self, months=12, end=None):
+        """Return spending for the `months` months ending with `end` (default: this month), oldest first."""
+        end = to_date(end or date.today())
+        keys = []
+        year, month = end.year, end.month
+        for _ in range(months):
+            keys.append(year * 100 + month)
+            year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+        keys.reverse()
+
+        with self.store.lock:
+            totals = dict(self.store.connection.execute(
+                MONTHLY_TOTALS, (self.profile_id, keys[0] * 100 + 1, keys[-1] * 100 + 31)
+            ).fetchall())
+        return [totals.get(key, 0) / 100 for key in keys]
+
+    def get_category_totals(self, year, month):
+        """Return `{category: amount}` spent in the given month."""
+        month_key = year * 100 + month
+        with self.store.lock:
+            rows = self.store.connection.execute(
+                CATEGORY_TOTALS, (self.profile_id, month_key * 100 + 1, month_key * 100 + 31)
+            ).fetchall()
+        return {category: cents / 100 for category, cents in rows}
+
+
+def get_profile_id(file_path):
+    return os.path.splitext(os.path.basename(file_path))[0]
+
+
+def to_day(value):
+    """Encode a date as an integer `YYYYMMDD`."""
+    value = to_date(value)
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def from_day(day):
+    return date(day // 10000, day // 100 % 100, day % 100)
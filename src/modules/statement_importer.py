@@ -0,0 +1,146 @@
+import os
+import re
+import logging
+import pandas as pd
+from src.constants import Transaction
+
+# Column names used by common bank and credit card exports, checked in order
+DATE_COLUMNS = ["Date", "Transaction Date", "Posted Date", "Posting Date", "Trans. Date"]
+DESCRIPTION_COLUMNS = ["Description", "Name", "Payee", "Merchant", "Memo"]
+AMOUNT_COLUMNS = ["Amount", "Transaction Amount"]
+DEBIT_COLUMNS = ["Debit", "Withdrawal", "Withdrawals"]
+CATEGORY_COLUMNS = ["Category"]
+
+UNCATEGORIZED = "Uncategorized"
+
+class StatementImporter:
+    """
+    Streams a bank or credit card CSV export into a transaction ledger.
+
+    The file is read `chunk_size` rows at a time and each chunk is parsed with vectorized
+    pandas operations, then appended to the ledger in batches of `batch_size`, so memory
+    stays flat no matter how long the statement is.
+    """
+
+    def __init__(self, ledger, categories=(), chunk_size=10000, batch_size=5000, expenses_negative=None):
+        self.ledger = ledger
+        self.category_names = {category.name for category in categories}
+        self.expense_categories = {
+            expense.name.lower(): category.name for category in categories for expense in category.expenses
+        }
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        # Most bank exports record spending as negative amounts; card exports often use positive.
+        # `None` detects the convention from the first chunk of each statement
+        self.expenses_negative = expenses_negative
+
+    def import_file(self, file_path, on_progress=None):
+        """
+        Import every spending row of `file_path` and return the number of transactions added.
+        `on_progress` is called after each chunk with `(rows_imported, fraction_of_file_read)`.
+        Raises `ValueError` if the statement has amounts but none of them are spending.
+        """
+        file_size = os.path.getsize(file_path) or 1
+        imported = 0
+        has_amounts = False
+        expenses_negative = self.expenses_negative
+
+        with open(file_path, "rb") as file:
+            reader = pd.read_csv(
+                file, chunksize=self.chunk_size, dtype=str, keep_default_na=False, skipinitialspace=True
+            )
+            columns = None
+            for chunk in reader:
+                if columns is None:
+                    columns = self.detect_columns(chunk.columns)
+                if expenses_negative is None and columns["amount"]:
+                    expenses_negative = detect_expenses_negative(parse_amounts(chunk[columns["amount"]]))
+
+                if not has_amounts:  # Usually settled by the first chunk
+                    has_amounts = parse_amounts(chunk[columns["amount"] or columns["debit"]]).notna().any()
+                transactions = self.parse_chunk(chunk, columns, expenses_negative)
+                for start in range(0, len(transactions), self.batch_size):
+                    self.ledger.add_transactions(transactions[start:start + self.batch_size])
+                imported += len(transactions)
+
+                if on_progress:
+                    on_progress(imported, min(file.tell() / file_size, 1.0))
+
+        if has_amounts and not imported:
+            raise ValueError(f"No spending rows found in {file_path}, check the statement's sign convention")
+
+        logging.info(f"Imported {imported} transaction(s) from {file_path}")
+        return imported
+
+    def detect_columns(self, column_names):
+        """Map the statement's headers to the fields a transaction needs."""
+        def find(candidates):
+            lookup = {name.strip().lower(): name for name in column_names}
+            return next((lookup[name.lower()] for name in candidates if name.lower() in lookup), None)
+
+        columns = {
+            "date": find(DATE_COLUMNS),
+            "description": find(DESCRIPTION_COLUMNS),
+            "amount": find(AMOUNT_COLUMNS),
+            "debit": find(DEBIT_COLUMNS),
+            "category": find(CATEGORY_COLUMNS),
+        }
+        if not columns["date"] or not (columns["amount"] or columns["debit"]):
+            raise ValueError(f"Unrecognized statement columns: {list(column_names)}")
+        return columns
+
+    def parse_chunk(self, chunk, columns, expenses_negative=True):
+        """Convert a chunk of raw rows into `Transaction`s, dropping credits and unreadable rows."""
+        dates = pd.to_datetime(chunk[columns["date"]], errors="coerce")
+
+        if columns["amount"]:
+            amounts = parse_amounts(chunk[columns["amount"]])
+            amounts = -amounts if expenses_negative else amounts
+        else:
+            amounts = parse_amounts(chunk[columns["debit"]]).abs()
+
+        descriptions = chunk[columns["description"]].str.strip() if columns["description"] else pd.Series("", index=chunk.index)
+        if columns["category"]:
+            categories = chunk[columns["category"]].str.strip()
+        else:
+            categories = pd.Series("", index=chunk.index)
+
+        spending = dates.notna() & (amounts > 0)
+        return [
+            Transaction(day.date(), float(amount), description, self.map_category(category, description))
+            for day, amount, description, category in zip(
+                dates[spending], amounts[spending], descriptions[spending], categories[spending]
+            )
+        ]
+
+    def map_category(self, category, description):
+        """Use the statement's category if the profile has it, otherwise match the description to an expense."""
+        if category in self.category_names:
+            return category
+        return self.expense_categories.get(description.lower(), UNCATEGORIZED)
+
+
+def parse_amount(value):
+    """Normalize amounts like `$1,234.56`, `(12.50)` or `-5` to a float rounded to cents."""
+    text = str(value).strip()
+    digits = re.sub(r"[^\d.]", "", text)
+    if not digits or digits.count(".") > 1:
+        raise ValueError(f"Invalid amount: {value!r}")
+    amount = round(float(digits), 2)
+    return -amount if text.startswith(("(", "-")) or text.startswith("$-") else amount
+
+
+def detect_expenses_negative(amounts):
+    """
+    Guess whether a statement records spending as negative amounts.
+    Spending rows outnumber deposits or card payments, so the more common sign is taken as spending.
+    """
+    return bool((amounts < 0).sum() >= (amounts > 0).sum())
+
+
+def parse_amounts(values):
+    """Vectorized `parse_amount` for a column of strings; unreadable values become NaN."""
+    text = values.astype(str).str.strip()
+    amounts = pd.to_numeric(text.str.replace(r"[^\d.]", "", regex=True), errors="coerce").round(2)
+    negative = text.str.startswith("(") | text.str.startswith("-") | text.str.startswith("$-")
+    return amounts.where(~negative, -amounts)
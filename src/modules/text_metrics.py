@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from src.constants import text_metrics_cache_size
+
+ELLIPSIS = "..."
+
+def measure_text(text, font_name, font_size, bold):
+    """Return the rendered `(width, height)` of `text` using the font's real metrics."""
+    from kivy.core.text import Label as CoreLabel  # Imported here so the cache can be used without a window
+
+    label = CoreLabel(text=text, font_name=font_name, font_size=font_size, bold=bold)
+    return label.get_extents(text)
+
+
+class TextMetrics:
+    """
+    Text measurements memoized in a least recently used cache keyed by `(text, font, size, bold)`.
+    Ellipsized strings are cached by the same key plus the width, so truncating a label that
+    was already laid out at that width is a single lookup.
+    """
+
+    def __init__(self, max_entries=text_metrics_cache_size, measure=measure_text):
+        self.max_entries = max_entries
+        self.measure = measure
+        self.entries = OrderedDict()  # key -> size or truncated text, least recently used first
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key, compute):
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+            return value
+
+        value = compute()
+        self.entries[key] = value
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def get_text_size(self, text, font_name, font_size, bold=False):
+        """Return the `(width, height)` of `text` in pixels."""
+        key = ("size", text, font_name, font_size, bold)
+        return self.lookup(key, lambda: tuple(self.measure(text, font_name, font_size, bold)))
+
+    def get_text_width(self, text, font_name, font_size, bold=False):
+        return self.get_text_size(text, font_name, font_size, bold)[0]
+
+    def truncate(self, text, width, font_name, font_size, bold=False):
+        """Return `text`, or its longest prefix followed by '...', that fits in `width` pixels."""
+        key = ("truncate", text, font_name, font_size, bold, int(width))
+        return self.lookup(key, lambda: self.fit_text(text, int(width), font_name, font_size, bold))
+
+    def fit_text(self, text, width, font_name, font_size, bold):
+        if self.get_text_width(text, font_name, font_size, bold) <= width:
+            return text
+
+        # Binary search for the longest prefix that still fits with the ellipsis
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.get_text_width(text[:middle] + ELLIPSIS, font_name, font_size, bold) <= width:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low] + ELLIPSIS
+
+    def clear(self):
+        self.entries.clear()
+
+
+_text_metrics = TextMetrics()
+
+def get_text_metrics():
+    """Return the text measurement cache shared by every label."""
+    return _text_metrics
@@ -0,0 +1,71 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+from src.constants import chart_texture_cache_bytes
+
+# A rendered chart: the texture shown on screen, the Agg background hover artists are blitted
+# over, and the RGBA bytes used to give a widget its own copy of the texture before a blit
+CachedChart = namedtuple("CachedChart", ["texture", "background", "buffer"])
+
+class TextureCache:
+    """
+    Least recently used cache of rendered charts, bounded by the bytes they hold.
+
+    Keys are `(chart type, data digest, width, height, dpi)`, so any widget showing the same
+    chart at the same size can reuse a render. Lookups may come from render workers, so every
+    operation holds a lock.
+    """
+
+    def __init__(self, max_bytes=chart_texture_cache_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = OrderedDict()  # key -> (value, size in bytes), least recently used first
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.entries
+
+    def get(self, key):
+        """Return the value cached under `key` (marking it as recently used), or `None`."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size_bytes):
+        """Cache `value`, evicting the least recently used entries until it fits the budget."""
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+            if size_bytes > self.max_bytes:
+                return  # Would evict everything and still not fit
+
+            self.entries[key] = (value, size_bytes)
+            self.total_bytes += size_bytes
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+
+_texture_cache = TextureCache()
+
+def get_texture_cache():
+    """Return the cache shared by every chart widget."""
+    return _texture_cache
+
+
+def get_data_digest(*parts):
+    """Return a short digest of the values a chart is drawn from (lists, tuples, numbers and strings)."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
@@ -0,0 +1,57 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+class WriteBehindSaver:
+    """
+    Coalesces bursts of save requests into a single write on a background thread.
+
+    Each `schedule` call restarts the debounce window. When the window closes, the
+    data snapshot is taken on the main thread (so it is consistent with the UI) and
+    handed to a single worker for serialization and disk I/O. A failed write is reported
+    through `on_failed` instead of `on_saved`, so the data is never shown as saved.
+    """
+
+    def __init__(self, write, on_saved=None, on_failed=None, debounce=0.5, clock=None):
+        if clock is None:
+            from kivy.clock import Clock as clock  # Imported here so tests can drive the saver with their own clock
+        self.write = write  # Callable taking (file_path, data)
+        self.on_saved = on_saved  # Called on the main thread with the file path once it is durable
+        self.on_failed = on_failed  # Called on the main thread with the file path and the error
+        self.debounce = debounce
+        self.clock = clock
+        self.executor = ThreadPoolExecutor(max_workers=1)  # One writer keeps saves ordered
+        self._pending = {}  # file_path -> callable returning the data to write
+        self._trigger = clock.create_trigger(self._submit_pending, debounce)
+
+    def schedule(self, file_path, snapshot):
+        """Queue a save of `snapshot()` to `file_path` once edits settle."""
+        self._pending[file_path] = snapshot
+        self._trigger.cancel()
+        self._trigger()
+
+    def flush(self):
+        """Write everything pending now and wait until it is on disk."""
+        self._trigger.cancel()
+        self._submit_pending()
+        self.executor.submit(lambda: None).result()  # Wait for queued writes to drain
+
+    def close(self):
+        """Flush pending saves and stop the worker."""
+        self.flush()
+        self.executor.shutdown(wait=True)
+
+    def _submit_pending(self, *args):
+        pending, self._pending = self._pending, {}
+        for file_path, snapshot in pending.items():
+            self.executor.submit(self._write, file_path, snapshot())
+
+    def _write(self, file_path, data):
+        try:
+            self.write(file_path, data)
+        except Exception as e:
+            logging.error(f"Background save to {file_path} failed: {e}")
+            if self.on_failed:
+                self.clock.schedule_once(lambda dt, error=e: self.on_failed(file_path, error))
+            return
+        if self.on_saved:
+            self.clock.schedule_once(lambda dt: self.on_saved(file_path))
@@ -1,95 +1,125 @@
 from kivy.app import App
-from kivy.graphics import Color, Rectangle
+from kivy.properties import ListProperty, NumericProperty
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
-from kivy.uix.textinput import TextInput
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from src.data_manager import get_data_manager
 from src.modules.editable_label import EditableLabel
+from src.modules.inline_editor import get_inline_editor
 
 
-class BudgetView(BoxLayout):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.app = App.get_running_app()
-        self.active_profile = get_data_manager().get_active_profile()
-        self.populate_budget()
-    
-    def populate_budget(self):
-        """Populate the budget view with data from the active profile."""
-        budget = self.active_profile.get_budget() 
-
-        budget_info = self.ids.budget_info
-        budget_info.clear_widgets()
+class BudgetRow(RecycleDataViewBehavior, BoxLayout):
+    """One expense row of the budget table; row views are recycled as the table scrolls."""
+    row_index = NumericProperty(0)  # The row in `budget.names`/`budget.costs`, not the display order
+    row_color = ListProperty([0, 0, 0, 0])
 
-        # Add column titles in bold
-        column_titles = ["Category", "Name", "Monthly Budget"]
-        for title in column_titles:
-            budget_info.add_widget(
-                Label(text=title, bold=True, font_size=18, size_hint_y=None, height=30)
-            )
+    def refresh_view_attrs(self, rv, index, data):
+        """Show the row at `index` of the table's data in this view."""
+        self.table = rv
+        self.row_index = data["row_index"]
+        self.row_color = data["row_color"]
+        self.ids.category.text = data["category"]
+        self.ids.name.text = data["name"]
+        self.ids.cost.text = data["cost"]
 
-        # Add budget rows with alternating colors
-        row_colors = ["#14202E", "#2B4257"]  # Alternating colors
-        i = 0
-        for category in budget.categories:
-            active_expenses = [expense for expense in category.expenses if expense.name in budget.names]
+    def commit_cell(self, new_text, column_name):
+        self.table.dispatch("on_cell_commit", self.row_index, column_name, new_text)
 
-            for expense in active_expenses:
-                expense_name = expense.name  # 🔥 Extract name from named tuple
 
-                row_color = row_colors[i % len(row_colors)]
-                cost_index = budget.names.index(expense_name) if expense_name in budget.names else -1
-                cost_value = budget.costs[cost_index] if cost_index >= 0 else 0.0
+class BudgetTable(RecycleView):
+    """
+    Virtualized budget table. Only enough `BudgetRow` views to fill the visible area exist,
+    so memory and build time don't grow with the number of expenses.
+    """
+    __events__ = ["on_cell_commit"]
 
-                self.add_editable_cell(budget_info, category.name, i, "Category", row_color)
-                self.add_editable_cell(budget_info, expense_name, i, "Name", row_color)
-                self.add_editable_cell(budget_info, f"${cost_value:.2f}", i, "Cost per Month", row_color)
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.bind(scroll_y=self.commit_edit)
 
-                i += 1
-    
-            
-    def add_editable_cell(self, layout, text, row_index, column_name, background_color):
-        """
-        Add a label cell with inline editing capability.
-        """
-        editable_label = None
-        if (column_name == "Cost per Month"):
-            editable_label = EditableLabel(
-                text=text,
-                text_align="center",
-                text_format="money",
-            )
-        else:
-            editable_label = EditableLabel(
-                text=text,
-                text_align="center",
-            )
+    def commit_edit(self, *args):
+        """Close an edit open in this table; its row view may be recycled for another row once scrolled."""
+        editor = get_inline_editor()
+        if editor.cell is not None and getattr(editor.cell.parent, "table", None) is self:
+            editor.commit()
 
-        editable_label.bind(on_commit=lambda instance, new_text: self.update_budget_data(new_text, row_index, column_name))
+    def on_cell_commit(self, row_index, column_name, new_text): pass
 
-        with editable_label.canvas.before:
-            Color(*self.app.hex_to_rgba(background_color))
-            Rectangle(size=editable_label.size, pos=editable_label.pos)
 
-        editable_label.bind(size=self.app.update_rect, pos=self.app.update_rect)
+class BudgetView(BoxLayout):
+    row_colors = ["#14202E", "#2B4257"]  # Alternating colors
 
-        layout.add_widget(editable_label)
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.app = App.get_running_app()
+        self.active_profile = get_data_manager().get_active_profile()
+        self.row_positions = {}  # Budget row -> position in the table's data
+        self.ids.budget_table.bind(
+            on_cell_commit=lambda instance, row_index, column_name, new_text: self.update_budget_data(new_text, row_index, column_name)
+        )
+        get_data_manager().bind(
+            on_expense_cost_changed=self.on_expense_cost_changed,
+            on_expense_renamed=self.on_expense_renamed,
+            on_category_renamed=self.on_category_renamed,
+        )
+        self.populate_budget()
+    
+    def populate_budget(self):
+        """Build the table's data from the active profile; row views are created by the table as needed."""
+        budget = self.active_profile.get_budget() 
+        row_colors = [self.app.hex_to_rgba(color) for color in self.row_colors]
 
+        data = []
+        self.row_positions = {}
+        for category in budget.categories:
+            for cost_index in budget.get_category_rows(category.name):
+                self.row_positions[cost_index] = len(data)
+                data.append({
+                    "row_index": cost_index,
+                    "row_color": row_colors[len(data) % len(row_colors)],
+                    "category": category.name,
+                    "name": budget.names[cost_index],
+                    "cost": self.format_cost(budget.costs[cost_index]),
+                })
+
+        self.ids.budget_table.data = data
+
+    def format_cost(self, cost):
+        return "${:,.2f}".format(cost)  # Matches what a money cell shows after an edit
+
+    def update_row(self, row_index, **values):
+        """Replace the shown values of one budget row; only its view (if visible) is refreshed."""
+        position = self.row_positions.get(row_index)
+        if position is None:
+            return  # Uncategorized rows aren't listed
+        table = self.ids.budget_table
+        table.data[position] = dict(table.data[position], **values)
 
     def update_budget_data(self, new_text, row_index, column_name):
-        """Update the budget data in the active profile and save it."""
+        """Apply a cell edit to the active profile; the table is updated by the change events."""
         budget = self.active_profile.get_budget()
 
         if column_name == "Category":
-            budget.categories[row_index] = new_text
+            if not get_data_manager().rename_category(budget.get_row_category(row_index), new_text):
+                self.ids.budget_table.refresh_from_data()  # Rejected, put the old name back in the cell
         elif column_name == "Name":
-            budget.names[row_index] = new_text
+            get_data_manager().set_expense_name(row_index, new_text)
         elif column_name == "Cost per Month":
             try:
                 clean_value = new_text.replace("$", "").replace(",", "")
-                budget.costs[row_index] = round(float(clean_value), 2)
+                get_data_manager().set_expense_cost(row_index, round(float(clean_value), 2))
             except ValueError:
                 pass  # Ignore invalid input
-        
-        self.active_profile.budget = budget
-        get_data_manager().update_profile()
\ No newline at end of file
+
+    def on_expense_cost_changed(self, instance, change):
+        self.update_row(change.row, cost=self.format_cost(change.new))
+
+    def on_expense_renamed(self, instance, change):
+        if change.old_category != change.new_category:
+            self.populate_budget()  # Rows are grouped by category, so the row moves
+        else:
+            self.update_row(change.row, name=change.new)
+
+    def on_category_renamed(self, instance, change):
+        for row_index in self.active_profile.get_budget().get_category_rows(change.new):
+            self.update_row(row_index, category=change.new)
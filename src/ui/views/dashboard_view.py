@@ -1,13 +1,12 @@
 from kivy.uix.boxlayout import BoxLayout
 from kivy.clock import Clock
 from src.data_manager import get_data_manager
-from src.modules.pie_chart import PieChart
-from src.modules.bar_graph import BarGraph
-from src.modules.radial_graph import RadialPercentageTracker
+from src.modules.kivy_charts import KivyPieChart, KivyBarGraph, KivyRadialTracker
 from src.modules.budget import Budget
+from src.modules.deferred_updates import defer_while_hidden
+from src.constants import chart_backend
 from src.ui.views.budget_view import BudgetView
-from collections import defaultdict
-import matplotlib.pyplot as plt
+from datetime import date
 import random
 import os
 import threading
@@ -19,7 +18,19 @@ class DashboardView(BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.active_profile = get_data_manager().get_active_profile()
-        get_data_manager().bind(on_profile_update=self.on_budget_updated)
+        self.pie_charts = {}  # widget id -> PieChart, created on first render and updated in place
+        self.bar_graph = None
+        self.pie_chart_data = {}  # widget id -> (labels, values, percentages, colors) last shown
+        self.actual_mirrors_budget = False  # No spending recorded this month, the actual pie shows the budget
+        # Coalesces bursts of updates (and the initial layout) into one pie chart calculation per frame
+        self.refresh_pie_charts = Clock.create_trigger(self.start_pie_chart_calculation)
+        # Only budget changes that affect the charts; income and profile name edits don't
+        get_data_manager().bind(
+            on_expense_cost_changed=self.on_expense_cost_changed,
+            on_expense_renamed=self.on_expense_renamed,
+            on_category_renamed=self.on_category_renamed,
+        )
+        get_data_manager().bind(on_ledger_update=self.on_ledger_updated)
         Clock.schedule_once(self.initialize_widgets)
 
     def initialize_widgets(self, *args):
@@ -29,31 +40,104 @@ class DashboardView(BoxLayout):
         self.add_radial_tracker("radial_budget_progress", budget_percentage=30)
         self.add_bar_graph("monthly_spending_summary")
 
+    @defer_while_hidden
     def on_budget_updated(self, *args):
         """
         Handle budget updates and refresh the pie charts.
         """
+        self.refresh_pie_charts()
+
+    def on_expense_cost_changed(self, instance, change):
+        self.adjust_pie_values({change.category: change.new - change.old})
+
+    def on_expense_renamed(self, instance, change):
+        if change.old_category != change.new_category:
+            self.adjust_pie_values({change.old_category: -change.cost, change.new_category: change.cost})
+
+    def on_category_renamed(self, instance, change):
+        self.update_pie_charts(lambda labels, values: (
+            [change.new if label == change.old else label for label in labels], values
+        ))
+
+    def adjust_pie_values(self, differences):
+        """Add `{category: difference}` to the charted category totals."""
+        differences.pop(None, None)  # Uncategorized rows aren't charted
+
+        def adjust(labels, values):
+            values = list(values)
+            for category, difference in differences.items():
+                values[labels.index(category)] += difference
+            return labels, values
+
+        if differences:
+            self.update_pie_charts(adjust, categories=differences)
+
+    def update_pie_charts(self, update, categories=()):
+        """
+        Apply `update(labels, values) -> (labels, values)` to the data the pie charts show, without
+        recalculating it from the budget. The actual pie is included while it mirrors the budget.
+        Falls back to a full calculation when the charts aren't shown or don't have a wedge for
+        every category in `categories`.
+        """
+        widget_ids = ["budget_category_pie_chart"]
+        if self.actual_mirrors_budget:
+            widget_ids.append("actual_category_pie_chart")
+
+        for widget_id in widget_ids:
+            data = self.pie_chart_data.get(widget_id)
+            if self.get_root_window() is None or data is None or not set(categories) <= set(data[0]):
+                self.on_budget_updated()
+                return
+
+        for widget_id in widget_ids:
+            labels, values, _, _ = self.pie_chart_data[widget_id]
+            labels, values = update(labels, values)
+            if len(set(labels)) != len(labels):
+                self.on_budget_updated()  # Two wedges would share a label, recalculate instead of merging them
+                return
+            self.render_pie_chart(widget_id, *self.build_pie_chart_data(dict(zip(labels, values))))
+
+    @defer_while_hidden
+    def on_ledger_updated(self, *args):
+        """
+        Handle new transactions by refreshing the spending charts.
+        """
+        self.add_bar_graph("monthly_spending_summary")
+        self.refresh_pie_charts()
+
+    def start_pie_chart_calculation(self, *args):
         threading.Thread(target=self.calculate_pie_chart_data, daemon=True).start()
 
     def calculate_pie_chart_data(self):
         """
         Perform pie chart calculations in a background thread.
-        Aggregate expenses at the category level before plotting.
+        Category totals are maintained by the budget as costs change, so this is O(categories).
         """
         budget = self.active_profile.get_budget()
 
-        category_totals = defaultdict(float)
-
-        for category in budget.categories:
-            for expense in category.expenses:
-                expense_name = expense.name
-                if expense_name in budget.names:
-                    expense_index = budget.names.index(expense_name)
-                    category_totals[category.name] += budget.costs[expense_index]
+        category_totals = budget.get_category_totals()
                     
         if not category_totals:
             return  # Avoid updating with empty data
-                    
+
+        # Actual spending comes from the ledger's rollups for this month
+        today = date.today()
+        actual_totals = get_data_manager().get_ledger().get_category_totals(today.year, today.month)
+        self.actual_mirrors_budget = not actual_totals
+        if not actual_totals:
+            actual_totals = category_totals  # Nothing recorded yet, mirror the budget
+
+        budget_data = self.build_pie_chart_data(category_totals)
+        actual_data = self.build_pie_chart_data(actual_totals)
+
+        # Schedule the rendering on the main thread
+        Clock.schedule_once(lambda dt: self.render_pie_chart("budget_category_pie_chart", *budget_data))
+        Clock.schedule_once(lambda dt: self.render_pie_chart("actual_category_pie_chart", *actual_data))
+
+    def build_pie_chart_data(self, category_totals):
+        """
+        Convert `{category: total}` into the labels, values, percentages and colors of a pie chart.
+        """
         labels = list(category_totals.keys())
         values = list(category_totals.values())
         
@@ -61,57 +145,75 @@ class DashboardView(BoxLayout):
         percentages = [round((cost / total_cost) * 100, 2) for cost in values]
         
         colors = [self.active_profile.get_category_color(category) for category in labels]
-
-        # Schedule the rendering on the main thread
-        Clock.schedule_once(lambda dt: self.render_pie_chart("budget_category_pie_chart", labels, values, percentages, colors))
-        Clock.schedule_once(lambda dt: self.render_pie_chart("actual_category_pie_chart", labels, values, percentages, colors))
+        return labels, values, percentages, colors
 
     def render_pie_chart(self, widget_id, labels, values, percentages, colors):
         """
-        Render and update the pie chart on the main thread.
+        Update the pie chart on the main thread, creating its widget the first time.
         """
-        plt.close("all")
+        pie_chart_widget = self.pie_charts.get(widget_id)
+        if pie_chart_widget is None:
+            pie_chart_widget = self.create_pie_chart(widget_id)
 
-        # Create the Matplotlib figure
-        fig, ax = plt.subplots(figsize=(5, 5))
-        fig.patch.set_facecolor("none")
-        fig.subplots_adjust(left=0, right=1, top=0.8, bottom=0)
+        self.pie_chart_data[widget_id] = (labels, values, percentages, colors)
+        pie_chart_widget.update_data(values, percentages, colors, labels)
 
-        if widget_id == "budget_category_pie_chart":
-            ax.set_title("Budgeted", fontsize=12, fontweight="bold", color="#FFFFFF", pad=10)
-        elif widget_id == "actual_category_pie_chart":
-            ax.set_title("Actual", fontsize=12, fontweight="bold", color="#FFFFFF", pad=10)
-        ax.set_facecolor("none")
-
-        wedges, _ = ax.pie(values, startangle=90, colors=colors)
-
-        # Attach metadata to wedges
-        for wedge, value, percentage in zip(wedges, values, percentages):
-            wedge.data_value = value
-            wedge.data_percentage = percentage
+    def create_pie_chart(self, widget_id):
+        """
+        Build the long-lived widget of a pie chart; later refreshes only update its wedges.
+        """
+        if chart_backend == "kivy":
+            pie_chart_widget = KivyPieChart()
+        else:
+            pie_chart_widget = self.create_matplotlib_pie_chart()
 
-        pie_chart_widget = PieChart(fig)
         pie_chart_area = self.ids[widget_id]
         pie_chart_area.clear_widgets()
         pie_chart_area.add_widget(pie_chart_widget)
 
+        self.pie_charts[widget_id] = pie_chart_widget
+        return pie_chart_widget
+
+    def create_matplotlib_pie_chart(self):
+        # Imported here so the native backend never loads matplotlib
+        from matplotlib.figure import Figure
+        from src.modules.pie_chart import PieChart
+
+        # Figures are built without pyplot, which isn't safe to use from the render workers
+        fig = Figure(figsize=(5, 5))
+        ax = fig.add_subplot()
+        fig.patch.set_facecolor("none")
+        fig.subplots_adjust(left=0, right=1, top=1, bottom=0)  # The title is a label above the chart
+        ax.set_facecolor("none")
+
+        return PieChart(fig)
+
     def add_pie_chart(self, widget_id):
         pie_chart_area = self.ids[widget_id]
         pie_chart_area.bind(size=lambda instance, size: self.on_widget_ready(instance, size, widget_id))
 
     def on_widget_ready(self, instance, size, widget_id):
-        if size[0] > 0 and size[1] > 0:  # Ensure size is valid
-            threading.Thread(target=self.calculate_pie_chart_data, daemon=True).start()
+        # Only the first valid size needs data; after that the chart coalesces its own resizes
+        if size[0] > 0 and size[1] > 0 and widget_id not in self.pie_charts:
+            self.refresh_pie_charts()
 
     def add_radial_tracker(self, widget_id, budget_percentage):
         tracker_area = self.ids[widget_id]
     
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(5, 5))
-        fig.patch.set_facecolor('none')  # Transparent figure background
+        if chart_backend == "kivy":
+            tracker = KivyRadialTracker(budget_percentage)
+        else:
+            from matplotlib.figure import Figure
+            from src.modules.radial_graph import RadialPercentageTracker
+
+            # Create figure and axis
+            fig = Figure(figsize=(5, 5))
+            ax = fig.add_subplot()
+            fig.patch.set_facecolor('none')  # Transparent figure background
+
+            # Create the tracker widget
+            tracker = RadialPercentageTracker(fig, ax, budget_percentage)
 
-        # Create the tracker widget
-        tracker = RadialPercentageTracker(fig, ax, budget_percentage)
         # Add the tracker to the widget
         tracker_area.clear_widgets()
         tracker_area.add_widget(tracker)
@@ -119,20 +221,32 @@ class DashboardView(BoxLayout):
     def add_bar_graph(self, widget_id):
         bar_graph_area = self.ids[widget_id]
         
-        # Example spending data with last 3 months as 0
-        monthly_spending = [500, 650, 700, 450, 800, 900, 1000, 850, 750, 0, 0, 0]
+        # Trailing 12 months of spending, read from the ledger's monthly rollups
+        monthly_spending = get_data_manager().get_ledger().get_monthly_totals(months=12)
+
+        if self.bar_graph is not None:
+            self.bar_graph.update_data(monthly_spending)  # Keep the existing figure, only the bars change
+            return
+
+        if chart_backend == "kivy":
+            bar_graph = KivyBarGraph(spending_data=monthly_spending)
+        else:
+            from matplotlib.figure import Figure
+            from src.modules.bar_graph import BarGraph
 
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(8, 4))
-        fig.patch.set_facecolor('none')  # Transparent figure background
-        ax.set_facecolor('none')
+            # Create figure and axis
+            fig = Figure(figsize=(8, 4))
+            ax = fig.add_subplot()
+            fig.patch.set_facecolor('none')  # Transparent figure background
+            ax.set_facecolor('none')
 
-        # Create the bar graph widget
-        bar_graph = BarGraph(spending_data=monthly_spending, fig=fig, ax=ax)
+            # Create the bar graph widget
+            bar_graph = BarGraph(spending_data=monthly_spending, fig=fig, ax=ax)
 
         # Add the bar graph to the widget
         bar_graph_area.clear_widgets()
         bar_graph_area.add_widget(bar_graph)
+        self.bar_graph = bar_graph
         
     def add_budget_view(self, widget_id):
         budget_view = BudgetView()
@@ -29,12 +29,10 @@ class ProfileView(BoxLayout):
         budget_view_area.add_widget(budget_view)
         
     def update_income(self, new_income):
-        self.active_profile.income = float(new_income)
-        get_data_manager().update_profile()
+        get_data_manager().set_income(float(new_income))
         self.monthly_income = float(new_income)
 
     def update_profile_name(self, new_name):
         """Update the profile name and save it."""
-        self.active_profile.name = new_name
-        get_data_manager().update_profile()
+        get_data_manager().set_profile_name(new_name)
         self.profile_name = new_name
\ No newline at end of file
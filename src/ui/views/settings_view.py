@@ -4,8 +4,6 @@ from src.data_manager import get_data_manager
 class SettingsView(BoxLayout):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        from src.modules.content_area import SettingsArea
-        self.settings_area = SettingsArea()
         self.active_profile = get_data_manager().get_active_profile().id
 
     def switch_screen(self, screen_name):
@@ -0,0 +1,83 @@
+import unittest
+import numpy as np
+from src.constants import ExpenseTemplate, default_categories
+from src.modules.budget import Budget
+from src.modules.budget_allocation import allocate_budgets, get_expense_rows, get_percentages, round_cents
+
+
+class TestBudgetAllocation(unittest.TestCase):
+    def test_rows_follow_ownership(self):
+        renter_names, _, _ = get_expense_rows(default_categories, is_home_owner=False, is_vehicle_owner=False)
+        owner_names, _, _ = get_expense_rows(default_categories, is_home_owner=True, is_vehicle_owner=True)
+
+        self.assertIn("Rent", renter_names)
+        self.assertIn("Public Transportation", renter_names)
+        self.assertNotIn("Mortgage", renter_names)
+        self.assertIn("Mortgage", owner_names)
+        self.assertIn("Car Payment", owner_names)
+
+    def test_batch_allocation_matches_single_budgets(self):
+        incomes = [2500, 5000, 12000]
+        names, table = allocate_budgets(incomes, default_categories)
+
+        self.assertEqual(table.shape, (len(incomes), len(names)))
+        for income, costs in zip(incomes, table):
+            budget = Budget(income)
+            self.assertEqual(budget.names, names)
+            self.assertEqual(budget.costs, costs.tolist())
+
+    def test_allocation_scales_with_category_weight(self):
+        names, table = allocate_budgets([5000], default_categories)
+        # Rent is 70% of the 27.5% housing allocation
+        self.assertAlmostEqual(table[0][names.index("Rent")], 962.5)
+
+    def test_rounding_matches_scalar_round(self):
+        templates = {category.name: [] for category in default_categories}
+        templates["Transportation"] = [ExpenseTemplate("Gas", 0.5, None)]
+        categories = [category._replace(weight=0.1) if category.name == "Transportation" else category for category in default_categories]
+
+        # The last two land on half-cent ties that np.round would round the other way
+        for income in [1234.1, 2345.9, 4321.7, 9876.3]:
+            names, table = allocate_budgets([income], categories, templates=templates)
+            self.assertEqual(table[0][names.index("Gas")], round(round(income * 0.1, 2) * 0.5, 2))
+
+    def test_custom_weights_are_applied(self):
+        budget_weights = {"Transportation": 0.2}
+        names, table = allocate_budgets([5000], default_categories, budget_weights=budget_weights)
+        _, default_table = allocate_budgets([5000], default_categories)
+
+        # Gas is 30% of the transportation allocation
+        self.assertAlmostEqual(table[0][names.index("Gas")], 300.0)
+        self.assertAlmostEqual(table[0][names.index("Rent")], default_table[0][names.index("Rent")])
+
+        budget = Budget(5000, custom_weights=budget_weights)
+        self.assertEqual(budget.costs, table[0].tolist())
+
+    def test_round_cents_matches_round(self):
+        values = np.concatenate([
+            np.arange(-4000, 4000) / 8,  # Exact half-cent ties
+            np.round(np.random.default_rng(0).uniform(-20000, 20000, 5000), 2) * 0.5,
+        ])
+        self.assertEqual(round_cents(values).tolist(), [round(float(value), 2) for value in values])
+
+    def test_weights_per_income(self):
+        incomes = [3000, 5000, 8000]
+        weight_sets = [{}, {"Transportation": 0.2}, {"Housing & Utilities": 0.35, "Transportation": 0.05}]
+        budget_weights = [
+            [weights.get(category.name, category.weight) for category in default_categories] for weights in weight_sets
+        ]
+        names, table = allocate_budgets(incomes, default_categories, budget_weights=np.array(budget_weights))
+
+        for income, weights, costs in zip(incomes, weight_sets, table):
+            _, expected = allocate_budgets([income], default_categories, budget_weights=weights)
+            self.assertEqual(costs.tolist(), expected[0].tolist())
+        # Gas is 30% of each row's own transportation allocation
+        self.assertEqual(table[:, names.index("Gas")].tolist(), [112.5, 300.0, 120.0])
+
+    def test_percentages(self):
+        percentages = get_percentages(np.array([[25.0, 75.0], [0.0, 0.0]]))
+        self.assertEqual(percentages.tolist(), [[25.0, 75.0], [0.0, 0.0]])
+        self.assertEqual(Budget(5000).get_category_percentages().sum().round(6), 100.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+from src.modules.budget import Budget
+
+
+class TestBudgetTotals(unittest.TestCase):
+    def setUp(self):
+        self.budget = Budget(5000)
+
+    def recomputed_totals(self):
+        return Budget(
+            self.budget.income, categories=self.budget.categories,
+            names=list(self.budget.names), costs=list(self.budget.costs)
+        ).get_category_totals()
+
+    def test_totals_match_rows(self):
+        self.assertAlmostEqual(self.budget.get_total(), round(sum(self.budget.costs), 2))
+        self.assertAlmostEqual(sum(self.budget.get_category_totals().values()), sum(
+            cost for row, cost in enumerate(self.budget.costs) if self.budget.get_row_category(row)
+        ))
+
+    def test_set_cost_updates_totals(self):
+        row = self.budget.names.index("Gas")
+        total = self.budget.get_total()
+        transportation = self.budget.get_category_totals()["Transportation"]
+
+        self.budget.set_cost(row, self.budget.costs[row] + 10)
+
+        self.assertAlmostEqual(self.budget.get_total(), total + 10)
+        self.assertAlmostEqual(self.budget.get_category_totals()["Transportation"], transportation + 10)
+        self.assertEqual(self.budget.get_category_totals(), self.recomputed_totals())
+
+    def test_set_name_moves_cost_between_categories(self):
+        row = self.budget.names.index("Gas")
+        self.budget.set_name(row, "Groceries")
+
+        self.assertEqual(self.budget.get_row_category(row), "Food & Essentials")
+        for category, total in self.recomputed_totals().items():
+            self.assertAlmostEqual(self.budget.get_category_totals()[category], total)
+
+    def test_rename_category(self):
+        total = self.budget.get_category_totals()["Transportation"]
+        self.budget.rename_category("Transportation", "Getting Around")
+
+        self.assertNotIn("Transportation", self.budget.get_category_totals())
+        self.assertEqual(self.budget.get_category_totals()["Getting Around"], total)
+        self.assertIn("Getting Around", self.budget.budget_weights)
+
+    def test_indexes_follow_renamed_rows(self):
+        row = self.budget.get_row("Gas")
+        self.budget.set_name(row, "Groceries")
+
+        self.assertIsNone(self.budget.get_row("Gas"))
+        self.assertEqual(self.budget.get_row("Groceries"), row)
+        self.assertNotIn(row, self.budget.get_category_rows("Transportation"))
+        self.assertIn(row, self.budget.get_category_rows("Food & Essentials"))
+
+    def test_category_lookup_follows_renamed_category(self):
+        rows = self.budget.get_category_rows("Transportation")
+        self.budget.rename_category("Transportation", "Getting Around")
+
+        self.assertIsNone(self.budget.get_category("Transportation"))
+        self.assertEqual(self.budget.get_category("Getting Around").color, "#21B6A8")
+        self.assertEqual(self.budget.get_category_rows("Getting Around"), rows)
+
+    def test_rename_category_rejects_existing_name(self):
+        totals = self.budget.get_category_totals()
+        with self.assertRaises(ValueError):
+            self.budget.rename_category("Transportation", "Food & Essentials")
+
+        self.assertEqual(self.budget.get_category_totals(), totals)
+        self.assertIsNotNone(self.budget.get_category("Transportation"))
+        self.assertEqual(self.budget.get_category_rows("Food & Essentials"), self.recomputed_rows("Food & Essentials"))
+
+    def recomputed_rows(self, category_name):
+        return [row for row in range(len(self.budget.names)) if self.budget.get_row_category(row) == category_name]
+
+if __name__ == '__main__':
+    unittest.main()
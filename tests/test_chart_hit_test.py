@@ -0,0 +1,35 @@
+import unittest
+from src.modules.chart_hit_test import BarHitTest, PieHitTest
+
+
+class TestChartHitTest(unittest.TestCase):
+    def setUp(self):
+        # A quarter, a quarter and a half, starting at 12 o'clock like the dashboard pies
+        self.pie = PieHitTest((100, 100), 50, [(90, 180), (180, 270), (270, 450)])
+
+    def test_pie_finds_wedge_by_angle(self):
+        self.assertEqual(self.pie.find(80, 120), 0)  # Upper left
+        self.assertEqual(self.pie.find(80, 80), 1)  # Lower left
+        self.assertEqual(self.pie.find(120, 80), 2)  # Lower right
+        self.assertEqual(self.pie.find(120, 120), 2)  # Upper right wraps past 360 degrees
+
+    def test_pie_radius(self):
+        self.assertIsNone(self.pie.find(100, 152))
+        self.assertEqual(self.pie.find(100, 152, enlarged=0), 0)  # The highlighted wedge is drawn larger
+        self.assertIsNone(self.pie.find(100, 160, enlarged=0))
+
+    def test_empty_pie(self):
+        self.assertIsNone(PieHitTest((0, 0), 10, []).find(1, 1))
+        self.assertIsNone(PieHitTest((0, 0), 10, [(90, 90), (90, 90)]).find(1, 1))
+
+    def test_bars(self):
+        bars = BarHitTest([(30, 0, 40, 50), (10, 0, 20, 80), (50, 10, 60, 0)])
+        self.assertEqual(bars.find(15, 40), 1)
+        self.assertEqual(bars.find(35, 40), 0)
+        self.assertEqual(bars.find(55, 5), 2)  # Extents are normalized
+        self.assertIsNone(bars.find(35, 60))  # Above the bar
+        self.assertIsNone(bars.find(25, 10))  # Between bars
+        self.assertIsNone(bars.find(5, 10))
+
+if __name__ == '__main__':
+    unittest.main()
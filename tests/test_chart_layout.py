@@ -0,0 +1,23 @@
+import unittest
+from src.modules.chart_layout import get_day_suffix, get_display_months, get_spending_ticks, get_wedge_angles
+
+
+class TestChartLayout(unittest.TestCase):
+    def test_wedge_angles(self):
+        self.assertEqual(get_wedge_angles([1, 1, 2]), [(90, 180), (180, 270), (270, 450)])
+        self.assertEqual(get_wedge_angles([0, 0]), [(90, 90), (90, 90)])
+
+    def test_display_months_wrap_into_last_year(self):
+        self.assertEqual(get_display_months(6, month=3), ["Oct", "Nov", "Dec", "Jan", "Feb", "Mar"])
+        self.assertEqual(get_display_months(6, month=12), ["Jul", "Aug", "Sep", "Oct", "Nov", "Dec"])
+
+    def test_spending_ticks(self):
+        self.assertEqual(get_spending_ticks(1234), ([0, 250, 500, 750, 1000, 1250], 1250))
+        self.assertEqual(get_spending_ticks(0), ([0, 50], 50))
+
+    def test_day_suffix(self):
+        self.assertEqual([get_day_suffix(day) for day in (1, 2, 3, 4, 11, 12, 13, 21, 22, 31)],
+                         ["st", "nd", "rd", "th", "th", "th", "th", "st", "nd", "st"])
+
+if __name__ == '__main__':
+    unittest.main()
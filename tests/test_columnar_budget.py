@@ -0,0 +1,63 @@
+import unittest
+import os
+import shutil
+import tempfile
+import numpy as np
+from src.constants import default_categories
+from src.modules.columnar_budget import ColumnarProfileStore, get_category_totals
+from src.modules.profile_store import PickleProfileStore
+
+
+class TestColumnarProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.data_dir, "profile.dat")
+        self.profile = {
+            "profile_id": "profile",
+            "profile_name": "Default Profile",
+            "income": 5000.0,
+            "budget": {
+                "income": 5000.0,
+                "categories": default_categories,
+                "names": ["Rent", "Gas", "Lottery Tickets"],
+                "costs": [1200.0, 80.0, 5.0],
+                "budget_weights": {},
+            },
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_round_trip(self):
+        store = ColumnarProfileStore()
+        store.save(self.file_path, self.profile)
+        loaded = store.load(self.file_path)
+
+        self.assertEqual(loaded["profile_name"], "Default Profile")
+        self.assertEqual(loaded["budget"]["names"], ["Rent", "Gas", "Lottery Tickets"])
+        self.assertEqual(loaded["budget"]["categories"], default_categories)
+        self.assertIsInstance(loaded["budget"]["costs"], np.ndarray)
+        self.assertEqual(loaded["budget"]["costs"].tolist(), [1200.0, 80.0, 5.0])
+        self.assertEqual(loaded["budget"]["category_ids"].tolist(), [0, 1, -1])
+
+    def test_names_are_deduplicated(self):
+        self.profile["budget"]["names"] = ["Rent", "Gas", "Gas", "Rent"]
+        self.profile["budget"]["costs"] = [1200.0, 40.0, 40.0, 300.0]
+        store = ColumnarProfileStore()
+        store.save(self.file_path, self.profile)
+
+        with open(self.file_path, "rb") as file:
+            self.assertEqual(file.read().count(b"Gas"), 1)
+        self.assertEqual(store.load(self.file_path)["budget"]["names"], ["Rent", "Gas", "Gas", "Rent"])
+
+    def test_reads_pickle_profiles(self):
+        PickleProfileStore().save(self.file_path, self.profile)
+        loaded = ColumnarProfileStore().load(self.file_path)
+        self.assertEqual(loaded["budget"]["names"], self.profile["budget"]["names"])
+
+    def test_category_totals(self):
+        totals = get_category_totals(np.array([10.0, 5.0, 2.5]), np.array([1, -1, 1]), 3)
+        self.assertEqual(totals.tolist(), [0.0, 12.5, 0.0])
+
+if __name__ == '__main__':
+    unittest.main()
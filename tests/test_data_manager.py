@@ -0,0 +1,69 @@
+import shutil
+import tempfile
+import unittest
+from src.modules.profile_changes import (
+    ProfileRenamed, IncomeChanged, ExpenseCostChanged, ExpenseRenamed, CategoryRenamed
+)
+
+try:
+    from src.data_manager import DataManager
+except ImportError:  # DataManager is a Kivy EventDispatcher
+    DataManager = None
+
+
+@unittest.skipIf(DataManager is None, "Kivy is not installed")
+class TestDataManagerEvents(unittest.TestCase):
+    def setUp(self):
+        self.base_dir = tempfile.mkdtemp()
+        DataManager._instance = None  # A fresh singleton per test
+        self.data_manager = DataManager(self.base_dir, is_prod=False)
+        self.data_manager.load_profile(self.data_manager.create_new_profile("Test", income=5000))
+        self.budget = self.data_manager.get_active_profile().get_budget()
+
+        self.events = []
+        self.data_manager.bind(on_profile_update=lambda instance: self.events.append(("on_profile_update", None)))
+        for event in ["on_profile_renamed", "on_income_changed", "on_expense_cost_changed",
+                      "on_expense_renamed", "on_category_renamed"]:
+            self.data_manager.bind(**{event: lambda instance, change, event=event: self.events.append((event, change))})
+
+    def tearDown(self):
+        self.data_manager.close()
+        DataManager._instance = None
+        shutil.rmtree(self.base_dir)
+
+    def assertDispatched(self, event, change):
+        self.assertEqual(self.events, [(event, change), ("on_profile_update", None)])
+
+    def test_set_profile_name(self):
+        self.data_manager.set_profile_name("Renamed")
+        self.assertDispatched("on_profile_renamed", ProfileRenamed("Test", "Renamed"))
+
+    def test_set_income(self):
+        self.data_manager.set_income(6000)
+        self.assertDispatched("on_income_changed", IncomeChanged(5000, 6000))
+
+    def test_set_expense_cost(self):
+        row = self.budget.get_row("Gas")
+        old_cost = float(self.budget.costs[row])
+        self.data_manager.set_expense_cost(row, old_cost + 25)
+        self.assertDispatched("on_expense_cost_changed", ExpenseCostChanged(row, old_cost, old_cost + 25, "Transportation"))
+
+    def test_set_expense_name(self):
+        row = self.budget.get_row("Gas")
+        cost = float(self.budget.costs[row])
+        self.data_manager.set_expense_name(row, "Fuel")
+        self.assertDispatched(
+            "on_expense_renamed",
+            ExpenseRenamed(row, "Gas", "Fuel", cost, "Transportation", self.budget.get_row_category(row))
+        )
+
+    def test_rename_category(self):
+        self.assertTrue(self.data_manager.rename_category("Transportation", "Getting Around"))
+        self.assertDispatched("on_category_renamed", CategoryRenamed("Transportation", "Getting Around"))
+
+    def test_rejected_rename_dispatches_nothing(self):
+        self.assertFalse(self.data_manager.rename_category("Transportation", "Food & Essentials"))
+        self.assertEqual(self.events, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+from src.modules.deferred_updates import defer_while_hidden, flush_deferred_updates
+
+
+class FakeView:
+    def __init__(self):
+        self.shown = False
+        self.calls = []
+
+    def get_root_window(self):
+        return object() if self.shown else None
+
+    @defer_while_hidden
+    def refresh(self, value):
+        self.calls.append(value)
+
+
+class TestDeferredUpdates(unittest.TestCase):
+    def test_runs_immediately_while_shown(self):
+        view = FakeView()
+        view.shown = True
+        view.refresh(1)
+        self.assertEqual(view.calls, [1])
+
+    def test_hidden_updates_collapse_and_run_on_show(self):
+        view = FakeView()
+        view.refresh(1)
+        view.refresh(2)
+        flush_deferred_updates()
+        self.assertEqual(view.calls, [])  # Still hidden
+
+        view.shown = True
+        flush_deferred_updates()
+        self.assertEqual(view.calls, [2])
+
+        flush_deferred_updates()
+        self.assertEqual(view.calls, [2])  # Nothing left to catch up on
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+from src.modules.hover_manager import HoverManager
+
+
+class FakeWidget:
+    """Just enough of a widget for the hover index: a rectangle under an optional scrolling parent."""
+    def __init__(self, x, y, width, height, parent=None):
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self.parent = parent
+        self.bindings = {}
+        self.events = []
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def top(self):
+        return self.y + self.height
+
+    def bind(self, **kwargs):
+        for name, callback in kwargs.items():
+            self.bindings.setdefault(name, []).append(callback)
+
+    def unbind(self, **kwargs):
+        for name, callback in kwargs.items():
+            self.bindings[name].remove(callback)
+
+    def set(self, name, value):
+        setattr(self, name, value)
+        for callback in self.bindings.get(name, []):
+            callback(self, value)
+
+    def get_root_window(self):
+        return "window"
+
+    def offset(self):
+        return self.parent.offset() if self.parent else (0, 0)
+
+    def to_window(self, x, y):
+        dx, dy = self.offset()
+        return x + dx, y + dy
+
+    def to_widget(self, x, y):
+        dx, dy = self.offset()
+        return x - dx, y - dy
+
+    def collide_point(self, x, y):
+        return self.x <= x <= self.right and self.y <= y <= self.top
+
+    def hover_enter(self):
+        self.events.append("enter")
+
+    def hover_leave(self):
+        self.events.append("leave")
+
+
+class FakeScrollView(FakeWidget):
+    """Scrolling moves the children on screen without changing their `pos`."""
+    scroll_x = 0
+    scroll_y = 0
+
+    def offset(self):
+        return (0, -self.scroll_y)
+
+
+class TestHoverManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = HoverManager(cell_size=50)
+
+    def test_widgets_are_indexed_by_cells(self):
+        widget = FakeWidget(10, 10, 80, 20)
+        self.manager.register(widget)
+        self.manager.update_index()
+
+        self.assertEqual(set(self.manager.widgets[widget]), {(0, 0), (1, 0)})
+        self.assertIn(widget, self.manager.cells[(1, 0)])
+
+    def test_enter_and_leave(self):
+        first, second = FakeWidget(0, 0, 40, 40), FakeWidget(100, 0, 40, 40)
+        self.manager.register(first)
+        self.manager.register(second)
+
+        self.manager.on_mouse_pos(None, (20, 20))
+        self.manager.on_mouse_pos(None, (25, 25))
+        self.manager.on_mouse_pos(None, (120, 20))
+
+        self.assertEqual(first.events, ["enter", "leave"])
+        self.assertEqual(second.events, ["enter"])
+
+    def test_moved_widget_is_reindexed(self):
+        widget = FakeWidget(0, 0, 40, 40)
+        self.manager.register(widget)
+        self.manager.update_index()
+
+        widget.x = 200
+        widget.set("pos", (200, 0))
+        self.manager.on_mouse_pos(None, (20, 20))  # Where it was
+        self.manager.on_mouse_pos(None, (220, 20))
+        self.assertEqual(widget.events, ["enter"])
+
+    def test_scrolling_ancestor_marks_grid_stale(self):
+        scroll_view = FakeScrollView(0, 0, 200, 200)
+        widget = FakeWidget(0, 300, 40, 40, parent=scroll_view)
+        self.manager.register(widget)
+        self.manager.update_index()
+
+        scroll_view.set("scroll_y", 280)  # The widget is now at y=20 on screen, its `pos` is unchanged
+        self.manager.on_mouse_pos(None, (20, 30))
+        self.assertEqual(widget.events, ["enter"])
+
+    def test_hidden_widget_gets_leave(self):
+        widget = FakeWidget(0, 0, 40, 40)
+        self.manager.register(widget)
+        self.manager.on_mouse_pos(None, (20, 20))
+
+        widget.get_root_window = lambda: None  # Its screen was removed
+        self.manager.invalidate()
+        self.manager.update_index()
+        self.assertEqual(widget.events, ["enter", "leave"])
+
+
+if __name__ == "__main__":
+    unittest.main()
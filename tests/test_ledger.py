@@ -0,0 +1,86 @@
+import unittest
+import os
+import shutil
+import tempfile
+from datetime import date
+from src.constants import Transaction
+from src.modules.ledger import Ledger
+
+
+class TestLedger(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.ledger_path = os.path.join(self.data_dir, "profile.ledger")
+        self.transactions = [
+            Transaction(date(2025, 1, 3), 42.10, "Groceries", "Food & Essentials"),
+            Transaction(date(2025, 1, 20), 15.00, "Gas", "Transportation"),
+            Transaction(date(2025, 3, 1), 1200.00, "Rent", "Housing & Utilities"),
+            Transaction(date(2025, 3, 2), 7.90, "Groceries", "Food & Essentials"),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_monthly_rollups(self):
+        ledger = Ledger(self.ledger_path)
+        ledger.add_transactions(self.transactions)
+
+        totals = ledger.get_monthly_totals(months=3, end=date(2025, 3, 31))
+        self.assertEqual(totals, [57.10, 0.0, 1207.90])
+
+    def test_category_rollups(self):
+        ledger = Ledger(self.ledger_path)
+        ledger.add_transactions(self.transactions)
+
+        self.assertEqual(ledger.get_category_totals(2025, 3), {
+            "Housing & Utilities": 1200.00,
+            "Food & Essentials": 7.90,
+        })
+
+    def test_rollups_rebuilt_on_load(self):
+        ledger = Ledger(self.ledger_path)
+        ledger.add_transactions(self.transactions[:2])
+        ledger.add_transaction(self.transactions[2])
+
+        reloaded = Ledger(self.ledger_path)
+        self.assertEqual(len(reloaded), 3)
+        self.assertEqual(list(reloaded.iter_transactions()), self.transactions[:3])
+        self.assertEqual(reloaded.get_monthly_totals(months=12, end=date(2025, 3, 1))[-3:], [57.10, 0.0, 1200.00])
+
+    def test_monthly_totals_span_years(self):
+        ledger = Ledger(self.ledger_path)
+        ledger.add_transaction(Transaction(date(2024, 12, 31), 10.00, "Gas", "Transportation"))
+
+        self.assertEqual(ledger.get_monthly_totals(months=2, end=date(2025, 1, 15)), [10.0, 0.0])
+    def test_failed_batch_leaves_ledger_unchanged(self):
+        ledger = Ledger(self.ledger_path)
+        ledger.add_transactions(self.transactions[:1])
+        bad_batch = [
+            Transaction(date(2025, 2, 1), 2.00, "Coffee", "Food & Essentials"),
+            Transaction("not a date", 2.00, "Snacks", "Food & Essentials"),
+        ]
+        with self.assertRaises(ValueError):
+            ledger.add_transactions(bad_batch)
+
+        self.assertEqual(len(ledger), 1)
+        self.assertNotIn("Coffee", ledger.string_ids)
+        ledger.add_transaction(Transaction(date(2025, 2, 2), 4.00, "Coffee", "Food & Essentials"))
+
+        reloaded = Ledger(self.ledger_path)
+        self.assertEqual(len(reloaded), 2)
+        self.assertEqual(reloaded.get_monthly_totals(months=2, end=date(2025, 2, 1)), [42.10, 4.00])
+
+    def test_torn_tail_is_dropped_before_appending(self):
+        ledger = Ledger(self.ledger_path)
+        ledger.add_transactions(self.transactions[:2])
+        with open(self.ledger_path, "ab") as file:
+            file.write(b"T\x01\x02")  # A record cut short by a crash
+
+        reloaded = Ledger(self.ledger_path)
+        self.assertEqual(len(reloaded), 2)
+        reloaded.add_transaction(self.transactions[2])
+
+        self.assertEqual(list(Ledger(self.ledger_path).iter_transactions()), self.transactions[:3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import os
+import shutil
+import tempfile
+from src.modules.profile_manifest import ProfileManifest, ProfileEntry
+
+
+class TestProfileManifest(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.data_dir, "abc.dat")
+        with open(self.file_path, "wb") as file:
+            file.write(b"profile")
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def get_path(self, profile_id):
+        return os.path.join(self.data_dir, f"{profile_id}.dat")
+
+    def test_entries_persist_across_loads(self):
+        manifest = ProfileManifest(self.data_dir)
+        manifest.update("abc", "Household", self.file_path)
+
+        entry = ProfileManifest(self.data_dir).get("abc")
+        self.assertEqual(entry.name, "Household")
+        self.assertEqual(entry.size, len(b"profile"))
+
+    def test_sync_only_reads_unlisted_profiles(self):
+        manifest = ProfileManifest(self.data_dir)
+        manifest.update("abc", "Household", self.file_path)
+
+        loaded = []
+        def load_entry(profile_id):
+            loaded.append(profile_id)
+            return ProfileEntry(profile_id, "New", None, None, 1)
+
+        manifest.sync(["abc", "def"], load_entry, self.get_path)
+        self.assertEqual(loaded, ["def"])
+        self.assertEqual(len(manifest.list_entries()), 2)
+
+        # Profiles whose files disappeared are dropped
+        manifest.sync(["def"], load_entry, self.get_path)
+        self.assertIsNone(manifest.get("abc"))
+
+    def test_sync_reloads_profiles_changed_on_disk(self):
+        manifest = ProfileManifest(self.data_dir)
+        manifest.update("abc", "Household", self.file_path)
+
+        # Restored from a backup outside the app
+        with open(self.file_path, "wb") as file:
+            file.write(b"restored profile")
+        def load_entry(profile_id):
+            stat = os.stat(self.get_path(profile_id))
+            return ProfileEntry(profile_id, "Restored", stat.st_mtime, stat.st_size, 1)
+
+        manifest.sync(["abc"], load_entry, self.get_path)
+        self.assertEqual(manifest.get("abc").name, "Restored")
+        self.assertEqual(ProfileManifest(self.data_dir).get("abc").size, len(b"restored profile"))
+
+        # Unchanged files aren't read again
+        manifest.sync(["abc"], lambda profile_id: self.fail("reloaded an unchanged profile"), self.get_path)
+
+if __name__ == '__main__':
+    unittest.main()
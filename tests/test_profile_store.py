@@ -0,0 +1,89 @@
+import unittest
+import os
+import shutil
+import tempfile
+from src.modules.profile_store import JournaledProfileStore, PickleProfileStore, diff_records
+
+
+class TestJournaledProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.data_dir, "profile.dat")
+        self.profile = {
+            "profile_id": "profile",
+            "profile_name": "Default Profile",
+            "income": 5000.0,
+            "budget": {"names": ["Rent", "Gas"], "costs": [1200.0, 80.0]},
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_edits_are_appended_to_journal(self):
+        store = JournaledProfileStore()
+        store.save(self.file_path, self.profile)
+        snapshot_size = os.path.getsize(self.file_path)
+
+        self.profile["budget"]["costs"][1] = 95.5
+        store.save(self.file_path, self.profile)
+
+        # The snapshot is untouched and the change lands in the journal
+        self.assertEqual(os.path.getsize(self.file_path), snapshot_size)
+        self.assertTrue(os.path.exists(store.journal_path(self.file_path)))
+        self.assertEqual(PickleProfileStore().load(self.file_path)["budget"]["costs"][1], 80.0)
+
+    def test_load_replays_journal(self):
+        store = JournaledProfileStore()
+        store.save(self.file_path, self.profile)
+        self.profile["income"] = 6200.0
+        store.save(self.file_path, self.profile)
+        self.profile["budget"]["names"][0] = "Mortgage"
+        store.save(self.file_path, self.profile)
+
+        loaded = JournaledProfileStore().load(self.file_path)
+        self.assertEqual(loaded, self.profile)
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        store = JournaledProfileStore(compact_threshold=3)
+        store.save(self.file_path, self.profile)
+        for cost in (1.0, 2.0, 3.0):
+            self.profile["budget"]["costs"][0] = cost
+            store.save(self.file_path, self.profile)
+
+        self.assertFalse(os.path.exists(store.journal_path(self.file_path)))
+        self.assertEqual(PickleProfileStore().load(self.file_path), self.profile)
+
+    def test_truncated_record_is_ignored(self):
+        store = JournaledProfileStore()
+        store.save(self.file_path, self.profile)
+        self.profile["income"] = 6200.0
+        store.save(self.file_path, self.profile)
+
+        with open(store.journal_path(self.file_path), "ab") as file:
+            file.write(b"\x80\x04\x95")  # Partial record left by an interrupted write
+
+        loaded = JournaledProfileStore().load(self.file_path)
+        self.assertEqual(loaded["income"], 6200.0)
+
+    def test_saves_after_truncated_record_are_replayed(self):
+        store = JournaledProfileStore()
+        store.save(self.file_path, self.profile)
+        self.profile["income"] = 2.0
+        store.save(self.file_path, self.profile)
+        with open(store.journal_path(self.file_path), "ab") as file:
+            file.write(b"\x80\x04\x95")
+
+        store = JournaledProfileStore()
+        store.load(self.file_path)
+        self.profile["income"] = 3.0
+        store.save(self.file_path, self.profile)
+
+        self.assertEqual(JournaledProfileStore().load(self.file_path)["income"], 3.0)
+
+    def test_diff_only_reports_changed_paths(self):
+        changed = dict(self.profile, budget={"names": ["Rent", "Gas"], "costs": [1200.0, 95.5]})
+        self.assertEqual(list(diff_records(self.profile, changed)), [(("budget", "costs", 1), 95.5)])
+        self.assertEqual(list(diff_records(self.profile, dict(self.profile))), [])
+
+if __name__ == '__main__':
+    unittest.main()
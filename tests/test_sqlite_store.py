@@ -0,0 +1,109 @@
+import unittest
+import os
+import shutil
+import tempfile
+from datetime import date
+from src.constants import Transaction
+from src.modules.ledger import Ledger
+from src.modules import sqlite_store
+from src.modules.sqlite_store import SQLiteProfileStore
+
+
+class TestSQLiteProfileStore(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.store = SQLiteProfileStore(self.data_dir)
+        self.file_path = os.path.join(self.data_dir, "profile.dat")
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.data_dir)
+
+    def test_profile_round_trip(self):
+        profile = {"profile_id": "profile", "profile_name": "Household", "income": 5000.0}
+        self.store.save(self.file_path, profile)
+
+        self.assertEqual(self.store.load(self.file_path), profile)
+        self.assertEqual(self.store.list_profile_ids(self.data_dir), ["profile"])
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_ledger_range_queries(self):
+        ledger = self.store.open_ledger("profile", None)
+        ledger.add_transactions([
+            Transaction(date(2024, 12, 31), 10.00, "Gas", "Transportation"),
+            Transaction(date(2025, 1, 5), 42.10, "Groceries", "Food & Essentials"),
+            Transaction(date(2025, 1, 9), 7.90, "Groceries", "Food & Essentials"),
+        ])
+        # Other profiles don't leak into the results
+        self.store.open_ledger("other", None).add_transaction(Transaction(date(2025, 1, 1), 99.0, "Rent", "Housing & Utilities"))
+
+        self.assertEqual(len(ledger), 3)
+        self.assertEqual(ledger.get_monthly_totals(months=2, end=date(2025, 1, 1)), [10.0, 50.0])
+        self.assertEqual(ledger.get_category_totals(2025, 1), {"Food & Essentials": 50.0})
+        self.assertEqual(
+            [transaction.amount for transaction in ledger.iter_transactions(category="Food & Essentials")],
+            [42.10, 7.90]
+        )
+    def test_file_ledger_is_imported_once(self):
+        ledger_path = os.path.join(self.data_dir, "profile.ledger")
+        transactions = [
+            Transaction(date(2025, 1, 5), 42.10, "Groceries", "Food & Essentials"),
+            Transaction(date(2025, 2, 1), 15.00, "Gas", "Transportation"),
+        ]
+        Ledger(ledger_path).add_transactions(transactions)
+
+        ledger = self.store.open_ledger("profile", ledger_path)
+        self.assertEqual(list(ledger.iter_transactions()), transactions)
+        self.assertFalse(os.path.exists(ledger_path))
+
+        self.assertEqual(len(self.store.open_ledger("profile", ledger_path)), 2)
+
+    def test_interrupted_import_is_not_repeated(self):
+        ledger_path = os.path.join(self.data_dir, "profile.ledger")
+        transactions = [Transaction(date(2025, 1, day), float(day), "Groceries", "Food & Essentials") for day in range(1, 6)]
+        Ledger(ledger_path).add_transactions(transactions)
+
+        replace = sqlite_store.os.replace
+        def crash(*args):
+            raise OSError("crashed before the rename")
+        sqlite_store.os.replace = crash
+        try:
+            with self.assertRaises(OSError):
+                self.store.open_ledger("profile", ledger_path)
+        finally:
+            sqlite_store.os.replace = replace
+        self.assertTrue(os.path.exists(ledger_path))
+
+        ledger = self.store.open_ledger("profile", ledger_path)
+        self.assertEqual(list(ledger.iter_transactions()), transactions)
+        self.assertFalse(os.path.exists(ledger_path))
+
+    def test_import_spans_batches(self):
+        ledger_path = os.path.join(self.data_dir, "profile.ledger")
+        transactions = [Transaction(date(2025, 1, 1), float(cents), "Groceries", "Food & Essentials") for cents in range(25)]
+        Ledger(ledger_path).add_transactions(transactions)
+
+        batch_size = sqlite_store.IMPORT_BATCH_SIZE
+        sqlite_store.IMPORT_BATCH_SIZE = 10
+        try:
+            ledger = self.store.open_ledger("profile", ledger_path)
+        finally:
+            sqlite_store.IMPORT_BATCH_SIZE = batch_size
+        self.assertEqual(list(ledger.iter_transactions()), transactions)
+
+    def test_iter_transactions_matches_file_ledger(self):
+        transactions = [
+            Transaction(date(2025, 1, 5), 42.10, "Groceries", "Food & Essentials"),
+            Transaction(date(2025, 2, 1), 15.00, "Gas", "Transportation"),
+            Transaction(date(2025, 3, 1), 7.90, "Groceries", "Food & Essentials"),
+        ]
+        file_ledger = Ledger(os.path.join(self.data_dir, "other.ledger"))
+        sqlite_ledger = self.store.open_ledger("other", None)
+        for ledger in (file_ledger, sqlite_ledger):
+            ledger.add_transactions(transactions)
+
+        for arguments in ({}, {"start": date(2025, 2, 1)}, {"end": date(2025, 2, 1), "category": "Transportation"}):
+            self.assertEqual(list(sqlite_ledger.iter_transactions(**arguments)), list(file_ledger.iter_transactions(**arguments)))
+
+if __name__ == '__main__':
+    unittest.main()
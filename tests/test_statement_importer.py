@@ -0,0 +1,95 @@
+import unittest
+import os
+import shutil
+import tempfile
+from datetime import date
+import pandas as pd
+from src.constants import default_categories
+from src.modules.ledger import Ledger
+from src.modules.statement_importer import StatementImporter, parse_amount, parse_amounts
+
+
+class TestStatementImporter(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.statement_path = os.path.join(self.data_dir, "statement.csv")
+        self.ledger = Ledger(os.path.join(self.data_dir, "profile.ledger"))
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_parse_amount_with_varied_formats(self):
+        varied_formats = [
+            ('5300', 5300.00),  # No decimals
+            ('5300.123', 5300.12),  # Too many decimals (should round)
+            ('5300.', 5300.00),  # Not enough decimals
+            ('$5,300.00', 5300.00),  # With $ and ,
+            ('100000.00', 100000.00),  # Larger value
+            ('$100,000.50', 100000.50),  # Larger value with $ and ,
+            ('-$1,234.56', -1234.56),  # Bank debit
+            ('(12.50)', -12.50),  # Accounting negative
+        ]
+
+        for input_value, expected_output in varied_formats:
+            self.assertEqual(parse_amount(input_value), expected_output)
+            self.assertEqual(parse_amounts(pd.Series([input_value]))[0], expected_output)
+
+    def test_invalid_amount(self):
+        with self.assertRaises(ValueError):
+            parse_amount("1.2.3")
+
+    def test_import_streams_chunks_into_ledger(self):
+        pd.DataFrame({
+            'Date': ['2025-01-03', '2025-01-04', '2025-01-05', 'not a date', '2025-02-01'],
+            'Description': ['Groceries', 'Paycheck', 'SHELL OIL 1234', 'Broken row', 'Rent'],
+            'Amount': ['-$42.10', '$2,000.00', '-15.00', '-1.00', '-$1,200.00'],
+        }).to_csv(self.statement_path, index=False)
+
+        progress = []
+        importer = StatementImporter(self.ledger, default_categories, chunk_size=2, batch_size=1)
+        imported = importer.import_file(self.statement_path, on_progress=lambda rows, fraction: progress.append(rows))
+
+        # Credits and unreadable rows are skipped
+        self.assertEqual(imported, 3)
+        self.assertEqual(progress, [1, 2, 3])
+        self.assertEqual(self.ledger.get_category_totals(2025, 1), {
+            "Food & Essentials": 42.10,
+            "Uncategorized": 15.00,
+        })
+        self.assertEqual(self.ledger.get_monthly_totals(months=2, end=date(2025, 2, 1)), [57.10, 1200.00])
+
+    def test_positive_charges_are_detected(self):
+        pd.DataFrame({
+            'Date': ['2025-01-03', '2025-01-04', '2025-01-05'],
+            'Description': ['Groceries', 'Payment Thank You', 'Gas'],
+            'Amount': ['42.10', '-500.00', '15.00'],
+        }).to_csv(self.statement_path, index=False)
+
+        imported = StatementImporter(self.ledger, default_categories).import_file(self.statement_path)
+
+        # The card payment is a credit
+        self.assertEqual(imported, 2)
+        self.assertEqual(self.ledger.get_category_totals(2025, 1), {"Food & Essentials": 42.10, "Transportation": 15.00})
+
+    def test_statement_without_spending_is_rejected(self):
+        pd.DataFrame({
+            'Date': ['2025-01-03', '2025-01-04'],
+            'Description': ['Groceries', 'Gas'],
+            'Amount': ['42.10', '15.00'],
+        }).to_csv(self.statement_path, index=False)
+
+        with self.assertRaises(ValueError):
+            StatementImporter(self.ledger, expenses_negative=True).import_file(self.statement_path)
+        self.assertEqual(len(self.ledger), 0)
+
+    def test_invalid_columns(self):
+        pd.DataFrame({
+            'WrongColumn1': ['Income', 'Housing'],
+            'WrongColumn2': ['Monthly Income', 'Rent'],
+        }).to_csv(self.statement_path, index=False)
+
+        with self.assertRaises(ValueError):
+            StatementImporter(self.ledger).import_file(self.statement_path)
+
+if __name__ == '__main__':
+    unittest.main()
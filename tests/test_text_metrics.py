@@ -0,0 +1,42 @@
+import unittest
+from src.modules.text_metrics import TextMetrics
+
+
+class TestTextMetrics(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def measure(text, font_name, font_size, bold):
+            self.calls.append(text)
+            return (len(text) * (font_size // 2 + (1 if bold else 0)), font_size)  # 8px per character at size 16
+
+        self.metrics = TextMetrics(max_entries=100, measure=measure)
+
+    def test_measurements_are_cached_by_font(self):
+        self.assertEqual(self.metrics.get_text_size("Rent", "Roboto", 16), (32, 16))
+        self.assertEqual(self.metrics.get_text_size("Rent", "Roboto", 16), (32, 16))
+        self.assertEqual(self.metrics.get_text_width("Rent", "Roboto", 16, bold=True), 36)
+        self.assertEqual(self.calls, ["Rent", "Rent"])
+
+    def test_truncate(self):
+        self.assertEqual(self.metrics.truncate("Rent", 40, "Roboto", 16), "Rent")
+        self.assertEqual(self.metrics.truncate("Groceries", 48, "Roboto", 16), "Gro...")
+        self.assertEqual(self.metrics.truncate("Groceries", 10, "Roboto", 16), "...")
+
+        measured = len(self.calls)
+        self.assertEqual(self.metrics.truncate("Groceries", 48, "Roboto", 16), "Gro...")
+        self.assertEqual(len(self.calls), measured)  # A repeat is one lookup
+
+    def test_evicts_least_recently_used(self):
+        metrics = TextMetrics(max_entries=2, measure=lambda text, *args: (len(text), 1))
+        metrics.get_text_size("a", "Roboto", 16)
+        metrics.get_text_size("b", "Roboto", 16)
+        metrics.get_text_size("a", "Roboto", 16)
+        metrics.get_text_size("c", "Roboto", 16)
+        self.assertEqual(len(metrics), 2)
+        self.assertIn(("size", "a", "Roboto", 16, False), metrics.entries)
+        self.assertNotIn(("size", "b", "Roboto", 16, False), metrics.entries)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from src.modules.texture_cache import TextureCache, get_data_digest
+
+
+class TestTextureCache(unittest.TestCase):
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = TextureCache(max_bytes=100)
+        cache.put("a", "A", 40)
+        cache.put("b", "B", 40)
+        self.assertEqual(cache.get("a"), "A")  # "b" is now the least recently used
+
+        cache.put("c", "C", 40)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.total_bytes, 80)
+
+    def test_replacing_and_oversized_entries(self):
+        cache = TextureCache(max_bytes=100)
+        cache.put("a", "A", 40)
+        cache.put("a", "A2", 60)
+        self.assertEqual((cache.get("a"), cache.total_bytes, len(cache)), ("A2", 60, 1))
+
+        cache.put("huge", "H", 101)
+        self.assertIsNone(cache.get("huge"))
+        self.assertEqual(cache.get("a"), "A2")
+
+    def test_data_digest(self):
+        self.assertEqual(get_data_digest([1.0, 2.0], ["#fff"]), get_data_digest([1.0, 2.0], ["#fff"]))
+        self.assertNotEqual(get_data_digest([1.0, 2.0]), get_data_digest([2.0, 1.0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import copy
+import threading
+import unittest
+from src.modules.budget import Budget
+from src.modules.write_behind_saver import WriteBehindSaver
+
+
+class FakeTrigger:
+    def __init__(self, callback):
+        self.callback = callback
+        self.is_triggered = False
+
+    def __call__(self):
+        self.is_triggered = True
+
+    def cancel(self):
+        self.is_triggered = False
+
+
+class FakeClock:
+    """Runs the debounce trigger and main-thread callbacks only when the test ticks it."""
+    def __init__(self):
+        self.triggers = []
+        self.scheduled = []
+
+    def create_trigger(self, callback, timeout=0):
+        trigger = FakeTrigger(callback)
+        self.triggers.append(trigger)
+        return trigger
+
+    def schedule_once(self, callback, timeout=0):
+        self.scheduled.append(callback)
+
+    def tick(self):
+        for trigger in self.triggers:
+            if trigger.is_triggered:
+                trigger.is_triggered = False
+                trigger.callback(0)
+
+    def run_scheduled(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for callback in scheduled:
+            callback(0)
+
+
+class TestWriteBehindSaver(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.writes = []
+        self.saved = []
+        self.failed = []
+        self.saver = WriteBehindSaver(
+            lambda file_path, data: self.writes.append((file_path, data)),
+            on_saved=self.saved.append,
+            on_failed=lambda file_path, error: self.failed.append((file_path, str(error))),
+            clock=self.clock,
+        )
+
+    def tearDown(self):
+        self.saver.close()
+
+    def test_burst_is_coalesced_into_one_write(self):
+        for income in (1, 2, 3):
+            self.saver.schedule("a.dat", lambda income=income: {"income": income})
+        self.assertEqual(self.writes, [])  # Still inside the debounce window
+
+        self.clock.tick()
+        self.saver.flush()
+        self.assertEqual(self.writes, [("a.dat", {"income": 3})])
+
+        self.clock.run_scheduled()
+        self.assertEqual(self.saved, ["a.dat"])
+
+    def test_flush_writes_pending_saves_now(self):
+        self.saver.schedule("a.dat", lambda: {"income": 1})
+        self.saver.schedule("b.dat", lambda: {"income": 2})
+        self.saver.flush()
+
+        self.assertEqual(sorted(self.writes), [("a.dat", {"income": 1}), ("b.dat", {"income": 2})])
+        self.clock.tick()
+        self.saver.flush()
+        self.assertEqual(len(self.writes), 2)  # Nothing left to write
+
+    def test_failed_write_is_reported(self):
+        def fail(file_path, data):
+            raise OSError("disk full")
+        self.saver.write = fail
+
+        self.saver.schedule("a.dat", lambda: {"income": 1})
+        self.saver.flush()
+        self.clock.run_scheduled()
+
+        self.assertEqual(self.failed, [("a.dat", "disk full")])
+        self.assertEqual(self.saved, [])
+
+    def test_snapshot_is_isolated_from_later_edits(self):
+        started, edited = threading.Event(), threading.Event()
+        def write(file_path, data):
+            started.set()
+            edited.wait(5)  # The main thread keeps editing while this write is in flight
+            self.writes.append((file_path, copy.deepcopy(data)))
+        self.saver.write = write
+
+        budget = Budget(5000)
+        self.saver.schedule("a.dat", budget.to_dict)
+        self.clock.tick()  # Snapshot taken, write handed to the worker
+        started.wait(5)
+
+        budget.rename_category("Transportation", "Getting Around")
+        budget.set_cost(0, 1.0)
+        edited.set()
+        self.saver.flush()
+
+        data = self.writes[0][1]
+        self.assertIn("Transportation", [category.name for category in data["categories"]])
+        self.assertIn("Transportation", data["budget_weights"])
+        self.assertNotIn("Getting Around", data["budget_weights"])
+        self.assertNotEqual(data["costs"][0], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()